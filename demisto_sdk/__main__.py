@@ -25,6 +25,8 @@ from demisto_sdk.commands.generate_docs.generate_integration_doc import generate
 from demisto_sdk.commands.generate_docs.generate_script_doc import generate_script_doc
 from demisto_sdk.commands.generate_docs.generate_playbook_doc import generate_playbook_doc
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
+from demisto_sdk.commands.find_impacted_tests.impacted_tests_finder import find_impacted_tests, \
+    UNMAPPED_PATHS_EXIT_CODE
 
 # Common tools
 from demisto_sdk.commands.common.tools import print_error, print_warning, get_last_remote_release_version, find_type
@@ -189,6 +191,17 @@ def unify(**kwargs):
 @click.option(
     '-p', '--path', help='Path of file to validate specifically, outside of a git directory.'
 )
+@click.option(
+    '--jobs', type=click.IntRange(min=1), default=1, show_default=True,
+    help='The number of processes validating the files in parallel. The output is printed in the same order as in '
+         'a sequential run.')
+@click.option(
+    '--no-cache', is_flag=True, help='Validate all the files, also the ones which passed their validation and did '
+                                     'not change since.')
+@click.option(
+    '--profile', is_flag=True, help='Time the checks of the validation and print the ones which took the most time.')
+@click.option(
+    '--profile-output', help='The path of a JSON file to write the time of all the checks of the validation to.')
 @pass_config
 def validate(config, **kwargs):
     sys.path.append(config.configuration.env_dir)
@@ -203,7 +216,9 @@ def validate(config, **kwargs):
                                    is_backward_check=not kwargs['no_backward_comp'],
                                    is_circle=kwargs['post_commit'], prev_ver=kwargs['prev_ver'],
                                    validate_conf_json=kwargs['conf_json'], use_git=kwargs['use_git'],
-                                   file_path=kwargs.get('path'))
+                                   file_path=kwargs.get('path'), jobs=kwargs['jobs'],
+                                   use_cache=not kwargs['no_cache'], profile=kwargs['profile'],
+                                   profile_output=kwargs['profile_output'])
         return validator.run()
 
 
@@ -248,11 +263,20 @@ def create(**kwargs):
 @click.option(
     '-wl', '--whitelist', default='./Tests/secrets_white_list.json', show_default=True,
     help='Full path to whitelist file, file name should be "secrets_white_list.json"')
+@click.option(
+    '--jobs', type=click.IntRange(min=1), default=1, show_default=True,
+    help='The number of processes searching the files in parallel. The output is printed in the same order as in '
+         'a sequential run.')
+@click.option(
+    '--diff-only', is_flag=True,
+    help='Search only the lines added by the diff, honoring the disable-secrets-detection blocks around them. '
+         'New files are searched whole.')
 @pass_config
 def secrets(config, **kwargs):
     sys.path.append(config.configuration.env_dir)
     secrets = SecretsValidator(configuration=config.configuration, is_circle=kwargs['post_commit'],
-                               ignore_entropy=kwargs['ignore_entropy'], white_list_path=kwargs['whitelist'])
+                               ignore_entropy=kwargs['ignore_entropy'], white_list_path=kwargs['whitelist'],
+                               jobs=kwargs['jobs'], diff_only=kwargs['diff_only'])
     return secrets.run()
 
 
@@ -572,11 +596,73 @@ def generate_doc(**kwargs):
 )
 @click.option(
     "-o", "--output", help="Output file path, the default is the Tests directory.", required=False)
+@click.option(
+    "--incremental", is_flag=True,
+    help="Re-process only files that were added, changed or deleted since the last run, using the manifest kept "
+         "next to the output file.")
+@click.option(
+    "--processes", type=click.IntRange(min=1),
+    help="The number of worker processes used to process the content files, the default is twice the CPU count.")
+@click.option(
+    "--reverse-dependencies", is_flag=True,
+    help="Also create a reverse dependency index next to the output file, mapping scripts, playbooks, integrations "
+         "and commands to the content entities using them.")
+@click.option(
+    "--shard",
+    help="Create only the part i/N of the id set (0 <= i < N), the paths are split between the N shards by a hash "
+         "of the path. The partial id sets of all the shards are combined by the merge-id-set command.")
 def id_set_command(**kwargs):
-    id_set_creator = IDSetCreator(**kwargs)
+    try:
+        id_set_creator = IDSetCreator(**kwargs)
+    except ValueError as err:
+        print_error(str(err))
+        return 1
     id_set_creator.create_id_set()
 
 
+@main.command(name="merge-id-set",
+              short_help='''Merge the partial id sets created by the shards of create-id-set.''')
+@click.help_option(
+    '-h', '--help'
+)
+@click.option(
+    "-i", "--input", help="The path of a partial id set created by create-id-set --shard, all the shards are "
+                          "required.", required=True, multiple=True)
+@click.option(
+    "-o", "--output", help="Output file path.", default="./Tests/id_set.json", show_default=True)
+@click.option(
+    "--reverse-dependencies", is_flag=True,
+    help="Also create a reverse dependency index next to the output file.")
+def merge_id_set_command(**kwargs):
+    id_set_creator = IDSetCreator(output=kwargs['output'], reverse_dependencies=kwargs['reverse_dependencies'])
+    try:
+        id_set_creator.merge_id_set(kwargs['input'])
+    except ValueError as err:
+        print_error(str(err))
+        return 1
+
+
+@main.command(name="find-impacted-tests",
+              short_help='''Find the test playbooks impacted by the changes of the current branch.''')
+@click.help_option(
+    '-h', '--help'
+)
+@click.option(
+    "-i", "--id-set-path", help="The path of the id set file.", default="./Tests/id_set.json", show_default=True)
+@click.option(
+    "--prev-ver", help="The git revision to compare the current branch against.", default="origin/master",
+    show_default=True)
+@click.option(
+    "-c", "--changed-files", help="Comma separated paths of changed files, to use instead of the git diff.")
+@click.option(
+    "-o", "--output", help="A file to write the impacted test playbook ids to, one per line.")
+@click.option(
+    "-v", "--verbose", is_flag=True, help="Print the content entities impacted by the change.")
+def find_impacted_tests_command(**kwargs):
+    _, unmapped_paths = find_impacted_tests(**kwargs)
+    return UNMAPPED_PATHS_EXIT_CODE if unmapped_paths else 0
+
+
 @main.resultcallback()
 def exit_from_program(result=0, **kwargs):
     sys.exit(result)
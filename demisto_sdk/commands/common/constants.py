@@ -1,3 +1,4 @@
+import os
 import re
 from typing import List
 
@@ -888,6 +889,9 @@ CONTENT_GITHUB_LINK = r'https://raw.githubusercontent.com/demisto/content'
 CONTENT_GITHUB_MASTER_LINK = CONTENT_GITHUB_LINK + '/master'
 SDK_API_GITHUB_RELEASES = r'https://api.github.com/repos/demisto/demisto-sdk/releases'
 
+# the default directory of the on disk caches, can be changed by the DEMISTO_SDK_CACHE_DIR environment variable
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.demisto-sdk', 'cache')
+
 # Run all test signal
 RUN_ALL_TESTS_FORMAT = 'Run all tests'
 FILTER_CONF = './Tests/filter_file.txt'
@@ -0,0 +1,307 @@
+"""An inventory of the files of a content repository, built by a single scan of its content directories.
+
+Listing the content by os.walk and glob calls per directory stats the same trees again and again - validate -a,
+lint -a, create-id-set and create-content-artifacts each list the packs and the package directories several times.
+The inventory scans the content directories once by os.scandir, and answers those listings from memory.
+
+The inventory is kept on disk between runs, and revalidated once per process by the modification times of the
+scanned directories, which change whenever an entry is added to, removed from or renamed in them. Within a process it
+is trusted, the content directories are not expected to change during a run.
+
+Unlike os.walk, the inventory does not list hidden files and directories (names starting with a dot), as glob does.
+"""
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from demisto_sdk.commands.common.constants import DIR_LIST, PACKAGE_SUPPORTING_DIRECTORIES, PACKS_DIR, \
+    SCHEMA_TO_REGEX, TEST_PLAYBOOKS_DIR, TOOLS_DIR
+from demisto_sdk.commands.common.path_classifier import PathClassifier
+from demisto_sdk.commands.common.tools import get_cache_dir
+
+# the top level directories of a content repository which are scanned
+CONTENT_ROOT_DIRS = [PACKS_DIR, TEST_PLAYBOOKS_DIR, TOOLS_DIR] + DIR_LIST
+
+# a directory modified this close to the scan may be modified again without its modification time changing (the
+# resolution of the file system timestamps may be as coarse as 2 seconds), so the next process does not trust it and
+# scans again
+RACY_INTERVAL_NS = 2 * 10 ** 9
+
+FILE_TYPE_CLASSIFIER = PathClassifier.from_dict(SCHEMA_TO_REGEX)
+
+
+class InventoryEntry:
+    """A file or a directory of the inventory.
+
+    Attributes:
+        path (str): the path of the entry, relative to the root of the repository.
+        is_dir (bool): whether the entry is a directory.
+        pack (str): the name of the pack containing the entry, None if it is not a part of a pack.
+        package_dir (str): the integration or script package directory containing the entry (or the entry itself), None
+            if it is not a part of a package.
+    """
+    __slots__ = ('path', 'is_dir', 'pack', 'package_dir')
+
+    def __init__(self, path: str, is_dir: bool):
+        self.path = path
+        self.is_dir = is_dir
+        parts = path.split(os.sep)
+        self.pack = parts[1] if parts[0] == PACKS_DIR and len(parts) > 1 else None
+        # a package is a directory in Integrations, Scripts or Beta_Integrations, of the repository or of a pack
+        package_index = 3 if self.pack else 1
+        is_in_package = len(parts) > package_index + 1 or (len(parts) == package_index + 1 and is_dir)
+        if is_in_package and parts[package_index - 1] in PACKAGE_SUPPORTING_DIRECTORIES:
+            self.package_dir: Optional[str] = os.sep.join(parts[:package_index + 1])
+        else:
+            self.package_dir = None
+
+    @property
+    def file_type(self) -> Optional[str]:
+        """The scheme type of the file by its path (e.g. integration, playbook), None if it is not a content file"""
+        return None if self.is_dir else FILE_TYPE_CLASSIFIER.classify(self.path)
+
+
+class ContentInventory:
+    """The files and directories under the content directories of a repository.
+
+    Hidden files and directories are skipped, as glob does. Paths which are not under a content directory are listed
+    from the file system.
+
+    Attributes:
+        root (str): the absolute path of the repository.
+        children (dict): relative directory path -> the sorted names of its entries, '' is the repository itself.
+        dir_mtimes (dict): relative directory path -> its modification time (ns) when it was scanned.
+        entries (dict): relative path -> its InventoryEntry.
+        scan_time (int): the time (ns) the scan started at.
+    """
+    VERSION = 1
+
+    def __init__(self, root: str = os.curdir):
+        self.root = os.path.abspath(root)
+        self.children: Dict[str, List[str]] = {}
+        self.dir_mtimes: Dict[str, int] = {}
+        self.entries: Dict[str, InventoryEntry] = {}
+        self.scan_time = 0
+
+    def _get_full_path(self, relative_path: str) -> str:
+        return os.path.join(self.root, relative_path) if relative_path else self.root
+
+    def scan(self):
+        """Scan the content directories of the repository.
+
+        Hidden files and directories (names starting with a dot) are dropped, so they are not listed by walk as they
+        are by os.walk.
+        """
+        self.children = {}
+        self.dir_mtimes = {}
+        self.entries = {}
+        self.scan_time = time.time_ns()
+        directories = ['']
+        while directories:
+            directory = directories.pop()
+            try:
+                # stat before listing, so a change during the scan is detected by the next revalidation
+                self.dir_mtimes[directory] = os.stat(self._get_full_path(directory)).st_mtime_ns
+                with os.scandir(self._get_full_path(directory)) as dir_entries:
+                    names = {dir_entry.name: dir_entry.is_dir() for dir_entry in dir_entries
+                             if not dir_entry.name.startswith('.')}
+            except OSError:
+                # the directory was removed during the scan
+                self.dir_mtimes[directory] = -1
+                names = {}
+
+            if not directory:
+                names = {name: is_dir for name, is_dir in names.items() if is_dir and name in CONTENT_ROOT_DIRS}
+
+            self.children[directory] = sorted(names)
+            for name, is_dir in names.items():
+                path = os.path.join(directory, name) if directory else name
+                self.entries[path] = InventoryEntry(path, is_dir)
+                if is_dir:
+                    directories.append(path)
+
+    def is_up_to_date(self) -> bool:
+        """Check that no entry was added, removed or renamed in the scanned directories since the scan.
+
+        A directory modified within RACY_INTERVAL_NS of the scan fails the check, so a scan of a freshly written tree
+        is scanned again by the next process which loads it.
+        """
+        if not self.scan_time:
+            return False
+
+        racy_time = self.scan_time - RACY_INTERVAL_NS
+        for directory, mtime in self.dir_mtimes.items():
+            try:
+                current_mtime = os.stat(self._get_full_path(directory)).st_mtime_ns
+            except OSError:
+                return False
+            if current_mtime != mtime or current_mtime >= racy_time:
+                return False
+
+        return True
+
+    def _get_relative_path(self, path: str) -> Optional[str]:
+        """Get the path relative to the root, None in case it is not in the scanned directories"""
+        relative_path = os.path.relpath(os.path.abspath(path), self.root)
+        if relative_path == os.curdir:
+            return ''
+        if relative_path.split(os.sep)[0] not in CONTENT_ROOT_DIRS:
+            return None
+        return relative_path
+
+    def is_dir(self, relative_path: str) -> bool:
+        return relative_path in self.children
+
+    def get_entry(self, path: str) -> Optional[InventoryEntry]:
+        """Get the inventory entry of a path, None if it was not found"""
+        relative_path = self._get_relative_path(path)
+        return self.entries.get(relative_path) if relative_path else None
+
+    def glob(self, *parts: str, only_dirs: bool = False) -> List[str]:
+        """Get the paths matching a pattern, as glob.glob(os.path.join(*parts)) does.
+
+        Args:
+            parts: the components of the pattern, e.g. ('Packs', '*', 'Integrations', '*').
+            only_dirs: whether to match only directories.
+
+        Returns:
+            list. The matching paths, in the order of their names.
+        """
+        pattern = os.path.join(*parts)
+        components = pattern.split(os.sep)
+        magic_index = next((index for index, component in enumerate(components) if glob.has_magic(component)),
+                           len(components))
+        prefix = os.sep.join(components[:magic_index])
+        relative_prefix = self._get_relative_path(prefix) if prefix else None
+        if relative_prefix is None:
+            return [path for path in glob.glob(pattern) if not only_dirs or os.path.isdir(path)]
+
+        if relative_prefix not in self.entries and relative_prefix not in self.children:
+            return []
+
+        matches: List[Tuple[str, str]] = [(prefix, relative_prefix)]
+        for component in components[magic_index:]:
+            matches = [(os.path.join(path, name), os.path.join(relative_path, name) if relative_path else name)
+                       for path, relative_path in matches
+                       for name in fnmatch.filter(self.children.get(relative_path, []), component)]
+
+        return [path for path, relative_path in matches if not only_dirs or self.is_dir(relative_path)]
+
+    def walk(self, top: str) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """Walk a directory tree top down, as os.walk does - the yielded directory names may be pruned.
+
+        Unlike os.walk, hidden files and directories are not yielded under the content directories.
+        """
+        relative_top = self._get_relative_path(top)
+        if relative_top is None:
+            yield from os.walk(top)
+            return
+
+        if not self.is_dir(relative_top):
+            return
+
+        directories = [(top, relative_top)]
+        while directories:
+            path, relative_path = directories.pop()
+            dir_names: List[str] = []
+            file_names: List[str] = []
+            for name in self.children[relative_path]:
+                is_dir = self.is_dir(os.path.join(relative_path, name) if relative_path else name)
+                (dir_names if is_dir else file_names).append(name)
+
+            yield path, dir_names, file_names
+            directories.extend((os.path.join(path, name), os.path.join(relative_path, name) if relative_path else name)
+                               for name in reversed(dir_names))
+
+    def get_yml_paths_in_dir(self, project_dir: str, error_msg: str) -> Tuple[list, str]:
+        """Get the yml files of a directory and the first of them, as tools.get_yml_paths_in_dir does"""
+        yml_files = self.glob(project_dir, '*.yml')
+        if not yml_files:
+            if error_msg:
+                print(error_msg)
+            return [], ''
+        return yml_files, yml_files[0]
+
+    def to_dict(self) -> dict:
+        return {'version': self.VERSION, 'root': self.root, 'scan_time': self.scan_time, 'children': self.children,
+                'dir_mtimes': self.dir_mtimes}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ContentInventory':
+        inventory = cls(data['root'])
+        inventory.scan_time = data['scan_time']
+        inventory.children = data['children']
+        inventory.dir_mtimes = data['dir_mtimes']
+        for directory, names in inventory.children.items():
+            for name in names:
+                path = os.path.join(directory, name) if directory else name
+                inventory.entries[path] = InventoryEntry(path, path in inventory.children)
+        return inventory
+
+    def save(self, inventory_path: str):
+        # write to a temporary file and rename it, so concurrent runs never read a partially written file
+        temp_path = f'{inventory_path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'w') as inventory_file:
+                json.dump(self.to_dict(), inventory_file)
+            os.replace(temp_path, inventory_path)
+        except OSError:
+            # keeping the inventory is an optimization only
+            pass
+
+    @classmethod
+    def load(cls, inventory_path: str, root: str = os.curdir) -> Optional['ContentInventory']:
+        """Load a saved inventory of the repository, None if there is no valid one"""
+        try:
+            with open(inventory_path, 'r') as inventory_file:
+                data = json.load(inventory_file)
+            if data.get('version') != cls.VERSION or data.get('root') != os.path.abspath(root):
+                return None
+            return cls.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+
+def get_inventory_cache_path(root: str) -> str:
+    """Get the path of the saved inventory of a repository, under the on disk cache directory"""
+    root_hash = hashlib.sha1(os.path.abspath(root).encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_dir('inventory'), f'{root_hash}.json')
+
+
+# absolute root path -> the inventory of the repository
+_inventories: Dict[str, ContentInventory] = {}
+
+
+def get_content_inventory(root: str = os.curdir, persist: bool = True) -> ContentInventory:
+    """Get the inventory of a content repository, scanning it again only if one of its directories was changed.
+
+    The inventory is revalidated once per process - the first call loads it from disk and checks it, or scans the
+    repository, and the later calls return the same inventory without checking it again.
+
+    Args:
+        root: the path of the repository.
+        persist: whether to keep the inventory on disk between runs.
+
+    Returns:
+        ContentInventory. The inventory of the repository, up to date as of the first call of the process.
+    """
+    abs_root = os.path.abspath(root)
+    inventory = _inventories.get(abs_root)
+    if inventory is not None:
+        return inventory
+
+    if persist:
+        inventory = ContentInventory.load(get_inventory_cache_path(abs_root), abs_root)
+
+    if inventory is None or not inventory.is_up_to_date():
+        inventory = ContentInventory(abs_root)
+        inventory.scan()
+        if persist:
+            inventory.save(get_inventory_cache_path(abs_root))
+
+    _inventories[abs_root] = inventory
+    return inventory
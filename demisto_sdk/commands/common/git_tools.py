@@ -1,25 +1,159 @@
+import json
+import os
 import re
-from typing import Callable, List
+import subprocess
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
-from demisto_sdk.commands.common.tools import run_command
+from demisto_sdk.commands.common.tools import get_remote_file, get_remote_files, print_warning, run_command, \
+    yaml_safe_load
+
+
+class GitContext:
+    """The git state of the repository of the current directory - the current branch, merge bases, changed files and
+    diffs, computed lazily and memoized for the rest of the process.
+
+    Every git query runs at most once per process, and the diffs of single paths against a revision are all taken out
+    of a single `git diff` of the whole tree. Commands which change the working tree or the refs should call clear.
+    """
+
+    DIFF_HEADER_PREFIX = 'diff --git a/'
+    # the range of the new version of the file in a hunk header, e.g. '@@ -10,2 +10,3 @@', the count defaults to 1
+    HUNK_HEADER_REGEX = re.compile(r'@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+    def __init__(self, cwd: str = None):
+        self.cwd = cwd
+        self._outputs: Dict[str, str] = {}
+        self._path_diffs: Dict[Tuple[str, Optional[int]], Tuple[Dict[str, str], bool]] = {}
+
+    def clear(self):
+        self._outputs.clear()
+        self._path_diffs.clear()
+
+    def run_git(self, command: str) -> str:
+        """Run a git command, memoized by the command, e.g. run_git('diff --name-status HEAD')"""
+        if command not in self._outputs:
+            self._outputs[command] = run_command(f'git {command}', cwd=self.cwd)
+        return self._outputs[command]
+
+    def get_current_branch(self) -> str:
+        return self.run_git('rev-parse --abbrev-ref HEAD').strip()
+
+    def get_merge_base(self, revision: str, other_revision: str = 'HEAD') -> str:
+        return self.run_git(f'merge-base {revision} {other_revision}').strip()
+
+    def is_in_merge(self) -> bool:
+        """Whether a merge is in progress, i.e. MERGE_HEAD exists"""
+        return bool(self.run_git('rev-parse -q --verify MERGE_HEAD'))
+
+    def get_name_status(self, *revisions: str, no_merges: bool = False) -> str:
+        """Get the `git diff --name-status` output of the revisions, e.g. get_name_status('origin/master...HEAD')"""
+        options = '--name-status --no-merges' if no_merges else '--name-status'
+        return self.run_git(' '.join(('diff', options) + revisions))
+
+    def get_name_only(self, *revisions: str, relative: bool = False) -> List[str]:
+        """Get the paths changed by `git diff` of the revisions, relative to the current directory if relative"""
+        options = '--name-only --relative' if relative else '--name-only'
+        output = self.run_git(' '.join(('diff', options) + revisions))
+        return [path for path in output.split('\n') if path]
+
+    def _get_tree_diff(self, revision: str, unified: Optional[int]) -> Tuple[Dict[str, str], bool]:
+        """Get the diffs of all the paths of the working tree against a revision, from a single `git diff`.
+
+        Returns:
+            tuple. The path -> diff of the changed paths, relative to the current directory, and whether all the paths
+                of the diff were parsed (paths which git quotes are not).
+        """
+        key = (revision, unified)
+        if key not in self._path_diffs:
+            # with no renames, the diff of each path is exactly the `git diff <revision> <path>` output of the path
+            options = ['--no-renames', '--relative'] + ([f'--unified={unified}'] if unified is not None else [])
+            # warnings on stderr, e.g. about line endings of a path, do not fail the whole tree diff as run_git would
+            process = subprocess.run(['git', 'diff'] + options + [revision], stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE, universal_newlines=True, cwd=self.cwd)
+            path_diffs: Dict[str, List[str]] = {}
+            # in case git failed, e.g. on an unknown revision, each path falls back to its own `git diff`
+            is_complete = process.returncode == 0
+            current_lines: List[str] = []
+            for line in (process.stdout if is_complete else '').splitlines(keepends=True):
+                if line.startswith('diff --git '):
+                    current_lines = []
+                    header = line[len(self.DIFF_HEADER_PREFIX):].rstrip('\n')
+                    # the header is 'diff --git a/<path> b/<path>', both paths are the same without renames
+                    path = header[:(len(header) - len(' b/')) // 2]
+                    if line.startswith(self.DIFF_HEADER_PREFIX) and header == f'{path} b/{path}':
+                        path_diffs[path] = current_lines
+                    else:
+                        is_complete = False
+                current_lines.append(line)
+
+            self._path_diffs[key] = ({path: ''.join(lines) for path, lines in path_diffs.items()}, is_complete)
+
+        return self._path_diffs[key]
+
+    def get_path_diff(self, path: str, revision: str = 'origin/master', unified: Optional[int] = None) -> str:
+        """Get the `git diff [--unified=<unified>] <revision> <path>` output of a single file.
+
+        Returns:
+            str. The diff of the file, an empty string in case it was not changed.
+        """
+        relative_path = os.path.relpath(path).replace('\\', '/')
+        if relative_path.startswith('..'):
+            # outside of the current directory, so it is not a part of the tree diff
+            unified_option = f' --unified={unified}' if unified is not None else ''
+            return self.run_git(f'diff{unified_option} {revision} {path}')
+
+        path_diffs, is_complete = self._get_tree_diff(revision, unified)
+        if relative_path in path_diffs or is_complete:
+            return path_diffs.get(relative_path, '')
+
+        unified_option = f' --unified={unified}' if unified is not None else ''
+        return self.run_git(f'diff{unified_option} {revision} {path}')
+
+    def get_path_added_lines(self, path: str, revision: str = 'origin/master') -> Optional[Set[int]]:
+        """Get the lines of a file added or changed since a revision, from its `git diff --unified=0 <revision>`.
+
+        Returns:
+            set. The 1 based numbers of the lines in the current version of the file, None in case the whole file was
+                added since the revision.
+        """
+        added_lines: Set[int] = set()
+        is_header = True
+        for line in self.get_path_diff(path, revision, unified=0).splitlines():
+            if is_header and line == '--- /dev/null':
+                return None
+            match = self.HUNK_HEADER_REGEX.match(line)
+            if match:
+                is_header = False
+                start = int(match.group(1))
+                count = int(match.group(2)) if match.group(2) is not None else 1
+                added_lines.update(range(start, start + count))
+
+        return added_lines
+
+
+# working directory -> the git context of the process in the directory, created on first use
+_git_contexts: Dict[str, GitContext] = {}
+
+
+def get_git_context() -> GitContext:
+    """Get the process wide git context of the current directory, shared by all the commands and validators"""
+    cwd = os.getcwd()
+    if cwd not in _git_contexts:
+        _git_contexts[cwd] = GitContext(cwd=cwd)
+    return _git_contexts[cwd]
 
 
 def git_path() -> str:
-    git_path = run_command('git rev-parse --show-toplevel')
+    git_path = get_git_context().run_git('rev-parse --show-toplevel')
     return git_path.replace('\n', '')
 
 
 def get_current_working_branch() -> str:
-    branches = run_command('git branch')
-    branch_name_reg = re.search(r'\* (.*)', branches)
-    if branch_name_reg:
-        return branch_name_reg.group(1)
-
-    return ''
+    return get_git_context().get_current_branch()
 
 
 def get_changed_files(from_branch: str = 'master', filter_results: Callable = None):
-    temp_files = run_command(f'git diff --name-status {from_branch}').split('\n')
+    temp_files = get_git_context().get_name_status(from_branch).split('\n')
     files: List = []
     for file in temp_files:
         if file:
@@ -37,3 +171,175 @@ def get_changed_files(from_branch: str = 'master', filter_results: Callable = No
         filter(filter_results, files)
 
     return files
+
+
+class GitCatFile:
+    """A long-lived `git cat-file --batch` process, reading any number of git objects through a single process.
+
+    Usage:
+        with GitCatFile() as cat_file:
+            content = cat_file.get_blob('HEAD', 'Scripts/script-Sleep.yml')
+    """
+
+    def __init__(self, cwd: str = None):
+        self.process = subprocess.Popen(['git', 'cat-file', '--batch'], stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=cwd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+        self.process.stdout.close()
+
+    def get_object(self, object_name: str) -> Optional[Tuple[str, bytes]]:
+        """Get a git object, e.g. HEAD:Scripts/script-Sleep.yml
+
+        Returns:
+            tuple. The (type, content) of the object, None in case the object does not exist.
+        """
+        self.process.stdin.write(object_name.encode('utf-8') + b'\n')
+        self.process.stdin.flush()
+        header = self.process.stdout.readline().decode('utf-8').rstrip('\n')
+        if not header or header.endswith((' missing', ' ambiguous')):
+            return None
+
+        _, object_type, size = header.rsplit(' ', 2)
+        content = self.process.stdout.read(int(size))
+        self.process.stdout.read(1)  # the object content is followed by a newline
+        return object_type, content
+
+    def get_blob(self, revision: str, path: str) -> Optional[bytes]:
+        """Get the content of a file in a revision, None in case the file does not exist in the revision"""
+        git_object = self.get_object(f'{revision}:{path}')
+        if git_object and git_object[0] == 'blob':
+            return git_object[1]
+        return None
+
+    def get_tree_entries(self, revision: str, path: str) -> List[str]:
+        """Get the names of the entries of a directory in a revision, an empty list if it does not exist"""
+        git_object = self.get_object(f'{revision}:{path.rstrip("/")}')
+        if not git_object or git_object[0] != 'tree':
+            return []
+
+        # a tree is a list of '<mode> <name>\0<20 bytes sha1>' entries
+        entries = []
+        content = git_object[1]
+        position = 0
+        while position < len(content):
+            name_start = content.index(b' ', position) + 1
+            name_end = content.index(b'\0', name_start)
+            entries.append(content[name_start:name_end].decode('utf-8'))
+            position = name_end + 21
+        return entries
+
+
+class RemoteFilesReader:
+    """Reads files of a remote branch or tag, e.g. the old versions of the modified files for the backward
+    compatibility checks.
+
+    The files are read from the local repository, from the remote tracking branch (origin/<tag>) or from the tag itself,
+    through a single GitCatFile process. They are downloaded from GitHub only when the revision is not available
+    locally, e.g. when running outside of a content repository clone. Every file is read once.
+
+    Attributes:
+        tag (str): the branch or tag to read the files from, with or without the origin/ prefix.
+        cwd (str): the directory of the local repository, the current directory by default.
+    """
+
+    def __init__(self, tag: str = 'master', cwd: str = None):
+        self.tag = tag
+        self.cwd = cwd
+        self._files: Dict[str, dict] = {}
+        self._cat_file: Optional[GitCatFile] = None
+        self._cat_file_pid: Optional[int] = None
+        self._revision: Optional[str] = None
+        self._is_revision_resolved = False
+
+    def _get_cat_file(self) -> GitCatFile:
+        # a forked process must not share the pipes of its parent process, so each process starts its own
+        if self._cat_file is None or self._cat_file_pid != os.getpid():
+            self._cat_file = GitCatFile(cwd=self.cwd)
+            self._cat_file_pid = os.getpid()
+        return self._cat_file
+
+    def close(self):
+        if self._cat_file is not None and self._cat_file_pid == os.getpid():
+            self._cat_file.close()
+        self._cat_file = None
+
+    def get_local_revision(self) -> Optional[str]:
+        """Get the local revision of the tag, None in case it is not available locally"""
+        if not self._is_revision_resolved:
+            self._is_revision_resolved = True
+            name = self.tag[len('origin/'):] if self.tag.startswith('origin/') else self.tag
+            for revision in (f'origin/{name}', name):
+                try:
+                    git_object = self._get_cat_file().get_object(f'{revision}^{{commit}}')
+                except OSError:
+                    # not a git repository, or git is not installed
+                    break
+                if git_object:
+                    self._revision = revision
+                    break
+
+        return self._revision
+
+    def _read_file(self, file_path: str) -> dict:
+        revision = self.get_local_revision()
+        if not revision:
+            return get_remote_file(file_path, self.tag)
+
+        content = self._get_cat_file().get_blob(revision, file_path)
+        if content is None:
+            print_warning('Could not find the old entity file "{}" in {}.\n'
+                          'please make sure that you did not break backward compatibility.'.format(file_path, revision))
+            return {}
+
+        if file_path.endswith('json'):
+            return json.loads(content)
+        return yaml_safe_load(content)
+
+    def read_files(self, file_paths: Iterable[str]):
+        """Read a batch of files up front, so later calls to get_file return them without any git or HTTP access.
+
+        When the files are downloaded from GitHub, they are downloaded concurrently.
+        """
+        file_paths = [file_path.replace('\\', '/') for file_path in file_paths]
+        file_paths = [file_path for file_path in file_paths if file_path not in self._files]
+        if self.get_local_revision():
+            for file_path in file_paths:
+                self.get_file(file_path)
+        else:
+            self._files.update(get_remote_files(file_paths, self.tag))
+
+    def get_file(self, file_path: str) -> dict:
+        """Get the loaded content of a file in the tag.
+
+        Returns:
+            dict. The loaded yml or json file, an empty dict in case the file does not exist in the tag.
+        """
+        file_path = file_path.replace('\\', '/')
+        if file_path not in self._files:
+            self._files[file_path] = self._read_file(file_path)
+        return self._files[file_path]
+
+
+# tag -> the reader of the files of the tag, shared by all the validations of a run
+_remote_files_readers: Dict[str, RemoteFilesReader] = {}
+
+
+def get_remote_files_reader(tag: str = 'master') -> RemoteFilesReader:
+    if tag not in _remote_files_readers:
+        _remote_files_readers[tag] = RemoteFilesReader(tag)
+    return _remote_files_readers[tag]
+
+
+def get_old_file(file_path: str, tag: str = 'master') -> dict:
+    """Get the version of a file in a remote branch or tag, read from the local repository when possible"""
+    return get_remote_files_reader(tag).get_file(file_path)
@@ -3,9 +3,10 @@ import re
 from abc import abstractmethod
 
 from demisto_sdk.commands.common.constants import Errors
+from demisto_sdk.commands.common.git_tools import get_git_context
 from demisto_sdk.commands.common.hook_validations.structure import StructureValidator
 from demisto_sdk.commands.common.tools import print_error, get_release_notes_file_path, \
-    get_latest_release_notes_text, run_command
+    get_latest_release_notes_text
 from demisto_sdk.commands.common.constants import ID_IN_COMMONFIELDS, ID_IN_ROOT
 
 
@@ -73,7 +74,7 @@ class BaseValidator:
         Returns:
             (bool): is release branch
         """
-        diff_string_config_yml = run_command("git diff origin/master .circleci/config.yml")
+        diff_string_config_yml = get_git_context().get_path_diff('.circleci/config.yml', 'origin/master')
         if re.search(r'[+-][ ]+CONTENT_VERSION: ".*', diff_string_config_yml):
             return True
         return False
@@ -1,9 +1,16 @@
 from demisto_sdk.commands.common.constants import Errors
-from demisto_sdk.commands.common.tools import get_yaml, print_error, print_warning
+from demisto_sdk.commands.common.tools import get_yaml, print_error, print_warning, get_cache_dir, get_http_session
 from distutils.version import LooseVersion
 from pkg_resources import parse_version
 from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import hashlib
+import json
+import os
 import re
+import threading
+import time
 import requests
 
 
@@ -19,6 +26,13 @@ ACCEPT_HEADER = {
 # use 10 seconds timeout for requests
 TIMEOUT = 10
 DEFAULT_REGISTRY = 'registry-1.docker.io'
+DOCKER_HUB_URL = 'https://hub.docker.com'
+
+# the number of docker images whose tags are resolved concurrently
+DOCKER_TAGS_MAX_WORKERS = 8
+# the default number of seconds a resolved tag is kept on disk, can be changed by the DEMISTO_SDK_DOCKER_TAGS_TTL
+# environment variable (0 disables the on disk cache)
+DEFAULT_DOCKER_TAGS_TTL = 3600
 
 
 class DockerImageValidator(object):
@@ -33,8 +47,18 @@ class DockerImageValidator(object):
         self.from_version = self.yml_file.get('fromversion', '0')
         self.docker_image_name, self.docker_image_tag = DockerImageValidator.parse_docker_image(self.yml_docker_image)
         self.is_latest_tag = True
-        self.docker_image_latest_tag = DockerImageValidator.get_docker_image_latest_tag(self.docker_image_name,
-                                                                                        self.yml_docker_image)
+
+    @property
+    def docker_image_latest_tag(self):
+        """The latest tag of the docker image, resolved on first use"""
+        if getattr(self, '_docker_image_latest_tag', None) is None:
+            self._docker_image_latest_tag = DockerImageValidator.get_docker_image_latest_tag(self.docker_image_name,
+                                                                                             self.yml_docker_image)
+        return self._docker_image_latest_tag
+
+    @docker_image_latest_tag.setter
+    def docker_image_latest_tag(self, tag):
+        self._docker_image_latest_tag = tag
 
     def is_docker_image_valid(self):
         if not self.docker_image_latest_tag:
@@ -97,8 +121,10 @@ class DockerImageValidator(object):
         """
         Authenticate to the docker service. Return an authentication token if authentication is required.
         """
-        res = requests.get(
-            'https://{}/v2/'.format(registry),
+        registry_url = registry if '://' in registry else 'https://{}'.format(registry)
+        session = get_http_session()
+        res = session.get(
+            '{}/v2/'.format(registry_url),
             headers=ACCEPT_HEADER,
             timeout=TIMEOUT,
             verify=verify_ssl
@@ -117,7 +143,7 @@ class DockerImageValidator(object):
                 'scope': 'repository:{}:pull'.format(image_name),
                 'service': service
             }
-            res = requests.get(
+            res = session.get(
                 url=realm,
                 params=params,
                 headers=ACCEPT_HEADER,
@@ -204,46 +230,63 @@ class DockerImageValidator(object):
             elif not yml_docker_image.startswith('demisto/'):
                 print_error('docker image must be a demisto docker image. e.g: demisto/python:<tag>')
                 return ''
-        try:
-            tag = ''
-            auth_token = DockerImageValidator.docker_auth(docker_image_name, False, DEFAULT_REGISTRY)
-            headers = ACCEPT_HEADER.copy()
-            if auth_token:
-                headers['Authorization'] = 'Bearer {}'.format(auth_token)
 
-            # first try to get the docker image tags using normal http request
-            res = requests.get(
-                url='https://hub.docker.com/v2/repositories/{}/tags'.format(docker_image_name),
-                verify=False,
-                timeout=TIMEOUT,
-            )
-            if res.status_code == 200:
-                tags = res.json().get('results', [])
-                # if http request successful find the latest tag by date in the response
-                if tags:
-                    tag = DockerImageValidator.find_latest_tag_by_date(tags)
-
-            else:
-                # if http request did not succeed than get tags using the API.
-                # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
-                res = requests.get(
-                    'https://{}/v2/{}/tags/list'.format(DEFAULT_REGISTRY, docker_image_name),
-                    headers=headers,
-                    timeout=TIMEOUT,
-                    verify=False
-                )
-                res.raise_for_status()
-                # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
-                tags = res.json().get('tags', [])
-                if tags:
-                    tag = DockerImageValidator.lexical_find_latest_tag(tags)
-            return tag
-        except (requests.exceptions.RequestException, Exception):
+        yml_tag = yml_docker_image.split(':')[-1] if yml_docker_image and ':' in yml_docker_image else None
+        tag = get_docker_tag_resolver().get_latest_tag(docker_image_name, expected_tag=yml_tag)
+        if tag is None:
             if not docker_image_name:
                 docker_image_name = yml_docker_image
             print_error('Failed getting tag for: {}. Please check it exists and of demisto format.'
                         .format(docker_image_name))
             return ''
+        return tag
+
+    @staticmethod
+    def fetch_docker_image_latest_tag(docker_image_name, registry=DEFAULT_REGISTRY, hub_url=DOCKER_HUB_URL):
+        """Fetch the latest tag of a docker image from docker hub, or from the registry API if docker hub fails
+
+        Args:
+            docker_image_name: The name of the docker image
+            registry: The docker registry, by its host or its url
+            hub_url: The url of docker hub
+
+        Returns:
+            The last updated docker image tag, an empty string if the image has no tags
+        """
+        tag = ''
+        session = get_http_session()
+        # first try to get the docker image tags using normal http request
+        res = session.get(
+            url='{}/v2/repositories/{}/tags'.format(hub_url, docker_image_name),
+            verify=False,
+            timeout=TIMEOUT,
+        )
+        if res.status_code == 200:
+            tags = res.json().get('results', [])
+            # if http request successful find the latest tag by date in the response
+            if tags:
+                tag = DockerImageValidator.find_latest_tag_by_date(tags)
+
+        else:
+            # if http request did not succeed than get tags using the API, which requires authentication.
+            # See: https://docs.docker.com/registry/spec/api/#listing-image-tags
+            auth_token = DockerImageValidator.docker_auth(docker_image_name, False, registry)
+            headers = ACCEPT_HEADER.copy()
+            if auth_token:
+                headers['Authorization'] = 'Bearer {}'.format(auth_token)
+            registry_url = registry if '://' in registry else 'https://{}'.format(registry)
+            res = session.get(
+                '{}/v2/{}/tags/list'.format(registry_url, docker_image_name),
+                headers=headers,
+                timeout=TIMEOUT,
+                verify=False
+            )
+            res.raise_for_status()
+            # the API returns tags in lexical order with no date info - so try an get the numeric highest tag
+            tags = res.json().get('tags', [])
+            if tags:
+                tag = DockerImageValidator.lexical_find_latest_tag(tags)
+        return tag
 
     @staticmethod
     def parse_docker_image(docker_image):
@@ -277,3 +320,130 @@ class DockerImageValidator(object):
         else:
             # If the yml file has no docker image we provide the default one 'demisto/python:1.3-alpine'
             return 'demisto/python', '1.3-alpine'
+
+
+def get_docker_tags_ttl() -> int:
+    try:
+        return int(os.environ.get('DEMISTO_SDK_DOCKER_TAGS_TTL', DEFAULT_DOCKER_TAGS_TTL))
+    except ValueError:
+        return DEFAULT_DOCKER_TAGS_TTL
+
+
+class DockerTagResolver:
+    """Resolves the latest tags of docker images, each image once per run.
+
+    Lookups of an image which is being resolved wait for its single resolution, instead of sending their own requests,
+    and distinct images are resolved concurrently by get_latest_tags. Resolved tags are kept on disk for ttl seconds.
+    A tag read from the disk is trusted only if it is the expected one - otherwise the registry is asked again, so a
+    newly released tag is never reported as outdated.
+
+    Attributes:
+        cache_dir (str): The directory of the resolved tags, None to keep them in memory only.
+        ttl (int): The number of seconds a tag kept on disk is valid for.
+        registry (str): The docker registry, by its host or its url.
+        hub_url (str): The url of docker hub.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: int = DEFAULT_DOCKER_TAGS_TTL,
+                 registry: str = DEFAULT_REGISTRY, hub_url: str = DOCKER_HUB_URL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.registry = registry
+        self.hub_url = hub_url
+        self._lock = threading.Lock()
+        self._futures: Dict[tuple, Future] = {}
+
+    def _get_cache_path(self, image_name: str) -> str:
+        return os.path.join(self.cache_dir, '{}.json'.format(hashlib.sha1(image_name.encode('utf-8')).hexdigest()))
+
+    def _read_cache(self, image_name: str) -> Optional[str]:
+        if not self.cache_dir or self.ttl <= 0:
+            return None
+        try:
+            with open(self._get_cache_path(image_name), 'r') as cache_file:
+                data = json.load(cache_file)
+            if data['image'] == image_name and time.time() - data['time'] < self.ttl:
+                return data['tag']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+
+    def _write_cache(self, image_name: str, tag: str):
+        if not self.cache_dir or self.ttl <= 0:
+            return
+        cache_path = self._get_cache_path(image_name)
+        # write to a temporary file and rename it, so concurrent runs never read a partially written file
+        temp_path = '{}.{}.{}.tmp'.format(cache_path, os.getpid(), threading.get_ident())
+        try:
+            with open(temp_path, 'w') as cache_file:
+                json.dump({'image': image_name, 'tag': tag, 'time': time.time()}, cache_file)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # the cache is an optimization only
+            pass
+
+    def _coalesce(self, key: tuple, resolve: Callable[[], Tuple[Optional[str], bool]]) -> Tuple[Optional[str], bool]:
+        """Run the resolution of a key once, every other lookup of the key waits for its result"""
+        with self._lock:
+            future = self._futures.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = self._futures[key] = Future()
+
+        if is_owner:
+            try:
+                future.set_result(resolve())
+            except BaseException as exc:
+                future.set_exception(exc)
+                raise
+        return future.result()
+
+    def _fetch(self, image_name: str) -> Tuple[Optional[str], bool]:
+        try:
+            tag = DockerImageValidator.fetch_docker_image_latest_tag(image_name, self.registry, self.hub_url)
+        except Exception:
+            return None, False
+        if tag:
+            self._write_cache(image_name, tag)
+        return tag, False
+
+    def _resolve(self, image_name: str) -> Tuple[Optional[str], bool]:
+        tag = self._read_cache(image_name)
+        if tag is not None:
+            return tag, True
+        return self._fetch(image_name)
+
+    def get_latest_tag(self, image_name: str, expected_tag: Optional[str] = None) -> Optional[str]:
+        """Get the latest tag of a docker image.
+
+        Args:
+            image_name: The name of the docker image, e.g. demisto/python3.
+            expected_tag: The tag the image is used with, a different tag kept on disk is checked against the registry.
+
+        Returns:
+            The latest tag, an empty string if the image has no tags, None if the tags could not be fetched.
+        """
+        tag, is_from_disk = self._coalesce((image_name,), lambda: self._resolve(image_name))
+        if is_from_disk and expected_tag and tag != expected_tag:
+            tag, _ = self._coalesce((image_name, 'fetch'), lambda: self._fetch(image_name))
+        return tag
+
+    def get_latest_tags(self, image_names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Get the latest tags of docker images, resolving the distinct images concurrently"""
+        image_names = list(dict.fromkeys(image_names))
+        if not image_names:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(DOCKER_TAGS_MAX_WORKERS, len(image_names))) as executor:
+            return dict(zip(image_names, executor.map(self.get_latest_tag, image_names)))
+
+
+# pid -> the docker tag resolver of the process, a forked process does not wait for resolutions of its parent
+_docker_tag_resolvers: Dict[int, DockerTagResolver] = {}
+
+
+def get_docker_tag_resolver() -> DockerTagResolver:
+    """Get the shared docker tag resolver of the process, keeping the resolved tags under the on disk cache"""
+    pid = os.getpid()
+    if pid not in _docker_tag_resolvers:
+        _docker_tag_resolvers[pid] = DockerTagResolver(get_cache_dir('docker_tags'), ttl=get_docker_tags_ttl())
+    return _docker_tag_resolvers[pid]
@@ -1,10 +1,10 @@
 import os
 import re
-import json
 from distutils.version import LooseVersion
 from collections import OrderedDict
 
 from demisto_sdk.commands.common.configuration import Configuration
+from demisto_sdk.commands.common.id_set import IDSet, as_id_set_section, get_entry_id, get_entry_data
 from demisto_sdk.commands.common.tools import get_script_or_integration_id, collect_ids, print_error
 from demisto_sdk.commands.common.constants import INTEGRATION_REGEX, TEST_PLAYBOOK_REGEX, SCRIPT_JS_REGEX, \
     SCRIPT_REGEX, TEST_SCRIPT_REGEX, INTEGRATION_YML_REGEX, PLAYBOOK_REGEX, SCRIPT_YML_REGEX, SCRIPT_PY_REGEX
@@ -21,7 +21,7 @@ class IDSetValidator:
 
     Attributes:
         is_circle (bool): whether we are running on circle or local env.
-        id_set (dict): Dictionary that hold all the data from the id_set.json file.
+        id_set (IDSet): Indexed mapping that holds all the data from the id_set.json file.
         script_set (set): Set of all the data regarding scripts in our system.
         playbook_set (set): Set of all the data regarding playbooks in our system.
         integration_set (set): Set of all the data regarding integrations in our system.
@@ -46,17 +46,14 @@ class IDSetValidator:
             self.test_playbook_set = self.id_set[self.TEST_PLAYBOOK_SECTION]
 
     def load_id_set(self):
-        with open(self.ID_SET_PATH, 'r') as id_set_file:
-            try:
-                id_set = json.load(id_set_file)
-            except ValueError as ex:
-                if "Expecting property name" in str(ex):
-                    print_error("You probably merged from master and your id_set.json has conflicts. "
-                                "Run `python Tests/scripts/update_id_set.py -r`, it should reindex your id_set.json")
+        try:
+            return IDSet.load(self.ID_SET_PATH)
+        except ValueError as ex:
+            if "Expecting property name" in str(ex):
+                print_error("You probably merged from master and your id_set.json has conflicts. "
+                            "Run `python Tests/scripts/update_id_set.py -r`, it should reindex your id_set.json")
 
-                raise
-
-            return id_set
+            raise
 
     def is_valid_in_id_set(self, file_path: str, obj_data: OrderedDict, obj_set: list):
         """Check if the file is represented correctly in the id_set
@@ -70,17 +67,14 @@ class IDSetValidator:
             bool. Whether the file is represented correctly in the id_set or not.
         """
         is_found = False
-        file_id = list(obj_data.keys())[0]
+        file_id = get_entry_id(obj_data)
+        obj_to_version = obj_data[file_id].get('toversion', '99.99.99')
+        obj_from_version = obj_data[file_id].get('fromversion', '0.0.0')
 
-        for checked_instance in obj_set:
-            checked_instance_id = list(checked_instance.keys())[0]
-            checked_instance_data = checked_instance[checked_instance_id]
+        for checked_instance_data in as_id_set_section(obj_set).get_by_id(file_id):
             checked_instance_toversion = checked_instance_data.get('toversion', '99.99.99')
             checked_instance_fromversion = checked_instance_data.get('fromversion', '0.0.0')
-            obj_to_version = obj_data[file_id].get('toversion', '99.99.99')
-            obj_from_version = obj_data[file_id].get('fromversion', '0.0.0')
-            if checked_instance_id == file_id and checked_instance_toversion == obj_to_version and \
-                    checked_instance_fromversion == obj_from_version:
+            if checked_instance_toversion == obj_to_version and checked_instance_fromversion == obj_from_version:
                 is_found = True
                 if checked_instance_data != obj_data[file_id]:
                     print_error("You have failed to update id_set.json with the data of {} "
@@ -147,30 +141,27 @@ class IDSetValidator:
             bool. Whether the ID already exist in the system or not.
         """
         is_duplicated = False
-        obj_data_list = list(obj_data.values())
-        dict_value = obj_data_list[0]
+        dict_value = get_entry_data(obj_data)
         obj_toversion = dict_value.get('toversion', '99.99.99')
         obj_fromversion = dict_value.get('fromversion', '0.0.0')
 
         for section, section_data in self.id_set.items():
-            for instance in section_data:
-                instance_id = list(instance.keys())[0]
-                instance_to_version = instance[instance_id].get('toversion', '99.99.99')
-                instance_from_version = instance[instance_id].get('fromversion', '0.0.0')
-                if obj_id == instance_id:
-                    if section != obj_type and LooseVersion(obj_fromversion) < LooseVersion(instance_to_version):
+            for instance_data in as_id_set_section(section_data).get_by_id(obj_id):
+                instance_to_version = instance_data.get('toversion', '99.99.99')
+                instance_from_version = instance_data.get('fromversion', '0.0.0')
+                if section != obj_type and LooseVersion(obj_fromversion) < LooseVersion(instance_to_version):
+                    is_duplicated = True
+                    break
+
+                elif obj_fromversion == instance_from_version and obj_toversion == instance_to_version:
+                    if instance_data != obj_data[obj_id]:
                         is_duplicated = True
                         break
 
-                    elif obj_fromversion == instance_from_version and obj_toversion == instance_to_version:
-                        if instance[instance_id] != obj_data[obj_id]:
-                            is_duplicated = True
-                            break
-
-                    elif (LooseVersion(obj_fromversion) <= LooseVersion(instance_to_version) and
-                          (LooseVersion(obj_toversion) >= LooseVersion(instance_from_version))):
-                        is_duplicated = True
-                        break
+                elif (LooseVersion(obj_fromversion) <= LooseVersion(instance_to_version) and
+                      (LooseVersion(obj_toversion) >= LooseVersion(instance_from_version))):
+                    is_duplicated = True
+                    break
 
         if is_duplicated:
             print_error("The ID {0} already exists, please update the file or update the "
@@ -539,10 +539,9 @@ class IntegrationValidator(BaseValidator):
             bool. True if the integration is defined as well False otherwise.
         """
         params_exist = True
-        params = [_key for _key in self.current_file.get('configuration', [])]
-        for counter, param in enumerate(params):
-            if 'defaultvalue' in param:
-                params[counter].pop('defaultvalue')
+        # the params are compared without their default values, current_file is read only so they are copied
+        params = [{key: value for key, value in param.items() if key != 'defaultvalue'}
+                  for param in self.current_file.get('configuration', [])]
         for param in FEED_REQUIRED_PARAMS:
             if param not in params:
                 print_error(f'Feed Integration was detected '
@@ -1,10 +1,122 @@
 from pathlib import Path
+from subprocess import Popen, PIPE
+from typing import Dict, Optional
+import atexit
+import json
 import os
+import tempfile
+import threading
 from demisto_sdk.commands.common.tools import print_error, print_warning, run_command_os, get_content_path
 
 NO_HTML = '<!-- NOT_HTML_DOC -->'
 YES_HTML = '<!-- HTML_DOC -->'
 
+MDX_WORKER_SCRIPT = Path(__file__).parent.parent / 'mdx-worker.js'
+
+
+class MDXWorker:
+    """A long lived node process parsing mdx files, so validating all the README files costs a single node startup.
+
+    The files are sent to the worker as JSON lines over its stdin, and their parse errors are read back from its
+    stdout. A worker which exited is started again on the next parse.
+
+    Attributes:
+        content_path (Path): The content repository, the worker runs in.
+        node_modules_path (Path): The node modules directory of the content repository.
+    """
+
+    def __init__(self, content_path, node_modules_path):
+        self.content_path = content_path
+        self.node_modules_path = node_modules_path
+        self.process: Optional[Popen] = None
+        self._stderr = None
+        self._request_id = 0
+        self._lock = threading.Lock()
+
+    def start(self):
+        env = os.environ.copy()
+        # add to env var the directory of node modules
+        env['NODE_PATH'] = str(self.node_modules_path) + os.pathsep + os.getenv('NODE_PATH', '')
+        # the worker may write any amount of warnings, so stderr is written to a file rather than a pipe nobody reads
+        self._stderr = tempfile.TemporaryFile(mode='w+')
+        self.process = Popen(['node', str(MDX_WORKER_SCRIPT)], cwd=self.content_path, env=env, stdin=PIPE,
+                             stdout=PIPE, stderr=self._stderr, universal_newlines=True, bufsize=1)
+
+    def _get_exit_error(self, stderr_offset: int) -> str:
+        """Stop the worker and get its error - what it wrote to stderr from the given offset on"""
+        self.close()
+        if self._stderr is None:
+            return 'The mdx worker exited'
+        self._stderr.seek(stderr_offset)
+        error = self._stderr.read().strip() or 'The mdx worker exited'
+        self._stderr.close()
+        self._stderr = None
+        return error
+
+    def parse(self, file_path) -> Optional[str]:
+        """Parse an mdx file.
+
+        Returns:
+            str. The parse error of the file, None if it was parsed.
+        """
+        with self._lock:
+            error = None
+            # a file the worker wrote other output than its response for may have been parsed fine, so it is parsed
+            # once more by a new worker before it is failed
+            for _ in range(2):
+                if self.process is None or self.process.poll() is not None:
+                    self.start()
+                # the warnings the worker wrote for the previous files are not a part of the error of this file
+                stderr_offset = self._stderr.seek(0, os.SEEK_END)
+
+                self._request_id += 1
+                try:
+                    self.process.stdin.write(json.dumps({'id': self._request_id, 'file': str(file_path)}) + '\n')
+                    self.process.stdin.flush()
+                    line = self.process.stdout.readline()
+                except OSError:
+                    line = ''
+                if not line:
+                    return self._get_exit_error(stderr_offset)
+
+                try:
+                    response = json.loads(line)
+                except ValueError:
+                    response = None
+                if isinstance(response, dict) and response.get('id') == self._request_id:
+                    return response.get('error')
+                # something else wrote to the stdout of the worker, the responses can not be trusted anymore
+                error = self._get_exit_error(stderr_offset)
+
+            return error
+
+    def close(self):
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.process.wait(timeout=5)
+            except Exception:
+                self.process.kill()
+            self.process.stdout.close()
+            self.process = None
+
+
+# (pid, content path) -> the mdx worker of the process, a forked process starts its own worker
+_mdx_workers: Dict[tuple, MDXWorker] = {}
+# content path -> whether node and the npm modules the validation requires are installed, checked once per run
+_modules_installed: Dict[str, bool] = {}
+
+
+def get_mdx_worker(content_path, node_modules_path) -> MDXWorker:
+    key = (os.getpid(), str(content_path))
+    if key not in _mdx_workers:
+        _mdx_workers[key] = MDXWorker(content_path, node_modules_path)
+        atexit.register(_mdx_workers[key].close)
+    return _mdx_workers[key]
+
 
 class ReadMeValidator:
     """ReadMeValidator is a validator for readme.md files
@@ -38,23 +150,25 @@ class ReadMeValidator:
         html = self.is_html_doc()
         valid = self.are_modules_installed_for_verify()
         if valid and not html:
-            mdx_parse = Path(__file__).parent.parent / 'mdx-parse.js'
-            # add to env var the directory of node modules
-            os.environ['NODE_PATH'] = str(self.node_modules_path) + os.pathsep + os.getenv("NODE_PATH", "")
-            # run the java script mdx parse validator
-            _, stderr, is_valid = run_command_os(f'node {mdx_parse} -f {self.file_path}', cwd=self.content_path, env=os.environ)
-            if is_valid:
-                print_error(f'Failed verifying README.md, Path: {self.file_path}. Error Message is: {stderr}')
+            # parse the file by the mdx worker of the run
+            error = get_mdx_worker(self.content_path, self.node_modules_path).parse(self.file_path)
+            if error is not None:
+                print_error(f'Failed verifying README.md, Path: {self.file_path}. Error Message is: {error}')
                 return False
         return True
 
     def are_modules_installed_for_verify(self) -> bool:
-        """ Check the following:
+        """ Check the following, once per run:
             1. npm packages installed - see packs var for specific pack details.
             2. node interperter exists.
         Returns:
             bool: True If all req ok else False
         """
+        if str(self.content_path) not in _modules_installed:
+            _modules_installed[str(self.content_path)] = self.check_modules_installed()
+        return _modules_installed[str(self.content_path)]
+
+    def check_modules_installed(self) -> bool:
         missing_module = []
         valid = True
         # Check node exist
@@ -3,7 +3,7 @@ from __future__ import print_function
 import os
 import re
 
-from demisto_sdk.commands.common.tools import run_command
+from demisto_sdk.commands.common.git_tools import get_git_context
 from demisto_sdk.commands.common.tools import print_error, get_latest_release_notes_text, \
     get_release_notes_file_path
 
@@ -38,8 +38,7 @@ class ReleaseNotesValidator:
         Returns:
             str. empty string if no changes made or no origin/master branch, otherwise full difference context.
         """
-        return run_command(F'git diff --unified=100 '
-                           F'origin/master {self.release_notes_path}')
+        return get_git_context().get_path_diff(self.release_notes_path, 'origin/master', unified=100)
 
     def is_release_notes_changed(self):
         """Validates that a new comment was added to release notes.
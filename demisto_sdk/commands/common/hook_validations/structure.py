@@ -4,17 +4,18 @@ Module contains validation of schemas, ids and paths.
 """
 import json
 import os
-import re
 import logging
 
 from typing import Optional
 
-import yaml
-from pykwalify.core import Core
+from pykwalify.compat import yml
+from pykwalify.core import Core, CoreError
 
 from demisto_sdk.commands.common.constants import Errors, ACCEPTED_FILE_EXTENSIONS, FILE_TYPES_PATHS_TO_VALIDATE, \
     SCHEMA_TO_REGEX
-from demisto_sdk.commands.common.tools import get_remote_file, get_matching_regex, print_error
+from demisto_sdk.commands.common.git_tools import get_old_file
+from demisto_sdk.commands.common.path_classifier import PathClassifier
+from demisto_sdk.commands.common.tools import print_error, load_document, yaml_safe_load, make_read_only
 from demisto_sdk.commands.common.configuration import Configuration
 
 
@@ -33,10 +34,17 @@ class StructureValidator:
     SCHEMAS_PATH = "schemas"
 
     FILE_SUFFIX_TO_LOAD_FUNCTION = {
-        '.yml': yaml.safe_load,
+        '.yml': yaml_safe_load,
         '.json': json.load,
     }
 
+    # the scheme and the file type of a path are the first of the tables whose regex matches it
+    SCHEME_CLASSIFIER = PathClassifier.from_dict(SCHEMA_TO_REGEX)
+    FILE_TYPE_CLASSIFIER = PathClassifier.from_dict(FILE_TYPES_PATHS_TO_VALIDATE, search=True)
+
+    # scheme name -> the loaded schema, the schema files are loaded once per process
+    _schemas = {}  # type: dict
+
     def __init__(self, file_path, is_new_file=False, old_file_path=None, predefined_scheme=None,
                  configuration=Configuration()):
         # type: (str, Optional[bool], Optional[str], Optional[str], Configuration) -> None
@@ -48,7 +56,7 @@ class StructureValidator:
         if is_new_file or predefined_scheme:
             self.old_file = {}
         else:
-            self.old_file = get_remote_file(old_file_path if old_file_path else file_path)
+            self.old_file = get_old_file(old_file_path if old_file_path else file_path)
         self.configuration = configuration
 
     def is_valid_file(self):
@@ -78,9 +86,9 @@ class StructureValidator:
             (str): Type of file by scheme name
         """
 
-        for scheme_name, regex_list in SCHEMA_TO_REGEX.items():
-            if get_matching_regex(self.file_path, regex_list):
-                return scheme_name
+        scheme_name = self.SCHEME_CLASSIFIER.classify(self.file_path)
+        if scheme_name:
+            return scheme_name
 
         pretty_formatted_string_of_regexes = json.dumps(SCHEMA_TO_REGEX, indent=4, sort_keys=True)
 
@@ -101,10 +109,7 @@ class StructureValidator:
             # disabling massages of level INFO and beneath of pykwalify such as: INFO:pykwalify.core:validation.valid
             log = logging.getLogger('pykwalify.core')
             log.setLevel(logging.WARNING)
-            path = os.path.normpath(
-                os.path.join(__file__, "..", "..", self.SCHEMAS_PATH, '{}.yml'.format(self.scheme_name)))
-            core = Core(source_file=self.file_path,
-                        schema_files=[path])
+            core = Core(source_data=self.get_data_to_validate(), schema_data=self.get_schema(self.scheme_name))
             core.validate(raise_exception=True)
         except Exception as err:
             try:
@@ -115,6 +120,40 @@ class StructureValidator:
             return False
         return True
 
+    @classmethod
+    def get_schema(cls, scheme_name):
+        # type: (str) -> dict
+        """Gets the loaded schema of a scheme, the schema file is loaded only the first time the scheme is used
+
+        Returns:
+            (dict): The read only schema.
+        """
+        if scheme_name not in cls._schemas:
+            path = os.path.normpath(os.path.join(__file__, "..", "..", cls.SCHEMAS_PATH, '{}.yml'.format(scheme_name)))
+            if not os.path.exists(path):
+                raise CoreError(u"Provided source_file do not exists on disk : {0}".format(path))
+            with open(path, 'r') as schema_file:
+                cls._schemas[scheme_name] = make_read_only(yml.load(schema_file))
+
+        return cls._schemas[scheme_name]
+
+    def get_data_to_validate(self):
+        """Gets the file data to validate against the scheme.
+
+        JSON files are validated against current_file. yml files are loaded by the YAML 1.2 loader of pykwalify, as
+        yaml.safe_load (YAML 1.1) loads values such as yes/no differently. They are loaded through the documents cache,
+        so a file is parsed once even when it is validated a few times.
+
+        Returns:
+            The loaded file data.
+        """
+        if self.file_path.endswith('.json'):
+            return self.current_file
+        if self.file_path.endswith(('.yml', '.yaml')):
+            return load_document(self.file_path, yml.load)
+        raise CoreError(u"Unable to load source_file. Unknown file format of specified file path: {0}".format(
+            self.file_path))
+
     @staticmethod
     def get_file_id_from_loaded_file_data(loaded_file_data):
         # type: (dict) -> Optional[str]
@@ -204,9 +243,8 @@ class StructureValidator:
         if file_extension in ACCEPTED_FILE_EXTENSIONS:
             if file_extension in self.FILE_SUFFIX_TO_LOAD_FUNCTION:
                 load_function = self.FILE_SUFFIX_TO_LOAD_FUNCTION[file_extension]
-                with open(self.file_path, 'r') as file_obj:
-                    loaded_file_data = load_function(file_obj)  # type: ignore
-                    return loaded_file_data
+                # the document is shared with the other validators of the file, and it is read only
+                return load_document(self.file_path, load_function)
 
             # Ignore loading image and markdown
             elif file_extension in ['.png', '.md']:
@@ -226,11 +264,7 @@ class StructureValidator:
         if self.scheme_name:
             return self.scheme_name
 
-        for file_type, regexes in FILE_TYPES_PATHS_TO_VALIDATE.items():
-            for regex in regexes:
-                if re.search(regex, self.file_path, re.IGNORECASE):
-                    return file_type
-        return None
+        return self.FILE_TYPE_CLASSIFIER.classify(self.file_path)
 
     def is_valid_file_path(self):
         """Returns is valid filepath exists.
@@ -278,7 +312,7 @@ class StructureValidator:
             key_from_error = str(err).split('key')[1].split('.')[0].replace("'", '-').split('-')[1]
             key_list = []
             for single_path in error_path:
-                if type(curr) is list:
+                if isinstance(curr, list):
                     curr = curr[int(single_path)]
                     # if the error is from arguments of file
                     if curr.get('name'):
@@ -0,0 +1,268 @@
+import json
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+
+def get_entry_id(entry: dict):
+    """Get the id of an id_set entry. An entry is a single key dict of the form {id: data}"""
+    return next(iter(entry))
+
+
+def get_entry_data(entry: dict) -> dict:
+    """Get the data of an id_set entry. An entry is a single key dict of the form {id: data}"""
+    return next(iter(entry.values()))
+
+
+class IDSetSection(list):
+    """A section of the id_set - a list of single key {id: data} entries, indexed by id, name, pack and file path.
+
+    The section behaves (and is serialized) exactly as the plain list it replaces. The indexes are built on the first
+    lookup and are dropped by every change made through the list API or through update_entry, so lookups are O(1)
+    while the section is not changed.
+    """
+    INDEXED_FIELDS = ('name', 'pack', 'file_path')
+
+    def __init__(self, entries=()):
+        super().__init__(entries)
+        self._indexes: Optional[Dict[str, dict]] = None
+
+    def _get_index(self, field: str) -> dict:
+        if self._indexes is None:
+            indexes: Dict[str, dict] = {field_name: OrderedDict() for field_name in ('id',) + self.INDEXED_FIELDS}
+            for entry in self:
+                entry_id = get_entry_id(entry)
+                indexes['id'].setdefault(entry_id, []).append(entry)
+                entry_data = entry[entry_id]
+                if not isinstance(entry_data, dict):
+                    continue
+                for field_name in self.INDEXED_FIELDS:
+                    value = entry_data.get(field_name)
+                    if isinstance(value, str):
+                        indexes[field_name].setdefault(value, []).append(entry)
+
+            self._indexes = indexes
+
+        return self._indexes[field]
+
+    def invalidate(self):
+        """Drop the indexes, needed only when an entry was changed in place"""
+        self._indexes = None
+
+    def get_ids(self) -> list:
+        """Get the distinct ids of the section, in the order of their first occurrence"""
+        return list(self._get_index('id'))
+
+    def has_id(self, entry_id) -> bool:
+        return entry_id in self._get_index('id')
+
+    def get_entries(self, entry_id) -> List[dict]:
+        """Get all the {id: data} entries with the given id"""
+        return list(self._get_index('id').get(entry_id, []))
+
+    def get_by_id(self, entry_id) -> List[dict]:
+        """Get the data of all the entries with the given id"""
+        return [entry[entry_id] for entry in self._get_index('id').get(entry_id, [])]
+
+    def get_by_name(self, name: str) -> List[dict]:
+        return list(self._get_index('name').get(name, []))
+
+    def get_by_pack(self, pack: str) -> List[dict]:
+        return list(self._get_index('pack').get(pack, []))
+
+    def get_by_file_path(self, file_path: str) -> List[dict]:
+        return list(self._get_index('file_path').get(file_path, []))
+
+    def update_entry(self, entry: dict, entry_data: dict):
+        """Replace the data of an entry of the section"""
+        entry[get_entry_id(entry)] = entry_data
+        self.invalidate()
+
+    def append(self, entry):
+        self.invalidate()
+        super().append(entry)
+
+    def extend(self, entries):
+        self.invalidate()
+        super().extend(entries)
+
+    def insert(self, index, entry):
+        self.invalidate()
+        super().insert(index, entry)
+
+    def remove(self, entry):
+        self.invalidate()
+        super().remove(entry)
+
+    def pop(self, *args):
+        self.invalidate()
+        return super().pop(*args)
+
+    def clear(self):
+        self.invalidate()
+        super().clear()
+
+    def sort(self, *args, **kwargs):
+        self.invalidate()
+        super().sort(*args, **kwargs)
+
+    def reverse(self):
+        self.invalidate()
+        super().reverse()
+
+    def __setitem__(self, index, value):
+        self.invalidate()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self.invalidate()
+        super().__delitem__(index)
+
+    def __iadd__(self, entries):
+        self.invalidate()
+        return super().__iadd__(entries)
+
+
+def as_id_set_section(entries) -> IDSetSection:
+    """Get the entries as an IDSetSection, entries which are already a section are returned as is"""
+    if isinstance(entries, IDSetSection):
+        return entries
+    return IDSetSection(entries or [])
+
+
+class IDSet(OrderedDict):
+    """The id_set - an ordered mapping of section name to an IDSetSection.
+
+    Loaded once, it can be looked up by id, name, pack or file path in O(1), and it is serialized to the exact same
+    json layout as the id_set.json file it was loaded from.
+    """
+
+    def __init__(self, sections=()):
+        super().__init__()
+        for section, entries in OrderedDict(sections).items():
+            self[section] = entries
+
+    def __setitem__(self, section, entries):
+        super().__setitem__(section, as_id_set_section(entries))
+
+    @classmethod
+    def load(cls, id_set_path: str) -> 'IDSet':
+        """Load an id_set json file.
+
+        Raises:
+            ValueError: in case the file is not a valid json.
+        """
+        with open(id_set_path, 'r') as id_set_file:
+            return cls(json.load(id_set_file, object_pairs_hook=OrderedDict))
+
+    def dump(self, id_set_path: str):
+        with open(id_set_path, 'w') as id_set_file:
+            json.dump(self, id_set_file, indent=4)
+
+    def get_section(self, section: str) -> IDSetSection:
+        return self.get(section, IDSetSection())
+
+    def find(self, entry_id) -> List[tuple]:
+        """Find the entries of the given id in all the sections
+
+        Returns:
+            list. (section, entry) tuples, ordered by the sections order.
+        """
+        return [(section, entry) for section, section_data in self.items()
+                for entry in section_data.get_entries(entry_id)]
+
+
+class ReverseDependencyIndex:
+    """A reverse dependency index of the id_set - maps every used item to the id_set entries using it.
+
+    Each relation maps a used item to its consumers, a consumer is a (section, id, name) tuple of an id_set entry:
+        implementing_scripts - script id -> entries running it as a playbook task
+        implementing_playbooks - playbook id -> entries running it as a sub playbook
+        depends_on - script or command name -> scripts depending on it
+        script_executions - script or command name -> scripts executing it
+        command_to_integration - command name -> entries running it
+        integrations - integration id -> entries running one of its commands
+        tests - test playbook id -> entries tested by it
+    """
+    LIST_RELATIONS = ('implementing_scripts', 'implementing_playbooks', 'depends_on', 'script_executions', 'tests')
+    RELATIONS = LIST_RELATIONS + ('command_to_integration', 'integrations')
+
+    def __init__(self, relations=None):
+        # relation -> target -> consumers, the consumers are kept as the keys of a dict which is used as an ordered set
+        self.relations: Dict[str, Dict[str, dict]] = {relation: {} for relation in self.RELATIONS}
+        for relation, targets in (relations or {}).items():
+            self.relations[relation] = {target: dict.fromkeys(tuple(consumer) for consumer in consumers)
+                                        for target, consumers in targets.items()}
+
+    def _add(self, relation: str, target, consumer: tuple):
+        self.relations[relation].setdefault(target, {})[consumer] = None
+
+    @classmethod
+    def from_id_set(cls, id_set) -> 'ReverseDependencyIndex':
+        """Build the index in a single pass over an id_set (an IDSet or a dict of section to entries list)"""
+        index = cls()
+        for section, section_data in id_set.items():
+            for entry in section_data:
+                entry_id = get_entry_id(entry)
+                entry_data = entry[entry_id]
+                if not isinstance(entry_data, dict):
+                    continue
+
+                consumer = (section, entry_id, entry_data.get('name'))
+                for relation in cls.LIST_RELATIONS:
+                    targets = entry_data.get(relation) or []
+                    for target in [targets] if isinstance(targets, str) else targets:
+                        index._add(relation, target, consumer)
+
+                for command, integration in (entry_data.get('command_to_integration') or {}).items():
+                    index._add('command_to_integration', command, consumer)
+                    if integration:
+                        index._add('integrations', integration, consumer)
+
+        return index
+
+    @classmethod
+    def load(cls, index_path: str) -> 'ReverseDependencyIndex':
+        with open(index_path, 'r') as index_file:
+            return cls(json.load(index_file))
+
+    def to_dict(self) -> dict:
+        return {relation: OrderedDict((target, sorted(consumers, key=lambda c: tuple(str(value) for value in c)))
+                                      for target, consumers in sorted(targets.items(), key=lambda t: str(t[0])))
+                for relation, targets in self.relations.items()}
+
+    def dump(self, index_path: str):
+        with open(index_path, 'w') as index_file:
+            json.dump(self.to_dict(), index_file, indent=4)
+
+    def get_consumers(self, relation: str, target) -> List[tuple]:
+        """Get the (section, id, name) of the entries using the target through the given relation"""
+        return list(self.relations[relation].get(target, []))
+
+    def _get_consumers_union(self, relations, target) -> List[tuple]:
+        consumers: dict = {}
+        for relation in relations:
+            consumers.update(self.relations[relation].get(target, {}))
+        return list(consumers)
+
+    def get_script_consumers(self, script_id) -> List[tuple]:
+        """Get the entries running the script as a task, depending on it or executing it"""
+        return self._get_consumers_union(('implementing_scripts', 'depends_on', 'script_executions'), script_id)
+
+    def get_playbook_consumers(self, playbook_id) -> List[tuple]:
+        """Get the entries running the playbook as a sub playbook"""
+        return self.get_consumers('implementing_playbooks', playbook_id)
+
+    def get_command_consumers(self, command) -> List[tuple]:
+        """Get the entries running the integration command, depending on it or executing it"""
+        return self._get_consumers_union(('command_to_integration', 'depends_on', 'script_executions'), command)
+
+    def get_integration_consumers(self, integration_id, commands=()) -> List[tuple]:
+        """Get the entries running a command explicitly through the integration, or one of the given commands"""
+        consumers = dict.fromkeys(self.get_consumers('integrations', integration_id))
+        for command in commands:
+            consumers.update(dict.fromkeys(self.get_command_consumers(command)))
+        return list(consumers)
+
+    def get_tested_entries(self, test_playbook_id) -> List[tuple]:
+        """Get the entries which list the test playbook in their tests"""
+        return self.get_consumers('tests', test_playbook_id)
@@ -0,0 +1,27 @@
+// A long lived mdx parser, started once per run instead of a node process per file.
+// Reads requests of the form {"id": 1, "file": "<path of an mdx file>"} from stdin, a JSON object per line, and writes
+// the responses {"id": 1, "error": null or "<parse error>"} to stdout, a JSON object per line, in the order of the
+// requests.
+// stdout is kept for the responses, so the console output of node and the mdx plugins goes to stderr.
+console.log = console.info = console.debug = console.error;
+const readline = require('readline');
+const {readFile} = require('fs-extra');
+const mdx = require('@mdx-js/mdx');
+
+async function parseRequest(line) {
+    const response = {id: null, error: null};
+    try {
+        const request = JSON.parse(line);
+        response.id = request.id;
+        const contents = await readFile(request.file, 'utf8');
+        await mdx(contents);
+    } catch (reason) {
+        response.error = `${reason}`;
+    }
+    process.stdout.write(`${JSON.stringify(response)}\n`);
+}
+
+let queue = Promise.resolve();
+readline.createInterface({input: process.stdin, terminal: false}).on('line', (line) => {
+    queue = queue.then(() => parseRequest(line));
+});
@@ -0,0 +1,122 @@
+"""Classification of content file paths by the regex tables of `constants`.
+
+The tables are ordered lists of regexes, and a path is of the type of the first regex matching it. Instead of matching
+the regexes one by one, a PathClassifier compiles a table once into a few combined alternations, so a path is matched
+against the whole table in a single pass, and the result of every path is cached.
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# a regex which can not be a part of a combined alternation: numbered backreferences would refer to the groups of
+# other regexes, and global inline flags are only allowed at the start of a pattern
+STANDALONE_REGEX = re.compile(r'(?<!\\)(?:\\\\)*\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)')
+
+# the maximal number of cached paths of a classifier
+MAX_CACHED_PATHS = 100000
+
+
+class PathClassifier:
+    """An ordered table of (label, regex) entries, matched case insensitively against paths.
+
+    A path is classified by the first entry whose regex matches it - by re.match, or by re.search when search is set -
+    exactly as matching the regexes one after the other would.
+
+    Attributes:
+        entries (list): the (label, regex) entries of the table.
+        search (bool): whether a regex may match anywhere in the path, and not only at its start.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Any, str]], search: bool = False):
+        self.entries: List[Tuple[Any, str]] = list(entries)
+        self.search = search
+        # the patterns of the table, in order - an alternation with the (group name -> entry index) of its
+        # alternatives, or a standalone regex with its entry index
+        self._patterns: Optional[List[Tuple[Any, Optional[Dict[str, int]], int]]] = None
+        self._matches: Dict[str, int] = {}
+
+    @classmethod
+    def from_regexes(cls, regexes: Iterable[str], search: bool = False) -> 'PathClassifier':
+        """Create a classifier whose labels are the regexes themselves"""
+        return cls(((regex, regex) for regex in regexes), search=search)
+
+    @classmethod
+    def from_dict(cls, label_to_regexes: dict, search: bool = False) -> 'PathClassifier':
+        """Create a classifier of a {label: [regexes]} table, the labels are tried in the order of the dict"""
+        return cls(((label, regex) for label, regexes in label_to_regexes.items() for regex in regexes), search=search)
+
+    def _compile_alternation(self, indexes: List[int]) -> List[Tuple[Any, Optional[Dict[str, int]], int]]:
+        if len(indexes) == 1:
+            return [self._compile_standalone(indexes[0])]
+
+        group_to_index = {f'entry{index}': index for index in indexes}
+        # with re.match, an alternation tries its alternatives in order, and a lazy prefix tries all the start
+        # positions of an alternative before moving to the next one - so the first matching alternative is the
+        # first regex of the table that matches, as with the sequential loop
+        prefix = r'[\s\S]*?' if self.search else ''
+        alternation = '|'.join(f'(?P<{group}>{prefix}(?:{self.entries[index][1]}))'
+                               for group, index in group_to_index.items())
+        try:
+            return [(re.compile(alternation, re.IGNORECASE), group_to_index, -1)]
+        except re.error:
+            return [self._compile_standalone(index) for index in indexes]
+
+    def _compile_standalone(self, index: int) -> Tuple[Any, Optional[Dict[str, int]], int]:
+        return re.compile(self.entries[index][1], re.IGNORECASE), None, index
+
+    def _get_patterns(self) -> List[Tuple[Any, Optional[Dict[str, int]], int]]:
+        if self._patterns is None:
+            patterns: List[Tuple[Any, Optional[Dict[str, int]], int]] = []
+            alternation_indexes: List[int] = []
+            for index, (_, regex) in enumerate(self.entries):
+                if STANDALONE_REGEX.search(regex):
+                    if alternation_indexes:
+                        patterns.extend(self._compile_alternation(alternation_indexes))
+                        alternation_indexes = []
+                    patterns.append(self._compile_standalone(index))
+                else:
+                    alternation_indexes.append(index)
+
+            if alternation_indexes:
+                patterns.extend(self._compile_alternation(alternation_indexes))
+            self._patterns = patterns
+
+        return self._patterns
+
+    def get_match_index(self, path: str) -> int:
+        """Get the index of the first entry matching the path, -1 in case no entry matches it"""
+        if path not in self._matches:
+            match_index = -1
+            for pattern, group_to_index, index in self._get_patterns():
+                if group_to_index is None:
+                    if pattern.search(path) if self.search else pattern.match(path):
+                        match_index = index
+                        break
+                else:
+                    match = pattern.match(path)
+                    if match:
+                        # the group of each alternative wraps it, so it is the last group to close
+                        match_index = group_to_index[match.lastgroup]
+                        break
+
+            if len(self._matches) >= MAX_CACHED_PATHS:
+                self._matches.clear()
+            self._matches[path] = match_index
+
+        return self._matches[path]
+
+    def get_match(self, path: str) -> Optional[Tuple[Any, str]]:
+        """Get the (label, regex) of the first entry matching the path, None in case no entry matches it"""
+        match_index = self.get_match_index(path)
+        return self.entries[match_index] if match_index >= 0 else None
+
+    def classify(self, path: str) -> Any:
+        """Get the label of the first entry matching the path, None in case no entry matches it"""
+        match = self.get_match(path)
+        return match[0] if match else None
+
+
+@lru_cache(maxsize=None)
+def get_regexes_classifier(regexes: Tuple[str, ...], search: bool = False) -> PathClassifier:
+    """Get the shared classifier of a regexes list, the labels of the classifier are the regexes"""
+    return PathClassifier.from_regexes(regexes, search=search)
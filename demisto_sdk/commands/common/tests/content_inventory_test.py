@@ -0,0 +1,121 @@
+import glob
+import os
+
+import pytest
+
+from demisto_sdk.commands.common import content_inventory
+from demisto_sdk.commands.common.content_inventory import ContentInventory, get_content_inventory
+
+REPO_FILES = [
+    'Packs/Pack1/pack_metadata.json', 'Packs/Pack1/Integrations/Integration1/Integration1.yml',
+    'Packs/Pack1/Integrations/Integration1/Integration1.py', 'Packs/Pack1/Integrations/Integration1/test_data/a.json',
+    'Packs/Pack1/Scripts/script-Script1.yml', 'Packs/Pack1/Playbooks/playbook-Playbook1.yml',
+    'Integrations/Integration2/Integration2.yml', 'Integrations/Integration2/.hidden.yml',
+    'Scripts/Script2/Script2.yml', 'Playbooks/playbook-Playbook2.yml', 'TestPlaybooks/playbook-Test.yml',
+    'Documentation/doc.json',
+]
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    for path in REPO_FILES:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text('{}')
+    (tmp_path / 'Packs' / 'Pack1' / 'Scripts' / 'EmptyScript').mkdir()
+    # directories modified long ago, so their modification times are trusted
+    for root, dirs, _ in os.walk(str(tmp_path)):
+        for directory in dirs:
+            os.utime(os.path.join(root, directory), (1, 1))
+    os.utime(str(tmp_path), (1, 1))
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path.parent / f'{tmp_path.name}_cache'))
+    monkeypatch.setattr(content_inventory, '_inventories', {})
+    return tmp_path
+
+
+class TestContentInventory:
+    @pytest.mark.parametrize('parts', [
+        ('Packs', '*', 'Integrations', '*'), ('Integrations', '*'), ('Playbooks', '*.yml'),
+        ('Packs', '*', 'Playbooks', '*.yml'), ('Packs', 'Pack1', 'Scripts', '*'), ('Beta_Integrations', '*'),
+        ('Documentation', '*'), ('Integrations', 'Integration2', '*.yml'), ('Packs', 'Pack1', 'pack_metadata.json'),
+    ])
+    def test_glob(self, repo, parts):
+        inventory = ContentInventory()
+        inventory.scan()
+        assert inventory.glob(*parts) == sorted(glob.glob(os.path.join(*parts)))
+        assert inventory.glob(*parts, only_dirs=True) == sorted(path for path in glob.glob(os.path.join(*parts))
+                                                                if os.path.isdir(path))
+
+    def test_walk_and_entries(self, repo):
+        inventory = ContentInventory()
+        inventory.scan()
+        assert list(inventory.walk('Packs')) == [(root, sorted(dirs), sorted(files))
+                                                 for root, dirs, files in sorted(os.walk('Packs'))]
+        assert 'Documentation' not in inventory.children['']
+        assert inventory.get_yml_paths_in_dir('Integrations/Integration2', '') == \
+            (['Integrations/Integration2/Integration2.yml'], 'Integrations/Integration2/Integration2.yml')
+
+        entry = inventory.get_entry('./Packs/Pack1/Integrations/Integration1/test_data/a.json')
+        assert (entry.pack, entry.package_dir) == ('Pack1', 'Packs/Pack1/Integrations/Integration1')
+        entry = inventory.get_entry('Packs/Pack1/Integrations/Integration1/Integration1.yml')
+        assert entry.file_type == 'integration'
+        entry = inventory.get_entry('Packs/Pack1/Playbooks/playbook-Playbook1.yml')
+        assert (entry.pack, entry.package_dir, entry.file_type) == ('Pack1', None, 'playbook')
+        entry = inventory.get_entry('Packs/Pack1/Scripts/script-Script1.yml')
+        assert (entry.pack, entry.package_dir) == ('Pack1', None)
+        entry = inventory.get_entry('Scripts/Script2')
+        assert (entry.is_dir, entry.pack, entry.package_dir) == (True, None, 'Scripts/Script2')
+
+    def test_revalidation_and_persistence(self, repo):
+        """
+        Given
+            - A scanned repository whose directories were not modified since
+        When
+            - Getting its inventory again, in the same process and in a new one, and after adding a file
+        Then
+            - The inventory is reused as long as no directory was modified, and scanned again after the change by a
+              new process only
+        """
+        inventory = get_content_inventory()
+        assert inventory.is_up_to_date()
+        assert get_content_inventory() is inventory
+
+        content_inventory._inventories.clear()
+        loaded_inventory = get_content_inventory()
+        assert loaded_inventory is not inventory
+        assert loaded_inventory.children == inventory.children
+        assert loaded_inventory.scan_time == inventory.scan_time
+
+        (repo / 'Playbooks' / 'playbook-Playbook3.yml').write_text('{}')
+        assert not loaded_inventory.is_up_to_date()
+        assert get_content_inventory() is loaded_inventory
+
+        content_inventory._inventories.clear()
+        assert 'Playbooks/playbook-Playbook3.yml' in get_content_inventory().glob('Playbooks', '*.yml')
+
+    def test_racy_scan(self, repo, monkeypatch):
+        """
+        Given
+            - A repository whose directories were just modified
+        When
+            - Getting its inventory several times in a process, and then in a new process
+        Then
+            - It is scanned once by the process, and scanned again by the new process only
+        """
+        os.utime(str(repo / 'Playbooks'))
+        scans = []
+        original_scan = ContentInventory.scan
+
+        def counted_scan(inventory):
+            scans.append(inventory)
+            original_scan(inventory)
+
+        monkeypatch.setattr(ContentInventory, 'scan', counted_scan)
+        inventory = get_content_inventory()
+        assert not inventory.is_up_to_date()
+        assert all(get_content_inventory() is inventory for _ in range(10))
+        assert len(scans) == 1
+
+        content_inventory._inventories.clear()
+        assert get_content_inventory() is not inventory
+        assert len(scans) == 2
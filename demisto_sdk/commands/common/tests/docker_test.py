@@ -1,8 +1,14 @@
 import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from mock import patch
 import pytest
 from demisto_sdk.commands.common.tools import get_yaml
-from demisto_sdk.commands.common.hook_validations.docker import DockerImageValidator
+from demisto_sdk.commands.common.hook_validations import docker
+from demisto_sdk.commands.common.hook_validations.docker import DockerImageValidator, DockerTagResolver
 from demisto_sdk.commands.common.git_tools import git_path
 
 RETURN_ERROR_TARGET = 'GetDockerImageLatestTag.return_error'
@@ -179,3 +185,113 @@ def test_is_docker_image_latest_tag():
         docker_image_validator.is_latest_tag = True
         docker_image_validator.docker_image_tag = '1.3-alpine'
         assert docker_image_validator.is_docker_image_latest_tag() is True
+
+
+@pytest.fixture
+def docker_registry(tmp_path, monkeypatch):
+    """A local stand-in of docker hub and of the docker registry, demisto/old is listed only by the registry API"""
+    hub_tags = {
+        '/v2/repositories/demisto/python3/tags': MOCK_TAG_LIST,
+        '/v2/repositories/demisto/pyjwt/tags': [dict(MOCK_TAG_LIST[0], name='1.0')],
+    }
+    registry_tags = {'/v2/demisto/old/tags/list': ['1.0.1', '1.0.10', '1.0.9', 'latest']}
+    requests_log = []
+
+    class RegistryHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_log.append(self.path)
+            time.sleep(0.05)
+            if self.path in hub_tags:
+                self.send_json({'results': hub_tags[self.path]})
+            elif self.path in registry_tags:
+                self.send_json({'tags': registry_tags[self.path]})
+            elif self.path == '/v2/':
+                self.send_json({})
+            else:
+                self.send_response(404)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+        def send_json(self, data):
+            content = json.dumps(data).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RegistryHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+    def get_resolver(ttl=3600):
+        return DockerTagResolver(str(tmp_path / 'docker_tags'), ttl=ttl, registry=url, hub_url=url)
+
+    (tmp_path / 'docker_tags').mkdir()
+    yield get_resolver, requests_log
+    server.shutdown()
+    server.server_close()
+
+
+class TestDockerTagResolver:
+    def test_coalescing(self, docker_registry):
+        """
+        Given
+            - Docker images listed by docker hub, and an image listed only by the registry API
+        When
+            - Resolving their latest tags concurrently, several times each
+        Then
+            - Each image is resolved once, by the latest date or the highest numbered tag
+        """
+        get_resolver, requests_log = docker_registry
+        resolver = get_resolver()
+        image_names = ['demisto/python3', 'demisto/old', 'demisto/python3', 'demisto/missing']
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tags = list(executor.map(resolver.get_latest_tag, image_names * 4))
+
+        assert tags == ['1.0.0.2876', '1.0.10', '1.0.0.2876', None] * 4
+        assert resolver.get_latest_tags(image_names) == {'demisto/python3': '1.0.0.2876', 'demisto/old': '1.0.10',
+                                                         'demisto/missing': None}
+        assert sorted(requests_log) == sorted([
+            '/v2/repositories/demisto/python3/tags', '/v2/repositories/demisto/old/tags', '/v2/',
+            '/v2/demisto/old/tags/list', '/v2/repositories/demisto/missing/tags', '/v2/',
+            '/v2/demisto/missing/tags/list'])
+
+    def test_persistence(self, docker_registry):
+        """
+        Given
+            - A tag resolved in a previous run
+        When
+            - Resolving it in a new run, expecting the same tag, expecting another tag, and with an expired TTL
+        Then
+            - The registry is asked again only for another expected tag and after the TTL
+        """
+        get_resolver, requests_log = docker_registry
+        assert get_resolver().get_latest_tag('demisto/python3') == '1.0.0.2876'
+        assert len(requests_log) == 1
+
+        assert get_resolver().get_latest_tag('demisto/python3', expected_tag='1.0.0.2876') == '1.0.0.2876'
+        assert len(requests_log) == 1
+        assert get_resolver().get_latest_tag('demisto/python3', expected_tag='1.0.0.3000') == '1.0.0.2876'
+        assert len(requests_log) == 2
+        assert get_resolver(ttl=0).get_latest_tag('demisto/python3') == '1.0.0.2876'
+        assert len(requests_log) == 3
+
+    def test_lazy_resolution(self, docker_registry, monkeypatch):
+        """
+        Given
+            - An integration using a demisto docker image with its latest tag
+        When
+            - Creating its docker image validator, and validating the docker image
+        Then
+            - The tag is resolved only by the validation
+        """
+        get_resolver, requests_log = docker_registry
+        monkeypatch.setattr(docker, '_docker_tag_resolvers', {os.getpid(): get_resolver()})
+        docker_image_validator = DockerImageValidator(TEST_INTEGRATION_FILE, is_modified_file=False,
+                                                      is_integration=True)
+        assert requests_log == []
+        assert docker_image_validator.is_docker_image_valid() is True
+        assert requests_log == ['/v2/repositories/demisto/pyjwt/tags']
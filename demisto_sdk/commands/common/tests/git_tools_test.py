@@ -0,0 +1,171 @@
+import subprocess
+
+from demisto_sdk.commands.common import git_tools
+from demisto_sdk.commands.common.git_tools import GitCatFile, GitContext, RemoteFilesReader
+
+
+def test_git_cat_file(tmp_path):
+    """
+    Given
+        - A git repo with a committed file in a directory
+    When
+        - Reading objects of the repo through a single GitCatFile process
+    Then
+        - Blobs and tree entries of the revision are returned, missing objects are None or empty
+    """
+    for args in (['init', '-q'], ['config', 'user.email', 'dev@example.com'], ['config', 'user.name', 'dev']):
+        subprocess.run(['git'] + args, check=True, cwd=str(tmp_path))
+    (tmp_path / 'Scripts').mkdir()
+    (tmp_path / 'Scripts' / 'script-A.yml').write_bytes(b'name: A\n\x00binary')
+    (tmp_path / 'Scripts' / 'script B.yml').write_text('name: B\n')
+    subprocess.run(['git', 'add', '.'], check=True, cwd=str(tmp_path))
+    subprocess.run(['git', 'commit', '-q', '-m', 'base'], check=True, cwd=str(tmp_path))
+
+    with GitCatFile(cwd=str(tmp_path)) as cat_file:
+        assert cat_file.get_blob('HEAD', 'Scripts/script-A.yml') == b'name: A\n\x00binary'
+        assert cat_file.get_blob('HEAD', 'Scripts/script B.yml') == b'name: B\n'
+        assert cat_file.get_blob('HEAD', 'Scripts/missing.yml') is None
+        assert cat_file.get_blob('HEAD', 'Scripts') is None
+        assert cat_file.get_tree_entries('HEAD', 'Scripts/') == ['script B.yml', 'script-A.yml']
+        assert cat_file.get_tree_entries('HEAD', 'Missing') == []
+        assert cat_file.get_blob('no-such-revision', 'Scripts/script-A.yml') is None
+
+
+def test_remote_files_reader(tmp_path, mocker):
+    """
+    Given
+        - A git repo with an origin/master remote tracking branch
+    When
+        - Reading files of master, and of a tag which is not available locally
+    Then
+        - The files of master are read from the local origin/master, a missing file is an empty dict
+        - The files of the tag are downloaded from GitHub
+        - Every file is read once
+    """
+    for args in (['init', '-q'], ['config', 'user.email', 'dev@example.com'], ['config', 'user.name', 'dev']):
+        subprocess.run(['git'] + args, check=True, cwd=str(tmp_path))
+    (tmp_path / 'Scripts').mkdir()
+    (tmp_path / 'Scripts' / 'script-A.yml').write_text('name: A\n')
+    (tmp_path / 'Scripts' / 'field.json').write_text('{"id": "field"}')
+    subprocess.run(['git', 'add', '.'], check=True, cwd=str(tmp_path))
+    subprocess.run(['git', 'commit', '-q', '-m', 'base'], check=True, cwd=str(tmp_path))
+    subprocess.run(['git', 'update-ref', 'refs/remotes/origin/master', 'HEAD'], check=True, cwd=str(tmp_path))
+    (tmp_path / 'Scripts' / 'script-A.yml').write_text('name: A changed\n')
+
+    remote_file_mock = mocker.patch.object(git_tools, 'get_remote_file', return_value={'name': 'remote'})
+    reader = RemoteFilesReader('origin/master', cwd=str(tmp_path))
+    reader.read_files(['Scripts/script-A.yml', 'Scripts/field.json', 'Scripts/missing.yml'])
+    assert reader.get_local_revision() == 'origin/master'
+    assert reader.get_file('Scripts/script-A.yml') == {'name': 'A'}
+    assert reader.get_file('Scripts/field.json') == {'id': 'field'}
+    assert reader.get_file('Scripts/missing.yml') == {}
+    assert not remote_file_mock.called
+
+    reader = RemoteFilesReader('19.10.0', cwd=str(tmp_path))
+    assert reader.get_file('Scripts/script-A.yml') == {'name': 'remote'}
+    assert reader.get_file('Scripts/script-A.yml') == {'name': 'remote'}
+    remote_file_mock.assert_called_once_with('Scripts/script-A.yml', '19.10.0')
+    reader.close()
+
+
+def test_git_context(tmp_path, monkeypatch, mocker):
+    """
+    Given
+        - A git repo with committed files, some of them changed in the working tree
+    When
+        - Getting the diffs of single paths and the changed files through a GitContext
+    Then
+        - The diff of each path is the same as `git diff <revision> <path>`, an unchanged path has an empty diff
+        - Each git command runs once, however many paths are queried, the tree diffs run outside of run_command
+    """
+    for args in (['init', '-q', '-b', 'master'], ['config', 'user.email', 'dev@example.com'],
+                 ['config', 'user.name', 'dev']):
+        subprocess.run(['git'] + args, check=True, cwd=str(tmp_path))
+    (tmp_path / 'Integrations' / 'A').mkdir(parents=True)
+    (tmp_path / 'Integrations' / 'A' / 'CHANGELOG.md').write_text(''.join(f'line {i}\n' for i in range(200)))
+    (tmp_path / 'Integrations' / 'A' / 'A.yml').write_text('name: A\n')
+    (tmp_path / 'config.yml').write_text('CONTENT_VERSION: "1"\n')
+    subprocess.run(['git', 'add', '.'], check=True, cwd=str(tmp_path))
+    subprocess.run(['git', 'commit', '-q', '-m', 'base'], check=True, cwd=str(tmp_path))
+    (tmp_path / 'Integrations' / 'A' / 'CHANGELOG.md').write_text(''.join(f'line {i}\n' for i in range(1, 201)))
+    (tmp_path / 'config.yml').write_text('CONTENT_VERSION: "2"\n')
+    monkeypatch.chdir(tmp_path)
+
+    def git_diff(*args):
+        return subprocess.run(['git', 'diff'] + list(args), check=True, stdout=subprocess.PIPE,
+                              universal_newlines=True).stdout
+
+    run_command = mocker.spy(git_tools, 'run_command')
+    git_context = GitContext()
+    assert git_context.get_current_branch() == 'master'
+    for path in ('Integrations/A/CHANGELOG.md', './config.yml', 'Integrations/A/A.yml'):
+        assert git_context.get_path_diff(path, 'HEAD') == git_diff('HEAD', path)
+        assert git_context.get_path_diff(path, 'HEAD', unified=100) == git_diff('--unified=100', 'HEAD', path)
+    assert git_context.get_path_diff('Integrations/A/A.yml', 'HEAD') == ''
+    assert git_context.get_name_only('HEAD') == ['Integrations/A/CHANGELOG.md', 'config.yml']
+    assert git_context.get_name_only('HEAD') == ['Integrations/A/CHANGELOG.md', 'config.yml']
+    assert run_command.call_count == 2
+
+
+def test_git_context_diff_warnings(tmp_path, monkeypatch, mocker):
+    """
+    Given
+        - A git repo with core.autocrlf, where `git diff` warns on stderr about the line endings of a changed path
+    When
+        - Getting the diffs of single paths against HEAD, and against an unknown revision
+    Then
+        - The warning does not fail the tree diff, the diffs of all the paths are taken out of it
+        - On an unknown revision each path falls back to its own `git diff`
+    """
+    for args in (['init', '-q', '-b', 'master'], ['config', 'user.email', 'dev@example.com'],
+                 ['config', 'user.name', 'dev']):
+        subprocess.run(['git'] + args, check=True, cwd=str(tmp_path))
+    (tmp_path / 'A.md').write_text('a\n')
+    (tmp_path / 'B.md').write_text('b\n')
+    subprocess.run(['git', 'add', '.'], check=True, cwd=str(tmp_path))
+    subprocess.run(['git', 'commit', '-q', '-m', 'base'], check=True, cwd=str(tmp_path))
+    subprocess.run(['git', 'config', 'core.autocrlf', 'true'], check=True, cwd=str(tmp_path))
+    (tmp_path / 'A.md').write_bytes(b'a\r\nchanged\r\n')
+    (tmp_path / 'B.md').write_bytes(b'b\nchanged\n')
+    monkeypatch.chdir(tmp_path)
+    assert 'warning' in subprocess.run(['git', 'diff', 'HEAD'], stderr=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                       universal_newlines=True).stderr
+
+    run_command = mocker.spy(git_tools, 'run_command')
+    git_context = GitContext()
+    assert '+changed' in git_context.get_path_diff('A.md', 'HEAD')
+    assert '+changed' in git_context.get_path_diff('B.md', 'HEAD')
+    assert not run_command.called
+
+    mocker.patch.object(git_tools, 'run_command', return_value='per path diff')
+    assert git_context.get_path_diff('A.md', 'no-such-revision') == 'per path diff'
+    git_tools.run_command.assert_called_once_with('git diff no-such-revision A.md', cwd=None)
+
+
+def test_get_path_added_lines(tmp_path, monkeypatch):
+    """
+    Given
+        - A committed file whose lines were changed, added and removed in the working tree, and a new staged file
+    When
+        - Getting the lines added since HEAD
+    Then
+        - The numbers of the changed and added lines are returned, None for the new file
+    """
+    for args in (['init', '-q', '-b', 'master'], ['config', 'user.email', 'dev@example.com'],
+                 ['config', 'user.name', 'dev']):
+        subprocess.run(['git'] + args, check=True, cwd=str(tmp_path))
+    (tmp_path / 'A.py').write_text(''.join(f'line {i}\n' for i in range(1, 11)))
+    subprocess.run(['git', 'add', '.'], check=True, cwd=str(tmp_path))
+    subprocess.run(['git', 'commit', '-q', '-m', 'base'], check=True, cwd=str(tmp_path))
+    lines = [f'line {i}\n' for i in range(1, 11)]
+    lines[1] = 'changed\n'
+    lines[5:7] = ['added\n', 'added\n', 'added\n']
+    del lines[-1]
+    (tmp_path / 'A.py').write_text(''.join(lines))
+    (tmp_path / 'B.py').write_text('new\n')
+    subprocess.run(['git', 'add', 'B.py'], check=True, cwd=str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    git_context = GitContext()
+    assert git_context.get_path_added_lines('A.py', 'HEAD') == {2, 6, 7, 8}
+    assert git_context.get_path_added_lines('B.py', 'HEAD') is None
@@ -0,0 +1,145 @@
+import json
+from collections import OrderedDict
+
+from demisto_sdk.commands.common.id_set import IDSet, IDSetSection, ReverseDependencyIndex, as_id_set_section
+
+ID_SET = OrderedDict([
+    ('scripts', [
+        {'script1': {'name': 'Script 1', 'file_path': 'Packs/Pack1/Scripts/script1.yml', 'pack': 'Pack1'}},
+        {'script2': {'name': 'Script 2', 'file_path': 'Scripts/script2.yml', 'toversion': '4.9.9'}},
+        {'script2': {'name': 'Script 2', 'file_path': 'Packs/Pack1/Scripts/script2.yml', 'fromversion': '5.0.0',
+                     'pack': 'Pack1'}},
+    ]),
+    ('playbooks', [
+        {'playbook1': {'name': 'Playbook 1', 'file_path': 'Playbooks/playbook1.yml',
+                       'implementing_scripts': ['script1']}},
+    ]),
+])
+
+
+class TestIDSetSection:
+    def test_lookups(self):
+        """
+        Given
+            - An id_set section with two entries of the same id
+        When
+            - Looking up entries by id, name, pack and file path
+        Then
+            - All the matching entries are returned, in the order of the section
+        """
+        section = IDSetSection(ID_SET['scripts'])
+        assert section.get_ids() == ['script1', 'script2']
+        assert section.has_id('script2')
+        assert not section.has_id('script3')
+        file_paths = [data['file_path'] for data in section.get_by_id('script2')]
+        assert file_paths == ['Scripts/script2.yml', 'Packs/Pack1/Scripts/script2.yml']
+        assert section.get_entries('script3') == []
+        assert len(section.get_by_name('Script 2')) == 2
+        assert [list(entry) for entry in section.get_by_pack('Pack1')] == [['script1'], ['script2']]
+        assert section.get_by_file_path('Scripts/script2.yml') == [ID_SET['scripts'][1]]
+
+    def test_indexes_follow_changes(self):
+        """
+        Given
+            - An indexed id_set section
+        When
+            - Appending, updating and removing entries
+        Then
+            - The lookups reflect the changes
+        """
+        section = IDSetSection(ID_SET['scripts'])
+        assert not section.has_id('script3')
+        section.append({'script3': {'name': 'Script 3'}})
+        assert section.get_by_name('Script 3') == [{'script3': {'name': 'Script 3'}}]
+
+        section.update_entry(section.get_entries('script3')[0], {'name': 'Script 3 renamed'})
+        assert section.get_by_name('Script 3') == []
+        assert section.get_by_id('script3') == [{'name': 'Script 3 renamed'}]
+
+        del section[-1]
+        assert not section.has_id('script3')
+
+    def test_as_id_set_section(self):
+        section = IDSetSection()
+        assert as_id_set_section(section) is section
+        assert as_id_set_section(None) == []
+        assert as_id_set_section(ID_SET['playbooks']).get_ids() == ['playbook1']
+
+
+class TestIDSet:
+    def test_load_and_dump_keep_the_layout(self, tmp_path):
+        """
+        Given
+            - An id_set.json file
+        When
+            - Loading it as an IDSet and dumping it back
+        Then
+            - The dumped file is identical to the loaded one
+            - The sections are indexed
+        """
+        id_set_path = str(tmp_path / 'id_set.json')
+        with open(id_set_path, 'w') as id_set_file:
+            json.dump(ID_SET, id_set_file, indent=4)
+
+        id_set = IDSet.load(id_set_path)
+        assert isinstance(id_set['scripts'], IDSetSection)
+        assert id_set.get_section('playbooks').get_by_id('playbook1')[0]['name'] == 'Playbook 1'
+        assert id_set.get_section('Layouts') == []
+
+        dumped_id_set_path = str(tmp_path / 'dumped_id_set.json')
+        id_set.dump(dumped_id_set_path)
+        with open(id_set_path) as id_set_file, open(dumped_id_set_path) as dumped_id_set_file:
+            assert id_set_file.read() == dumped_id_set_file.read()
+
+    def test_find(self):
+        id_set = IDSet(ID_SET)
+        assert [section for section, _ in id_set.find('script2')] == ['scripts', 'scripts']
+        assert id_set.find('script3') == []
+
+
+class TestReverseDependencyIndex:
+    ID_SET = {
+        'scripts': [
+            {'script1': {'name': 'Script 1', 'depends_on': ['script2', 'cmd1'], 'script_executions': ['cmd2']}},
+            {'script2': {'name': 'Script 2'}},
+        ],
+        'playbooks': [
+            {'playbook1': {'name': 'Playbook 1', 'implementing_scripts': ['script2'],
+                           'implementing_playbooks': ['playbook2'],
+                           'command_to_integration': {'cmd1': 'integration1', 'cmd3': ''},
+                           'tests': ['test_playbook1']}},
+        ],
+        'TestPlaybooks': [
+            {'test_playbook1': {'name': 'Test Playbook 1', 'implementing_scripts': ['script2']}},
+        ],
+    }
+
+    def test_queries(self):
+        """
+        Given
+            - An id_set with scripts, playbooks and test playbooks using each other
+        When
+            - Building the reverse dependency index and querying it
+        Then
+            - The consumers of each item are found through all of its relations
+        """
+        index = ReverseDependencyIndex.from_id_set(IDSet(self.ID_SET))
+        script1 = ('scripts', 'script1', 'Script 1')
+        playbook1 = ('playbooks', 'playbook1', 'Playbook 1')
+        test_playbook1 = ('TestPlaybooks', 'test_playbook1', 'Test Playbook 1')
+        assert index.get_script_consumers('script2') == [playbook1, test_playbook1, script1]
+        assert index.get_playbook_consumers('playbook2') == [playbook1]
+        assert index.get_command_consumers('cmd1') == [playbook1, script1]
+        assert index.get_command_consumers('cmd2') == [script1]
+        assert index.get_integration_consumers('integration1') == [playbook1]
+        assert index.get_integration_consumers('integration2', commands=['cmd2', 'cmd3']) == [script1, playbook1]
+        assert index.get_tested_entries('test_playbook1') == [playbook1]
+        assert index.get_script_consumers('script1') == []
+
+    def test_dump_and_load(self, tmp_path):
+        index_path = str(tmp_path / 'reverse_dependencies.json')
+        index = ReverseDependencyIndex.from_id_set(self.ID_SET)
+        index.dump(index_path)
+        loaded_index = ReverseDependencyIndex.load(index_path)
+        assert loaded_index.to_dict() == index.to_dict()
+        assert set(loaded_index.get_script_consumers('script2')) == set(index.get_script_consumers('script2'))
@@ -6,6 +6,10 @@ from copy import deepcopy
 from demisto_sdk.commands.common.constants import FETCH_REQUIRED_PARAMS, FEED_REQUIRED_PARAMS
 from demisto_sdk.commands.common.hook_validations.structure import StructureValidator
 from demisto_sdk.commands.common.hook_validations.integration import IntegrationValidator
+from demisto_sdk.commands.common.git_tools import git_path
+
+FEED_INTEGRATION_PATH = f'{git_path()}/demisto_sdk/tests/test_files/content_repo_example/Packs/FeedAzure/' \
+                        f'Integrations/FeedAzure/FeedAzure.yml'
 
 
 def mock_structure(file_path=None, current_file=None, old_file=None):
@@ -520,6 +524,19 @@ class TestIsFeedParamsExist:
 
         assert self.validator.all_feed_params_exist() is False, 'all_feed_params_exist() returns True instead False'
 
+    def test_feed_with_default_values(self):
+        """
+        Given
+            - A feed integration file whose params have default values, loaded as a read only cached document
+        When
+            - Validating the feed
+        Then
+            - The feed is valid, and the cached document keeps the default values
+        """
+        structure = StructureValidator(FEED_INTEGRATION_PATH, is_new_file=True)
+        assert IntegrationValidator(structure).is_valid_feed()
+        assert any('defaultvalue' in param for param in structure.current_file['configuration'])
+
     NO_HIDDEN = {"configuration": [{"id": "new", "name": "new", "display": "test"}, {"d": "123", "n": "s", "r": True}]}
     HIDDEN_FALSE = {"configuration": [{"id": "n", "hidden": False}, {"display": "123", "name": "serer"}]}
     HIDDEN_TRUE = {"configuration": [{"id": "n", "n": "n"}, {"display": "123", "required": "false", "hidden": True}]}
@@ -0,0 +1,69 @@
+import re
+
+import pytest
+
+from demisto_sdk.commands.common.constants import CHECKED_TYPES_REGEXES, CODE_FILES_REGEX, \
+    FILE_TYPES_PATHS_TO_VALIDATE, SCHEMA_TO_REGEX
+from demisto_sdk.commands.common.path_classifier import PathClassifier
+
+PATHS = [
+    'Integrations/Gmail/Gmail.yml', './Integrations/Gmail/Gmail.py', 'Integrations/Gmail/Gmail_test.py',
+    'Integrations/Gmail/Other.py', 'integrations/gmail/GMAIL.js', 'Integrations/integration-Gmail.yml',
+    'Scripts/Sleep/Sleep.yml', 'Scripts/Sleep/Sleep.ps1', 'Scripts/script-Sleep.yml', 'Playbooks/playbook-A.yml',
+    'TestPlaybooks/playbook-A_test.yml', 'Packs/A/Integrations/B/B.yml', 'Packs/A/Integrations/B/B_test.py',
+    'Packs/A/Scripts/C/C.py', 'Packs/A/Scripts/C/D.py', 'Packs/A/Playbooks/playbook.yml', 'Packs/A/README.md',
+    'Layouts/layout-A.json', 'Misc/reputations.json', 'Widgets/widget-A.json', 'Reports/report-A.json',
+    'IncidentFields/incidentfield-A.json', 'content/Integrations/Gmail/Gmail.yml', 'README.md', '',
+]
+
+
+def get_first_match(regexes, path, search=False):
+    for regex in regexes:
+        if (re.search if search else re.match)(regex, path, re.IGNORECASE):
+            return regex
+    return None
+
+
+class TestPathClassifier:
+    @pytest.mark.parametrize('regexes', [CHECKED_TYPES_REGEXES, CODE_FILES_REGEX])
+    @pytest.mark.parametrize('search', [False, True])
+    def test_same_as_sequential_matching(self, regexes, search):
+        """
+        Given
+            - Regexes tables of constants, with and without numbered backreferences
+        When
+            - Classifying paths by matching or searching the regexes
+        Then
+            - The matching regex is the first one of the table to match the path, as with matching them one by one
+        """
+        classifier = PathClassifier.from_regexes(regexes, search=search)
+        for path in PATHS:
+            assert classifier.classify(path) == get_first_match(regexes, path, search=search), path
+
+    def test_from_dict(self):
+        scheme_classifier = PathClassifier.from_dict(SCHEMA_TO_REGEX)
+        file_type_classifier = PathClassifier.from_dict(FILE_TYPES_PATHS_TO_VALIDATE, search=True)
+        for path in PATHS:
+            expected_scheme = next((scheme for scheme, regexes in SCHEMA_TO_REGEX.items()
+                                    if get_first_match(regexes, path)), None)
+            assert scheme_classifier.classify(path) == expected_scheme, path
+            expected_file_type = next((file_type for file_type, regexes in FILE_TYPES_PATHS_TO_VALIDATE.items()
+                                       if get_first_match(regexes, path, search=True)), None)
+            assert file_type_classifier.classify(path) == expected_file_type, path
+
+    def test_order_and_cache(self):
+        """
+        Given
+            - A table in which a later regex matches earlier in the path than the first regex
+        When
+            - Searching a path matched by both
+        Then
+            - The first regex of the table wins, and the result is cached
+        """
+        classifier = PathClassifier([('second part', r'b/c'), ('first part', r'a/b'), ('group', r'(x)(?P<y>y)')],
+                                    search=True)
+        assert classifier.get_match('a/b/c') == ('second part', r'b/c')
+        assert classifier.classify('1/x/y') is None
+        assert classifier.classify('1/xy') == 'group'
+        assert classifier.classify('d') is None
+        assert classifier._matches == {'a/b/c': 0, '1/x/y': -1, '1/xy': 2, 'd': -1}
@@ -1,4 +1,6 @@
 import pytest
+import shutil
+from demisto_sdk.commands.common.hook_validations import readme
 from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
 from demisto_sdk.commands.common.git_tools import git_path
 import os
@@ -19,3 +21,87 @@ def test_is_file_valid(current, answer):
     env_var = os.environ.get('DEMISTO_README_VALIDATION')
     if valid and env_var:
         assert readme_validator.is_valid_file() is answer
+
+
+FAKE_MDX_WORKER = """
+const readline = require('readline');
+const fs = require('fs');
+readline.createInterface({input: process.stdin, terminal: false}).on('line', (line) => {
+    const request = JSON.parse(line);
+    const contents = fs.readFileSync(request.file, 'utf8');
+    const error = contents.includes('<invalid') ? `${process.pid}: unclosed tag` : null;
+    if (contents.includes('<warning')) {
+        process.stderr.write('a warning\\n');
+    }
+    if (contents.includes('<crash')) {
+        process.stderr.write('crashed\\n');
+        process.exit(1);
+    }
+    // <once writes a stray line only the first time the file is parsed
+    if (contents.includes('<stray') || (contents.includes('<once') && !fs.existsSync(`${request.file}.seen`))) {
+        fs.writeFileSync(`${request.file}.seen`, '');
+        process.stdout.write('a deprecation notice\\n');
+        process.stderr.write('stray output\\n');
+    }
+    process.stdout.write(`${JSON.stringify({id: request.id, error: error})}\\n`);
+});
+"""
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_mdx_worker(tmp_path, monkeypatch):
+    """
+    Given
+        - A worker script which fails the files containing an invalid tag
+    When
+        - Parsing several files, parsing another one after the worker exited, parsing a file the worker crashes on
+          after it warned about another file, and parsing files the worker writes other output than its response for
+    Then
+        - The errors are returned by a single worker process, which is started again once it exited or once its
+          output could not be read
+        - The error of a crash is only what the worker wrote to stderr for the crashing file
+        - A file the worker wrote other output for is parsed again by a new worker, and is failed only if the new
+          worker also writes other output for it
+    """
+    worker_script = tmp_path / 'mdx-worker.js'
+    worker_script.write_text(FAKE_MDX_WORKER)
+    monkeypatch.setattr(readme, 'MDX_WORKER_SCRIPT', worker_script)
+    valid_md = tmp_path / 'valid.md'
+    valid_md.write_text('## Valid')
+    invalid_md = tmp_path / 'invalid.md'
+    invalid_md.write_text('<invalid')
+
+    worker = readme.MDXWorker(tmp_path, tmp_path / 'node_modules')
+    try:
+        assert worker.parse(valid_md) is None
+        pid = worker.process.pid
+        assert worker.parse(invalid_md) == f'{pid}: unclosed tag'
+        assert worker.parse(valid_md) is None
+        assert worker.process.pid == pid
+
+        worker.close()
+        assert worker.parse(invalid_md).endswith(': unclosed tag')
+        assert worker.process.pid != pid
+
+        warning_md = tmp_path / 'warning.md'
+        warning_md.write_text('<warning')
+        crash_md = tmp_path / 'crash.md'
+        crash_md.write_text('<crash')
+        assert worker.parse(warning_md) is None
+        assert worker.parse(crash_md) == 'crashed'
+
+        stray_output_once_md = tmp_path / 'stray_output_once.md'
+        stray_output_once_md.write_text('<once')
+        assert worker.parse(valid_md) is None
+        pid = worker.process.pid
+        assert worker.parse(stray_output_once_md) is None
+        assert worker.process.pid != pid
+
+        stray_output_md = tmp_path / 'stray_output.md'
+        stray_output_md.write_text('<stray')
+        pid = worker.process.pid
+        assert worker.parse(stray_output_md) == 'stray output'
+        assert worker.parse(valid_md) is None
+        assert worker.process.pid != pid
+    finally:
+        worker.close()
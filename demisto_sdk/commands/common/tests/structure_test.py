@@ -4,6 +4,7 @@ from shutil import copyfile
 from typing import List, Tuple
 import pytest
 import yaml
+from pykwalify.compat import yml
 
 from demisto_sdk.commands.common.constants import DIR_LIST
 from demisto_sdk.commands.common.hook_validations.structure import StructureValidator
@@ -65,6 +66,26 @@ class TestStructureValidator:
         validator = StructureValidator(file_path=path)
         assert validator.is_valid_scheme() is answer, error
 
+    def test_scheme_validation_loads_schema_once(self, mocker):
+        """
+        Given
+            - A file validated twice against the same scheme
+        When
+            - Validating the scheme
+        Then
+            - The schema and the file are loaded only once
+            - The validation result does not change
+        """
+        mocker.patch.object(StructureValidator, 'scheme_of_file_by_path', return_value='playbook')
+        mocker.patch.dict(StructureValidator._schemas, clear=True)
+        yml_load = mocker.spy(yml, 'load')
+        for path, answer in ((INVALID_PLAYBOOK_PATH, False), (INVALID_PLAYBOOK_PATH, False),
+                             (VALID_TEST_PLAYBOOK_PATH, True)):
+            assert StructureValidator(file_path=path).is_valid_scheme() is answer
+        loaded_paths = [os.path.basename(call[0][0].name) for call in yml_load.call_args_list]
+        assert loaded_paths.count('playbook.yml') == 1
+        assert loaded_paths.count(os.path.basename(INVALID_PLAYBOOK_PATH)) <= 1
+
     SCHEME_VALIDATION_INDICATORFIELDS = [
         (INDICATORFIELD_EXACT_SCHEME, INCIDENT_FIELD_TARGET, True),
         (INDICATORFIELD_EXTRA_FIELDS, INCIDENT_FIELD_TARGET, True),
@@ -1,6 +1,13 @@
 import os
+import copy
 import glob
+import pickle
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
+import yaml
 
 from demisto_sdk.commands.common.git_tools import git_path
 from demisto_sdk.commands.common import tools
@@ -98,6 +105,116 @@ class TestGetRemoteFile:
         assert not invalid_yml
 
 
+@pytest.fixture
+def content_server(tmp_path, monkeypatch):
+    """A local stand-in of the raw GitHub content server, serving files with an ETag and honoring If-None-Match.
+
+    A file whose content is an int is answered with that status code.
+    """
+    files = {'/master/Scripts/script-A.yml': b'name: A\n'}
+    requests_log = []
+
+    class ContentHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_log.append((self.path, self.headers.get('If-None-Match')))
+            content = files.get(self.path, 404)
+            if isinstance(content, int):
+                self.send_response(content)
+                self.end_headers()
+                return
+
+            etag = '"{}"'.format(hashlib.sha1(content).hexdigest())
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ContentHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(tools, 'CONTENT_GITHUB_LINK', 'http://127.0.0.1:{}'.format(server.server_address[1]))
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path / 'cache'))
+    yield files, requests_log
+    server.shutdown()
+    server.server_close()
+
+
+class TestRemoteFilesCache:
+    def test_revalidation(self, content_server):
+        """
+        Given
+            - A file served with an ETag
+        When
+            - Getting it, getting it again, and getting it after it changed
+        Then
+            - The cached copy is revalidated with If-None-Match, and downloaded again only after it changed
+        """
+        files, requests_log = content_server
+        assert tools.get_remote_file('Scripts/script-A.yml') == {'name': 'A'}
+        assert tools.get_remote_file('Scripts/script-A.yml') == {'name': 'A'}
+        etag = requests_log[-1][1]
+        assert etag and requests_log == [('/master/Scripts/script-A.yml', None), ('/master/Scripts/script-A.yml', etag)]
+
+        files['/master/Scripts/script-A.yml'] = b'name: A changed\n'
+        assert tools.get_remote_file('Scripts/script-A.yml') == {'name': 'A changed'}
+        assert tools.get_remote_file('Scripts/script-A.yml') == {'name': 'A changed'}
+        assert requests_log[-1][1] != etag
+
+    def test_missing_file_and_offline(self, content_server, monkeypatch):
+        """
+        Given
+            - A cached file, and a file which does not exist
+        When
+            - Getting them while the server is available, and while it is not
+        Then
+            - The missing file is an empty dict
+            - The cached file is used when the server can not be reached
+        """
+        assert tools.get_remote_file('Scripts/missing.yml') == {}
+        assert tools.get_remote_file('Scripts/script-A.yml') == {'name': 'A'}
+
+        monkeypatch.setattr(tools, 'CONTENT_GITHUB_LINK', 'http://127.0.0.1:1')
+        assert tools.get_remote_file('Scripts/script-A.yml') == {'name': 'A'}
+        assert tools.get_remote_file('Scripts/missing.yml') == {}
+
+    @pytest.mark.parametrize('status_code, is_cache_used', [(500, True), (429, True), (403, True), (404, False),
+                                                            (410, False)])
+    def test_http_error(self, content_server, status_code, is_cache_used):
+        """
+        Given
+            - A cached file
+        When
+            - Getting it while the server answers with an HTTP error
+        Then
+            - The cached copy is used and kept on transient errors, and deleted when the file does not exist
+        """
+        files, _ = content_server
+        assert tools.get_remote_file('Scripts/script-A.yml') == {'name': 'A'}
+
+        files['/master/Scripts/script-A.yml'] = status_code
+        assert tools.get_remote_file('Scripts/script-A.yml') == ({'name': 'A'} if is_cache_used else {})
+        assert tools.get_remote_file('Scripts/script-A.yml') == ({'name': 'A'} if is_cache_used else {})
+
+    def test_get_remote_files(self, content_server):
+        files, requests_log = content_server
+        for i in range(20):
+            files['/master/Scripts/script-{}.yml'.format(i)] = 'name: {}\n'.format(i).encode('utf-8')
+
+        file_paths = ['Scripts/script-{}.yml'.format(i) for i in range(20)] + ['Scripts/missing.yml']
+        remote_files = tools.get_remote_files(file_paths, max_workers=4)
+        assert list(remote_files) == file_paths
+        assert [remote_files[file_path].get('name') for file_path in file_paths] == list(range(20)) + [None]
+        assert len(requests_log) == 21
+
+
 class TestGetMatchingRegex:
     INPUTS = [
         ('Packs/XDR/Playbooks/XDR.yml', [PACKS_PLAYBOOK_YML_REGEX, PACKS_TEST_PLAYBOOKS_REGEX],
@@ -125,3 +242,76 @@ class TestServerVersionCompare:
     @pytest.mark.parametrize("left, right, answer", INPUTS)
     def test_server_version_compare(self, left, right, answer):
         assert server_version_compare(left, right) == answer
+
+
+class TestDocumentsCache:
+    YML = 'name: test\ntests:\n- test1\nscript:\n  commands:\n  - name: command1\n'
+
+    def test_load_once(self, tmp_path, mocker):
+        """
+        Given
+            - A yml file
+        When
+            - Loading it a few times, then changing it and loading it again
+        Then
+            - The file is parsed once until it is changed
+            - The document is the same as the one yaml.safe_load returns
+        """
+        file_path = str(tmp_path / 'test.yml')
+        with open(file_path, 'w') as f:
+            f.write(self.YML)
+        load_function = mocker.Mock(side_effect=tools.yaml_safe_load)
+        cache = tools.DocumentsCache()
+
+        document = cache.load(file_path, load_function)
+        assert document == yaml.safe_load(self.YML)
+        assert cache.load(file_path, load_function) is document
+        assert load_function.call_count == 1
+
+        with open(file_path, 'w') as f:
+            f.write(self.YML.replace('test1', 'test2 changed'))
+        assert cache.load(file_path, load_function)['tests'] == ['test2 changed']
+        assert load_function.call_count == 2
+
+    def test_lru(self, tmp_path, mocker):
+        file_paths = [str(tmp_path / 'test{}.yml'.format(index)) for index in range(3)]
+        for file_path in file_paths:
+            with open(file_path, 'w') as f:
+                f.write(self.YML)
+        load_function = mocker.Mock(side_effect=tools.yaml_safe_load)
+        cache = tools.DocumentsCache(max_size=2)
+
+        cache.load(file_paths[0], load_function)
+        cache.load(file_paths[1], load_function)
+        cache.load(file_paths[0], load_function)
+        cache.load(file_paths[2], load_function)  # evicts the least recently used - file_paths[1]
+        assert load_function.call_count == 3
+        cache.load(file_paths[0], load_function)
+        assert load_function.call_count == 3
+        cache.load(file_paths[1], load_function)
+        assert load_function.call_count == 4
+
+    def test_read_only(self):
+        """
+        Given
+            - A read only view of a document
+        When
+            - Changing it, copying it and pickling it
+        Then
+            - Changes fail, deep copies and unpickled copies are regular changeable objects
+        """
+        document = tools.make_read_only(yaml.safe_load(self.YML))
+        with pytest.raises(TypeError):
+            document['name'] = 'changed'
+        with pytest.raises(TypeError):
+            document['tests'].append('test2')
+        with pytest.raises(TypeError):
+            document['script']['commands'][0].update({'name': 'changed'})
+        assert isinstance(document, dict)
+
+        for document_copy in (copy.deepcopy(document), pickle.loads(pickle.dumps(document))):
+            assert document_copy == document
+            assert type(document_copy) is dict and type(document_copy['tests']) is list
+            document_copy['tests'].append('test2')
+            document_copy['script']['commands'][0]['name'] = 'changed'
+        assert document == yaml.safe_load(self.YML)
@@ -1,11 +1,18 @@
 import unittest
+import itertools
+import random
 import pytest
 import os
 import json
+import shutil
 import sys
+import subprocess
 import tempfile
 from demisto_sdk.commands.common.update_id_set import has_duplicate, get_integration_data, get_script_data, get_playbook_data, \
-    re_create_id_set, find_duplicates
+    re_create_id_set, find_duplicates, get_id_set_manifest_path, add_result_to_id_set_sections, get_chunk_size, \
+    get_version_range, is_version_ranges_overlap, has_overlapping_version_ranges, get_reverse_dependencies_path, \
+    parse_shard, merge_id_set_shards, update_id_set, load_reverse_dependencies
+from demisto_sdk.commands.common.id_set import ReverseDependencyIndex
 from demisto_sdk.commands.common.git_tools import git_path
 
 WIDGET_DATA = {
@@ -158,6 +165,56 @@ def test_had_duplicates(id_set, id_to_check, result):
     assert result == has_duplicate(id_set, id_to_check)
 
 
+def test_has_duplicate_warns_on_different_names(mocker):
+    """
+    Given
+        - Three entries of the same id, two of them with the same name, and entries with overlapping versions
+    When
+        - Checking for duplicates
+    Then
+        - A warning is printed for each pair of entries with different names, up to the first overlapping pair
+    """
+    from demisto_sdk.commands.common import update_id_set
+    print_warning = mocker.patch.object(update_id_set, 'print_warning')
+    id_set = [
+        {'Test': {'name': 'Name1', 'toversion': '4.0.0'}},
+        {'Test': {'name': 'Name1', 'fromversion': '4.0.0', 'toversion': '5.0.0'}},
+        {'Test': {'name': 'Name2', 'fromversion': '5.0.0'}},
+    ]
+    assert not has_duplicate(id_set, 'Test', 'scripts')
+    warning = 'The following scripts have the same ID (Test) but different names: "Name1", "Name2".'
+    assert print_warning.call_args_list == [mocker.call(warning), mocker.call(warning)]
+
+    print_warning.reset_mock()
+    id_set = [
+        {'Test': {'name': 'Name1'}},
+        {'Test': {'name': 'Name2'}},
+        {'Test': {'name': 'Name3'}},
+    ]
+    assert has_duplicate(id_set, 'Test', 'scripts')
+    print_warning.assert_called_once_with('The following scripts have the same ID (Test) but different names: '
+                                          '"Name1", "Name2".')
+
+
+def test_has_overlapping_version_ranges():
+    """
+    Given
+        - Random version ranges, including ranges which end before they start
+    When
+        - Checking whether any two of them overlap using the sort and sweep
+    Then
+        - The result is the same as checking every pair of ranges
+    """
+    versions = ['0.0.0', '3.5.0', '4.0.0', '4.1.0', '4.5.0', '5.0.0', '10.0.0', '99.99.99']
+    rand = random.Random(0)
+    for _ in range(2000):
+        version_ranges = [get_version_range({'fromversion': rand.choice(versions), 'toversion': rand.choice(versions)})
+                          for _ in range(rand.randint(2, 5))]
+        expected = any(is_version_ranges_overlap(range1, range2)
+                       for range1, range2 in itertools.combinations(version_ranges, 2))
+        assert has_overlapping_version_ranges(version_ranges) == expected, version_ranges
+
+
 INTEGRATION_DATA = {
     "Dummy Integration": {
         "name": "Dummy Integration",
@@ -347,5 +404,247 @@ class TestIntegration(unittest.TestCase):
             assert any('incident_account_field_dup_check' in i for i in dup_data)
 
 
+class TestIncrementalIDSet:
+    @staticmethod
+    def _copy_content_repo(tmp_path):
+        content_path = str(tmp_path / 'content')
+        shutil.copytree(os.path.join(TESTS_DIR, 'test_files', 'content_repo_example'), content_path)
+        return content_path
+
+    def test_incremental_equals_full_build(self, tmp_path, monkeypatch):
+        """
+        Given
+            - A content repo with an id_set manifest from a previous incremental run
+        When
+            - Changing a script and deleting an integration, then running an incremental build
+        Then
+            - The manifest is created next to the id_set
+            - The incremental id_set is identical to a full build of the same tree
+        """
+        monkeypatch.chdir(self._copy_content_repo(tmp_path))
+        re_create_id_set('incremental_id_set.json', incremental=True)
+        assert os.path.isfile(get_id_set_manifest_path('incremental_id_set.json'))
+
+        with open('Scripts/script-Sleep.yml') as f:
+            script = f.read()
+        with open('Scripts/script-Sleep.yml', 'w') as f:
+            f.write(script.replace('name: Sleep', 'name: SleepChanged'))
+        shutil.rmtree('Integrations/Securonix')
+
+        re_create_id_set('incremental_id_set.json', incremental=True)
+        re_create_id_set('full_id_set.json')
+
+        with open('incremental_id_set.json') as incremental, open('full_id_set.json') as full:
+            assert incremental.read() == full.read()
+        with open('incremental_id_set.json') as incremental:
+            id_set = json.load(incremental)
+        assert any(script.get('Sleep', {}).get('name') == 'SleepChanged' for script in id_set['scripts'])
+        assert not any('Securonix' in integration for integration in id_set['integrations'])
+
+    def test_manifest_of_another_sdk_version(self, tmp_path, monkeypatch):
+        """
+        Given
+            - An id_set manifest created by another demisto-sdk version
+        When
+            - Running an incremental build
+        Then
+            - The stored results are not used, all the files are processed again
+        """
+        from demisto_sdk.commands.common import update_id_set
+
+        monkeypatch.chdir(self._copy_content_repo(tmp_path))
+        re_create_id_set('incremental_id_set.json', incremental=True)
+        manifest_path = get_id_set_manifest_path('incremental_id_set.json')
+        assert update_id_set.IDSetManifest.load(manifest_path).sections
+
+        monkeypatch.setattr(update_id_set, 'get_sdk_version', lambda: 'another version')
+        assert update_id_set.IDSetManifest.load(manifest_path).sections == {}
+        re_create_id_set('incremental_id_set.json', incremental=True)
+        assert update_id_set.IDSetManifest.load(manifest_path).sections
+
+
+class TestIDSetWorkQueue:
+    def test_add_result_to_id_set_sections(self):
+        """
+        Given
+            - Results of the integrations and the test playbooks processors
+        When
+            - Routing the results back to the id_set sections
+        Then
+            - Test scripts are added to the scripts section, test playbooks to the TestPlaybooks section
+        """
+        sections = {'integrations': [], 'scripts': [], 'TestPlaybooks': []}
+        add_result_to_id_set_sections(sections, 'Integrations', [INTEGRATION_DATA])
+        add_result_to_id_set_sections(sections, 'TestPlaybooks', (None, SCRIPT_DATA))
+        add_result_to_id_set_sections(sections, 'TestPlaybooks', ({'Dummy Playbook': PLAYBOOK_DATA}, None))
+        assert sections == {'integrations': [INTEGRATION_DATA], 'scripts': [SCRIPT_DATA],
+                            'TestPlaybooks': [{'Dummy Playbook': PLAYBOOK_DATA}]}
+
+    @pytest.mark.parametrize('tasks_count, processes, chunk_size', [(0, 4, 1), (16, 4, 1), (17, 4, 2), (400, 2, 50)])
+    def test_get_chunk_size(self, tasks_count, processes, chunk_size):
+        assert get_chunk_size(tasks_count, processes) == chunk_size
+
+    def test_processes_count_does_not_change_the_output(self, tmp_path, monkeypatch):
+        """
+        Given
+            - A content repo
+        When
+            - Creating the id_set with a single process and with several processes
+        Then
+            - The created id_set is the same
+        """
+        monkeypatch.chdir(os.path.join(TESTS_DIR, 'test_files', 'content_repo_example'))
+        single_process_id_set = json.dumps(re_create_id_set(None, processes=1))
+        assert json.dumps(re_create_id_set(None, processes=4)) == single_process_id_set
+
+
+def test_re_create_id_set_reverse_dependencies(tmp_path, monkeypatch):
+    """
+    Given
+        - A content repo
+    When
+        - Creating the id_set with the reverse dependency index
+    Then
+        - The index is created next to the id_set and matches the created id_set, and it is not loaded once the
+          id_set is created again without it
+    """
+    monkeypatch.chdir(os.path.join(TESTS_DIR, 'test_files', 'content_repo_example'))
+    id_set_path = str(tmp_path / 'id_set.json')
+    id_set = re_create_id_set(id_set_path, reverse_dependencies=True)
+    index = ReverseDependencyIndex.load(get_reverse_dependencies_path(id_set_path))
+    assert index.to_dict() == ReverseDependencyIndex.from_id_set(id_set).to_dict()
+    assert load_reverse_dependencies(id_set_path).to_dict() == index.to_dict()
+
+    index_mtime = os.path.getmtime(get_reverse_dependencies_path(id_set_path))
+    os.utime(id_set_path, (index_mtime + 1, index_mtime + 1))
+    assert load_reverse_dependencies(id_set_path) is None
+
+
+class TestShardedIDSet:
+    @pytest.mark.parametrize('shard, expected', [('0/4', (0, 4)), (' 3/4 ', (3, 4)), ('0/1', (0, 1))])
+    def test_parse_shard(self, shard, expected):
+        assert parse_shard(shard) == expected
+
+    @pytest.mark.parametrize('shard', ['4/4', '1', '-1/4', 'a/b', '0/0'])
+    def test_parse_invalid_shard(self, shard):
+        with pytest.raises(ValueError):
+            parse_shard(shard)
+
+    def test_merged_shards_equal_full_build(self, tmp_path, monkeypatch):
+        """
+        Given
+            - A content repo
+        When
+            - Creating the id_set in 3 shards and merging them
+        Then
+            - The merged id_set is identical to a single node build
+            - Merging only a part of the shards fails
+        """
+        monkeypatch.chdir(os.path.join(TESTS_DIR, 'test_files', 'content_repo_example'))
+        full_id_set_path = str(tmp_path / 'full_id_set.json')
+        re_create_id_set(full_id_set_path, processes=2)
+
+        shard_paths = [str(tmp_path / 'id_set_shard_{}.json'.format(index)) for index in range(3)]
+        for index, shard_path in enumerate(shard_paths):
+            id_set_shard = re_create_id_set(shard_path, processes=2, shard=(index, 3))
+            assert id_set_shard.results
+        merged_id_set_path = str(tmp_path / 'merged_id_set.json')
+        merge_id_set_shards(reversed(shard_paths), merged_id_set_path)
+
+        with open(full_id_set_path) as full, open(merged_id_set_path) as merged:
+            assert merged.read() == full.read()
+
+        with pytest.raises(ValueError):
+            merge_id_set_shards(shard_paths[:2], merged_id_set_path)
+
+
+class TestUpdateIDSet:
+    SCRIPT_YML = 'commonfields:\n  id: {id}\nname: {name}\ntype: python\nscript: \'\'\n'
+    PLAYBOOK_YML = 'id: {id}\nname: {name}\ntasks:\n  "0":\n    task:\n      scriptName: {script}\n'
+
+    @staticmethod
+    def _write(path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+    @staticmethod
+    def _git(*args):
+        subprocess.run(['git'] + list(args), check=True, stdout=subprocess.PIPE)
+
+    @pytest.fixture()
+    def content_repo(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        self._git('init', '-q')
+        self._git('config', 'user.email', 'dev@example.com')
+        self._git('config', 'user.name', 'dev')
+        self._write('Scripts/script-Hello.yml', self.SCRIPT_YML.format(id='Hello', name='Hello'))
+        self._write('Scripts/Package/Package.yml', self.SCRIPT_YML.format(id='Package', name='Package'))
+        self._write('Scripts/Package/Package.py', 'demisto.results("ok")\n')
+        self._write('Scripts/Package/Package_test.py', 'demisto.executeCommand("ignored", {})\n')
+        id_set = {
+            'scripts': [
+                {'Hello': {'name': 'Hello', 'file_path': 'Scripts/script-Hello.yml'}},
+                {'Package': {'name': 'Package', 'file_path': 'Scripts/Package/Package.yml'}},
+            ],
+            'playbooks': [],
+            'integrations': [],
+            'TestPlaybooks': [],
+            'Layouts': [{'layout': {'name': 'layout'}}],
+        }
+        self._write('Tests/id_set.json', json.dumps(id_set, indent=4))
+        self._git('add', '.')
+        self._git('commit', '-q', '-m', 'base')
+        self._git('branch', 'base')
+
+        self._write('Scripts/script-Hello.yml', self.SCRIPT_YML.format(id='Hello', name='Hello Changed'))
+        self._write('Scripts/Package/Package.py', 'demisto.executeCommand("Hello", {})\n')
+        self._write('Playbooks/playbook-New.yml', self.PLAYBOOK_YML.format(id='New', name='New', script='Hello'))
+        self._git('add', '.')
+        self._git('commit', '-q', '-m', 'change')
+        return tmp_path
+
+    def test_update_id_set_from_revision(self, content_repo):
+        """
+        Given
+            - A commit changing a script, the code of a script package and adding a playbook
+            - An uncommitted change of the script
+        When
+            - Updating the id_set from the commit range of the change
+        Then
+            - The id_set is updated with the committed content, the working tree is not used
+            - The sections which are not updated are kept
+        """
+        self._write('Scripts/script-Hello.yml', self.SCRIPT_YML.format(id='Hello', name='Hello Uncommitted'))
+        update_id_set('Tests/id_set.json', prev_ver='base', revision='HEAD')
+
+        with open('Tests/id_set.json') as f:
+            id_set = json.load(f)
+        assert id_set['scripts'] == [
+            {'Hello': {'name': 'Hello Changed', 'file_path': 'Scripts/script-Hello.yml'}},
+            {'Package': {'name': 'Package', 'file_path': 'Scripts/Package/Package.yml',
+                         'script_executions': ['Hello']}},
+        ]
+        assert id_set['playbooks'] == [{'New': {'name': 'New', 'file_path': 'Playbooks/playbook-New.yml',
+                                                'implementing_scripts': ['Hello']}}]
+        assert id_set['Layouts'] == [{'layout': {'name': 'layout'}}]
+
+    def test_update_id_set_from_working_tree(self, content_repo):
+        """
+        Given
+            - A commit changing a script and an uncommitted change of the same script
+        When
+            - Updating the id_set from the working tree
+        Then
+            - The id_set is updated with the uncommitted content
+        """
+        self._write('Scripts/script-Hello.yml', self.SCRIPT_YML.format(id='Hello', name='Hello Uncommitted'))
+        update_id_set('Tests/id_set.json', prev_ver='base')
+
+        with open('Tests/id_set.json') as f:
+            id_set = json.load(f)
+        assert id_set['scripts'][0] == {'Hello': {'name': 'Hello Uncommitted', 'file_path': 'Scripts/script-Hello.yml'}}
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,11 +1,18 @@
 import re
 import os
 import sys
+import copy
 import json
 import glob
+import base64
+import hashlib
 import argparse
+import threading
+import concurrent.futures
 from subprocess import Popen, PIPE, DEVNULL, check_output
 from distutils.version import LooseVersion
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Union, Optional, Tuple, Dict, List
 import git
 import shlex
@@ -13,10 +20,12 @@ from pathlib import Path
 import urllib3
 import yaml
 import requests
+from pkg_resources import DistributionNotFound, get_distribution
 
 from demisto_sdk.commands.common.constants import CHECKED_TYPES_REGEXES, PACKAGE_SUPPORTING_DIRECTORIES, \
     CONTENT_GITHUB_LINK, PACKAGE_YML_FILE_REGEX, UNRELEASE_HEADER, RELEASE_NOTES_REGEX, PACKS_DIR, PACKS_DIR_REGEX, \
-    DEF_DOCKER, DEF_DOCKER_PWSH, TYPE_PWSH, SDK_API_GITHUB_RELEASES, PACKS_CHANGELOG_REGEX
+    DEF_DOCKER, DEF_DOCKER_PWSH, TYPE_PWSH, SDK_API_GITHUB_RELEASES, PACKS_CHANGELOG_REGEX, DEFAULT_CACHE_DIR
+from demisto_sdk.commands.common.path_classifier import get_regexes_classifier
 
 # disable insecure warnings
 urllib3.disable_warnings()
@@ -31,6 +40,9 @@ class LOG_COLORS:
 
 LOG_VERBOSE = False
 
+# the maximal number of concurrent downloads of files from GitHub
+REMOTE_FILES_MAX_WORKERS = 8
+
 
 def set_log_verbose(verbose: bool):
     global LOG_VERBOSE
@@ -98,29 +110,161 @@ def run_command(command, is_silenced=True, exit_on_error=True, cwd=None):
     return output
 
 
-def get_remote_file(full_file_path, tag='master'):
+@lru_cache(maxsize=None)
+def get_sdk_version() -> str:
+    """Get the installed demisto-sdk version, an empty string if it is not installed"""
+    try:
+        return get_distribution('demisto-sdk').version
+    except DistributionNotFound:
+        return ''
+
+
+def get_cache_dir(name: str) -> str:
+    """Get the directory of an on disk cache of demisto-sdk, creating it if needed.
+
+    The caches are kept under $DEMISTO_SDK_CACHE_DIR, ~/.demisto-sdk/cache by default.
+    """
+    cache_dir = os.path.join(os.environ.get('DEMISTO_SDK_CACHE_DIR') or DEFAULT_CACHE_DIR, name)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+# pid -> the http session of the process, a forked process does not reuse the connections of its parent
+_http_sessions: Dict[int, requests.Session] = {}
+
+
+def get_http_session() -> requests.Session:
+    """Get the shared http session of the process, keeping its connections alive between requests"""
+    pid = os.getpid()
+    if pid not in _http_sessions:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=REMOTE_FILES_MAX_WORKERS,
+                                                pool_maxsize=REMOTE_FILES_MAX_WORKERS)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _http_sessions[pid] = session
+    return _http_sessions[pid]
+
+
+# the HTTP status codes of a remote file which does not exist (anymore), its cached copy is deleted
+REMOVED_FILE_STATUS_CODES = (404, 410)
+
+
+class RemoteFilesDiskCache:
+    """An on disk cache of the files downloaded from GitHub, keyed by (tag, path).
+
+    Every file is kept with its ETag, so it is revalidated with If-None-Match and downloaded again only when it changed.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def _get_path(self, tag: str, file_path: str) -> str:
+        key = hashlib.sha1(f'{tag}:{file_path}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def get(self, tag: str, file_path: str) -> Optional[Tuple[Optional[str], bytes]]:
+        """Get the (ETag, content) of a cached file, None in case it is not cached"""
+        try:
+            with open(self._get_path(tag, file_path), 'r') as cache_file:
+                cached = json.load(cache_file)
+            return cached['etag'], base64.b64decode(cached['content'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, tag: str, file_path: str, etag: Optional[str], content: bytes):
+        cache_path = self._get_path(tag, file_path)
+        # write to a temporary file and rename it, so concurrent runs never read a partially written file
+        temp_path = f'{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(temp_path, 'w') as cache_file:
+                json.dump({'tag': tag, 'path': file_path, 'etag': etag,
+                           'content': base64.b64encode(content).decode('ascii')}, cache_file)
+            os.replace(temp_path, cache_path)
+        except OSError:
+            # the cache is an optimization only
+            pass
+
+    def delete(self, tag: str, file_path: str):
+        try:
+            os.remove(self._get_path(tag, file_path))
+        except OSError:
+            pass
+
+
+def get_remote_file_content(full_file_path, tag='master') -> Optional[bytes]:
+    """Download a file of the content repository from GitHub, revalidating the copy of the disk cache if it has one.
+
+    Returns:
+        bytes. The content of the file, None in case it could not be downloaded.
+    """
     # 'origin/' prefix is used to compared with remote branches but it is not a part of the github url.
     tag = tag.lstrip('origin/')
 
     # The replace in the end is for Windows support
     github_path = os.path.join(CONTENT_GITHUB_LINK, tag, full_file_path).replace('\\', '/')
+    cache = RemoteFilesDiskCache(get_cache_dir('remote_files'))
+    cached = cache.get(tag, full_file_path)
+    headers = {'If-None-Match': cached[0]} if cached and cached[0] else {}
     try:
-        res = requests.get(github_path, verify=False, timeout=10)
+        res = get_http_session().get(github_path, verify=False, timeout=10, headers=headers)
+        if res.status_code == 304 and cached:
+            return cached[1]
         res.raise_for_status()
-    except Exception as exc:
+    except requests.exceptions.HTTPError as exc:
+        if exc.response is None or exc.response.status_code not in REMOVED_FILE_STATUS_CODES:
+            # a transient error (server errors, rate limits), handled as a failed download
+            return get_cached_remote_file_content(cached, github_path, exc)
+        # the file does not exist (anymore) in the tag
+        cache.delete(tag, full_file_path)
         print_warning('Could not find the old entity file under "{}".\n'
                       'please make sure that you did not break backward compatibility. '
                       'Reason: {}'.format(github_path, exc))
+        return None
+    except Exception as exc:
+        return get_cached_remote_file_content(cached, github_path, exc)
+
+    cache.set(tag, full_file_path, res.headers.get('ETag'), res.content)
+    return res.content
+
+
+def get_cached_remote_file_content(cached, github_path, exc) -> Optional[bytes]:
+    """Get the cached copy of a remote file which could not be downloaded, None in case it has none"""
+    if cached:
+        print_warning('Could not download "{}", using the cached copy of the file. Reason: {}'.format(
+            github_path, exc))
+        return cached[1]
+    print_warning('Could not find the old entity file under "{}".\n'
+                  'please make sure that you did not break backward compatibility. '
+                  'Reason: {}'.format(github_path, exc))
+    return None
+
+
+def get_remote_file(full_file_path, tag='master'):
+    content = get_remote_file_content(full_file_path, tag)
+    if content is None:
         return {}
 
     if full_file_path.endswith('json'):
-        details = json.loads(res.content)
+        details = json.loads(content)
     else:
-        details = yaml.safe_load(res.content)
+        details = yaml.safe_load(content)
 
     return details
 
 
+def get_remote_files(file_paths, tag='master', max_workers=REMOTE_FILES_MAX_WORKERS) -> Dict[str, dict]:
+    """Download files of the content repository from GitHub concurrently, by a bounded pool of threads.
+
+    Returns:
+        dict. The path of every file -> the loaded file, an empty dict in case it could not be downloaded.
+    """
+    file_paths = list(dict.fromkeys(file_paths))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        files = executor.map(lambda file_path: get_remote_file(file_path, tag), file_paths)
+        return dict(zip(file_paths, files))
+
+
 def filter_packagify_changes(modified_files, added_files, removed_files, tag='master'):
     """
     Mark scripts/integrations that were removed and added as modifiied.
@@ -134,16 +278,16 @@ def filter_packagify_changes(modified_files, added_files, removed_files, tag='ma
     """
     # map IDs to removed files
     packagify_diff = {}  # type: dict
-    for file_path in removed_files:
-        if file_path.split("/")[0] in PACKAGE_SUPPORTING_DIRECTORIES:
-            details = get_remote_file(file_path, tag)
-            if details:
-                uniq_identifier = '_'.join([
-                    details['name'],
-                    details.get('fromversion', '0.0.0'),
-                    details.get('toversion', '99.99.99')
-                ])
-                packagify_diff[uniq_identifier] = file_path
+    removed_package_files = [file_path for file_path in removed_files
+                             if file_path.split("/")[0] in PACKAGE_SUPPORTING_DIRECTORIES]
+    for file_path, details in get_remote_files(removed_package_files, tag).items():
+        if details:
+            uniq_identifier = '_'.join([
+                details['name'],
+                details.get('fromversion', '0.0.0'),
+                details.get('toversion', '99.99.99')
+            ])
+            packagify_diff[uniq_identifier] = file_path
 
     updated_added_files = set()
     for file_path in added_files:
@@ -151,8 +295,7 @@ def filter_packagify_changes(modified_files, added_files, removed_files, tag='ma
             if "README.md" in file_path:
                 updated_added_files.add(file_path)
                 continue
-            with open(file_path) as f:
-                details = yaml.safe_load(f.read())
+            details = load_document(file_path, yaml_safe_load)
 
             uniq_identifier = '_'.join([
                 details['name'],
@@ -223,23 +366,137 @@ def get_last_remote_release_version():
     return ''
 
 
+try:
+    # the libyaml based loader is an order of magnitude faster, it is missing when PyYAML was built without libyaml
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLSafeLoader  # type: ignore
+
+
+def yaml_safe_load(stream):
+    """Same as yaml.safe_load, using the libyaml loader when it is available"""
+    return yaml.load(stream, Loader=YAMLSafeLoader)
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError('A cached document can not be changed, use copy.deepcopy to get a changeable copy of it')
+
+
+class ReadOnlyDict(dict):
+    """A dict which can not be changed - a view of a document shared by the documents cache.
+
+    copy.deepcopy and pickle of it give a regular dict.
+    """
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only  # type: ignore
+
+    def __ior__(self, other):
+        _read_only()
+
+    def copy(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {copy.deepcopy(key, memo): copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class ReadOnlyList(list):
+    """A list which can not be changed - a view of a document shared by the documents cache.
+
+    copy.deepcopy and pickle of it give a regular list.
+    """
+    __setitem__ = __delitem__ = append = extend = insert = pop = remove = clear = sort = reverse = \
+        _read_only  # type: ignore
+
+    def __iadd__(self, other):
+        _read_only()
+
+    def __imul__(self, other):
+        _read_only()
+
+    def copy(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def make_read_only(data):
+    """Get a read only view of a parsed document - its dicts and lists are replaced by read only ones"""
+    if isinstance(data, dict):
+        return ReadOnlyDict((key, make_read_only(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return ReadOnlyList(make_read_only(item) for item in data)
+    return data
+
+
+class DocumentsCache:
+    """A bounded LRU cache of parsed documents.
+
+    A document is keyed by the path, modification time and size of its file and by the function parsing it, so a
+    changed file is parsed again. The cached documents are read only, so they can be shared by all their callers.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._documents: OrderedDict = OrderedDict()
+
+    def clear(self):
+        self._documents.clear()
+
+    def load(self, file_path: str, load_function):
+        """Get the read only parsed document of a file, parsing the file only if it is not cached.
+
+        Raises:
+            OSError: in case the file can not be read.
+            Exception: any exception raised by load_function when parsing the file.
+        """
+        file_stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), file_stat.st_mtime_ns, file_stat.st_size, load_function)
+        if key in self._documents:
+            self._documents.move_to_end(key)
+            return self._documents[key]
+
+        with open(file_path, mode="r", encoding="utf8") as f:
+            document = make_read_only(load_function(f))
+
+        self._documents[key] = document
+        if len(self._documents) > self.max_size:
+            self._documents.popitem(last=False)
+        return document
+
+
+DOCUMENTS_CACHE = DocumentsCache()
+
+
+def load_document(file_path: str, load_function):
+    """Get the read only parsed document of a file through the documents cache"""
+    return DOCUMENTS_CACHE.load(os.path.expanduser(file_path), load_function)
+
+
 def get_file(method, file_path, type_of_file):
-    data_dictionary = None
-    with open(os.path.expanduser(file_path), mode="r", encoding="utf8") as f:
-        if file_path.endswith(type_of_file):
-            try:
-                data_dictionary = method(f)
-            except Exception as e:
-                print_error(
-                    "{} has a structure issue of file type{}. Error was: {}".format(file_path, type_of_file, str(e)))
-                return []
-    if type(data_dictionary) is dict:
+    if not file_path.endswith(type_of_file):
+        return {}
+    try:
+        data_dictionary = load_document(file_path, method)
+    except OSError:
+        raise
+    except Exception as e:
+        print_error(
+            "{} has a structure issue of file type{}. Error was: {}".format(file_path, type_of_file, str(e)))
+        return []
+    if isinstance(data_dictionary, dict):
         return data_dictionary
     return {}
 
 
 def get_yaml(file_path):
-    return get_file(yaml.safe_load, file_path, ('yml', 'yaml'))
+    return get_file(yaml_safe_load, file_path, ('yml', 'yaml'))
 
 
 def get_json(file_path):
@@ -343,11 +600,12 @@ def get_latest_release_notes_text(rn_path):
 
 def checked_type(file_path, compared_regexes=None, return_regex=False):
     compared_regexes = compared_regexes or CHECKED_TYPES_REGEXES
-    for regex in compared_regexes:
-        if re.match(regex, file_path, re.IGNORECASE):
-            if return_regex:
-                return regex
-            return True
+    # the regexes are matched in a single pass by a classifier compiled once per regexes list
+    match = get_regexes_classifier(tuple(compared_regexes)).get_match(file_path)
+    if match:
+        if return_regex:
+            return match[1]
+        return True
     return False
 
 
@@ -1,6 +1,6 @@
+import hashlib
 import itertools
 import os
-import glob
 import json
 import re
 from collections import OrderedDict
@@ -16,9 +16,14 @@ from demisto_sdk.commands.common.constants import INTEGRATION_REGEX, INTEGRATION
     INCIDENT_TYPES_DIR, INDICATOR_FIELDS_DIR, LAYOUTS_DIR, REPORTS_DIR, DASHBOARD_REGEX, PACKS_DASHBOARDS_REGEX, \
     INCIDENT_FIELD_REGEX, PACKS_INCIDENT_FIELDS_REGEX, INCIDENT_TYPE_REGEX, PACKS_INCIDENT_TYPES_REGEX, \
     INDICATOR_FIELDS_REGEX, PACKS_INDICATOR_FIELDS_REGEX, LAYOUT_REGEX, PACKS_LAYOUTS_REGEX, REPORT_REGEX,\
-    PACKS_REPORTS_REGEX, WIDGETS_REGEX, PACKS_WIDGETS_REGEX
-from demisto_sdk.commands.common.tools import get_yaml, get_to_version, get_from_version, collect_ids, get_json, \
-    get_script_or_integration_id, LOG_COLORS, print_color, print_error, print_warning, run_command, get_pack_name
+    PACKS_REPORTS_REGEX, WIDGETS_REGEX, PACKS_WIDGETS_REGEX, TYPE_TO_EXTENSION
+from demisto_sdk.commands.common.content_inventory import get_content_inventory
+from demisto_sdk.commands.common.id_set import IDSet, IDSetSection, ReverseDependencyIndex, as_id_set_section, get_entry_id, \
+    get_entry_data
+from demisto_sdk.commands.common.git_tools import GitCatFile, get_git_context
+from demisto_sdk.commands.common.path_classifier import get_regexes_classifier
+from demisto_sdk.commands.common.tools import get_yaml, get_json, LOG_COLORS, print_color, print_error, print_warning, \
+    run_command, get_pack_name, yaml_safe_load, get_sdk_version
 from demisto_sdk.commands.unify.unifier import Unifier
 
 CHECKED_TYPES_REGEXES = (
@@ -42,10 +47,7 @@ CHECKED_TYPES_REGEXES = (
 
 
 def checked_type(file_path, regex_list=CHECKED_TYPES_REGEXES):
-    for regex in regex_list:
-        if re.match(regex, file_path, re.IGNORECASE):
-            return True
-    return False
+    return get_regexes_classifier(tuple(regex_list)).get_match_index(file_path) >= 0
 
 
 def get_changed_files(files_string):
@@ -126,9 +128,10 @@ def get_commmands_from_playbook(data_dict):
     return command_to_integration
 
 
-def get_integration_data(file_path):
+def get_integration_data(file_path, data_dictionary=None):
     integration_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    if data_dictionary is None:
+        data_dictionary = get_yaml(file_path)
     id_ = data_dictionary.get('commonfields', {}).get('id', '-')
     name = data_dictionary.get('name', '-')
 
@@ -164,9 +167,10 @@ def get_integration_data(file_path):
     return {id_: integration_data}
 
 
-def get_playbook_data(file_path):
+def get_playbook_data(file_path, data_dictionary=None):
     playbook_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    if data_dictionary is None:
+        data_dictionary = get_yaml(file_path)
     id_ = data_dictionary.get('id', '-')
     name = data_dictionary.get('name', '-')
 
@@ -201,9 +205,10 @@ def get_playbook_data(file_path):
     return {id_: playbook_data}
 
 
-def get_script_data(file_path, script_code=None):
+def get_script_data(file_path, script_code=None, data_dictionary=None):
     script_data = OrderedDict()
-    data_dictionary = get_yaml(file_path)
+    if data_dictionary is None:
+        data_dictionary = get_yaml(file_path)
     id_ = data_dictionary.get('commonfields', {}).get('id', '-')
     if script_code is None:
         script_code = data_dictionary.get('script', '')
@@ -302,26 +307,38 @@ def get_depends_on(data_dict):
     return depends_on_list, command_to_integration
 
 
-def update_object_in_id_set(obj_id, obj_data, file_path, instances_set):
-    change_string = run_command("git diff HEAD {0}".format(file_path))
-    is_added_from_version = True if re.search(r'\+fromversion: .*', change_string) else False
-    is_added_to_version = True if re.search(r'\+toversion: .*', change_string) else False
+def update_object_in_id_set(obj_id, obj_data, file_path, instances_set, old_file_data=None):
+    """
+    Update the id_set entry of a modified file.
+
+    Arguments:
+        old_file_data {dict} -- the parsed previous version of the file, used to find whether its fromversion or
+            toversion were changed. When not given, they are taken from `git diff HEAD` of the file.
+    """
+    dict_value = get_entry_data(obj_data)
+    file_to_version = dict_value.get('toversion', '99.99.99')
+    file_from_version = dict_value.get('fromversion', '0.0.0')
 
-    file_to_version = get_to_version(file_path)
-    file_from_version = get_from_version(file_path)
+    if old_file_data is None:
+        change_string = get_git_context().get_path_diff(file_path, 'HEAD')
+        is_added_from_version = True if re.search(r'\+fromversion: .*', change_string) else False
+        is_added_to_version = True if re.search(r'\+toversion: .*', change_string) else False
+    else:
+        is_added_from_version = 'fromversion' in dict_value and \
+            dict_value['fromversion'] != old_file_data.get('fromversion')
+        is_added_to_version = 'toversion' in dict_value and dict_value['toversion'] != old_file_data.get('toversion')
 
     updated = False
-    for instance in instances_set:
-        instance_id = list(instance.keys())[0]
-        integration_to_version = instance[instance_id].get('toversion', '99.99.99')
-        integration_from_version = instance[instance_id].get('fromversion', '0.0.0')
-
-        if obj_id == instance_id:
-            if is_added_from_version or (not is_added_from_version and file_from_version == integration_from_version):
-                if is_added_to_version or (not is_added_to_version and file_to_version == integration_to_version):
-                    instance[obj_id] = obj_data[obj_id]
-                    updated = True
-                    break
+    instances_section = as_id_set_section(instances_set)
+    for instance in instances_section.get_entries(obj_id):
+        integration_to_version = instance[obj_id].get('toversion', '99.99.99')
+        integration_from_version = instance[obj_id].get('fromversion', '0.0.0')
+
+        if is_added_from_version or (not is_added_from_version and file_from_version == integration_from_version):
+            if is_added_to_version or (not is_added_to_version and file_to_version == integration_to_version):
+                instances_section.update_entry(instance, obj_data[obj_id])
+                updated = True
+                break
 
     if not updated:
         # in case we didn't found then we need to create one
@@ -331,17 +348,16 @@ def update_object_in_id_set(obj_id, obj_data, file_path, instances_set):
 def add_new_object_to_id_set(obj_id, obj_data, instances_set):
     obj_in_set = False
 
-    dict_value = obj_data.values()[0]
+    dict_value = get_entry_data(obj_data)
     file_to_version = dict_value.get('toversion', '99.99.99')
     file_from_version = dict_value.get('fromversion', '0.0.0')
 
-    for instance in instances_set:
-        instance_id = instance.keys()[0]
-        integration_to_version = instance[instance_id].get('toversion', '99.99.99')
-        integration_from_version = instance[instance_id].get('fromversion', '0.0.0')
-        if obj_id == instance_id and file_from_version == integration_from_version and \
-                file_to_version == integration_to_version:
-            instance[obj_id] = obj_data[obj_id]
+    instances_section = as_id_set_section(instances_set)
+    for instance in instances_section.get_entries(obj_id):
+        integration_to_version = instance[obj_id].get('toversion', '99.99.99')
+        integration_from_version = instance[obj_id].get('fromversion', '0.0.0')
+        if file_from_version == integration_from_version and file_to_version == integration_to_version:
+            instances_section.update_entry(instance, obj_data[obj_id])
             obj_in_set = True
 
     if not obj_in_set:
@@ -557,9 +573,10 @@ def get_integrations_paths():
         ['Beta_Integrations', '*'],
         ['Packs', '*', 'Integrations', '*']
     ]
+    inventory = get_content_inventory()
     integration_files = list()
     for path in path_list:
-        integration_files.extend(glob.glob(os.path.join(*path)))
+        integration_files.extend(inventory.glob(*path))
 
     return integration_files
 
@@ -571,9 +588,10 @@ def get_playbooks_paths():
         ['Beta_Integrations', '*.yml']
     ]
 
+    inventory = get_content_inventory()
     playbook_files = list()
     for path in path_list:
-        playbook_files.extend(glob.glob(os.path.join(*path)))
+        playbook_files.extend(inventory.glob(*path))
 
     return playbook_files
 
@@ -583,123 +601,397 @@ def get_general_paths(path):
         [path, '*'],
         ['Packs', '*', path, '*']
     ]
+    inventory = get_content_inventory()
     files = list()
     for path in path_list:
-        files.extend(glob.glob(os.path.join(*path)))
+        files.extend(inventory.glob(*path))
 
     return files
 
 
-def re_create_id_set(id_set_path="./Tests/id_set.json", objects_to_create=None):
+def get_id_set_manifest_path(id_set_path):
+    """Get the path of the manifest kept next to the id_set file, e.g. Tests/id_set_manifest.json"""
+    base_path, _ = os.path.splitext(id_set_path)
+    return '{}_manifest.json'.format(base_path)
+
+
+def get_reverse_dependencies_path(id_set_path):
+    """Get the path of the reverse dependency index kept next to the id_set file"""
+    base_path, _ = os.path.splitext(id_set_path)
+    return '{}_reverse_dependencies.json'.format(base_path)
+
+
+def load_reverse_dependencies(id_set_path):
+    """
+    Load the reverse dependency index kept next to the id_set file.
+
+    Returns None in case the index is missing, or is older than the id_set - the id_set was created again without it.
+    """
+    index_path = get_reverse_dependencies_path(id_set_path)
+    try:
+        if os.path.getmtime(index_path) < os.path.getmtime(id_set_path):
+            return None
+        return ReverseDependencyIndex.load(index_path)
+    except (OSError, ValueError):
+        return None
+
+
+def get_content_hash(path):
+    """
+    Calculate a content hash for a file or a package directory.
+
+    For a directory, all the files directly under it take part in the hash (together with their names), as those are
+    the files the Unifier may read when the package is processed.
+
+    Arguments:
+        path {string} -- path to a file or a package directory
+
+    Returns:
+        string -- the sha1 hex digest of the content
+    """
+    sha1 = hashlib.sha1()
+    if os.path.isdir(path):
+        for file_name in sorted(os.listdir(path)):
+            file_path = os.path.join(path, file_name)
+            if os.path.isfile(file_path):
+                sha1.update(file_name.encode('utf-8'))
+                with open(file_path, 'rb') as f:
+                    sha1.update(f.read())
+    elif os.path.isfile(path):
+        with open(path, 'rb') as f:
+            sha1.update(f.read())
+
+    return sha1.hexdigest()
+
+
+class IDSetManifest:
+    """
+    A sidecar manifest of the id_set which maps each processed source path to its content hash and to the result
+    it produced. Used by the incremental id_set creation to re-process only new or changed files.
+
+    The results depend on the processors of the demisto-sdk version which created them, so a manifest created by
+    another version is discarded.
+    """
+    VERSION = 1
+
+    def __init__(self, manifest_path):
+        self.manifest_path = manifest_path
+        self.sections = {}  # type: dict
+        self.new_sections = {}  # type: dict
+
+    @classmethod
+    def load(cls, manifest_path):
+        manifest = cls(manifest_path)
+        if os.path.isfile(manifest_path):
+            try:
+                with open(manifest_path, 'r') as manifest_file:
+                    data = json.load(manifest_file, object_pairs_hook=OrderedDict)
+            except ValueError:
+                print_warning('Could not load the id_set manifest {}, running a full build'.format(manifest_path))
+                return manifest
+
+            if data.get('version') != cls.VERSION:
+                print_warning('The id_set manifest {} is of an old version, running a full build'.format(manifest_path))
+            elif data.get('sdk_version') != get_sdk_version():
+                print_warning('The id_set manifest {} was created by another demisto-sdk version, running a full '
+                              'build'.format(manifest_path))
+            else:
+                manifest.sections = data.get('sections', {})
+
+        return manifest
+
+    def get_result(self, section, path):
+        """
+        Get the stored result of a path, in case its content did not change since the last run.
+
+        Arguments:
+            section {string} -- the name of the section the path belongs to
+            path {string} -- the processed path
+
+        Returns:
+            the stored result of the path, None if the path is new or was changed
+        """
+        content_hash = get_content_hash(path)
+        new_entry = self.new_sections.setdefault(section, OrderedDict()).setdefault(path, {})
+        new_entry['hash'] = content_hash
+        old_entry = self.sections.get(section, {}).get(path)
+        if old_entry and old_entry['hash'] == content_hash:
+            new_entry['result'] = old_entry['result']
+            return old_entry['result']
+
+        return None
+
+    def set_result(self, section, path, result):
+        # round trip through json so new results look exactly like the ones loaded from the manifest
+        self.new_sections[section][path]['result'] = json.loads(json.dumps(result), object_pairs_hook=OrderedDict)
+
+    def save(self):
+        # sections which were not created in this run are kept as is, entries of deleted paths are dropped
+        self.sections.update(self.new_sections)
+        with open(self.manifest_path, 'w') as manifest_file:
+            json.dump({'version': self.VERSION, 'sdk_version': get_sdk_version(), 'sections': self.sections},
+                      manifest_file)
+
+
+def load_id_set_manifest(id_set_path, incremental=True):
+    if not incremental:
+        return None
+    if not id_set_path:
+        print_warning('An incremental id_set creation requires an output path, running a full build')
+        return None
+    return IDSetManifest.load(get_id_set_manifest_path(id_set_path))
+
+
+# object type -> (function processing a single path, function listing the paths to process, id_set section)
+# the test playbooks processor returns a (playbook, script) pair, the script is added to the scripts section.
+ID_SET_OBJECT_TYPES = OrderedDict([
+    ('Integrations', (process_integration, get_integrations_paths, 'integrations')),
+    ('Playbooks', (process_playbook, get_playbooks_paths, 'playbooks')),
+    ('Scripts', (process_script, lambda: get_general_paths(SCRIPTS_DIR), 'scripts')),
+    ('TestPlaybooks', (process_test_playbook_path, lambda: get_general_paths(TEST_PLAYBOOKS_DIR), 'TestPlaybooks')),
+    ('Classifiers', (process_classifier, lambda: get_general_paths(CLASSIFIERS_DIR), 'Classifiers')),
+    ('Dashboards', (process_dashboards, lambda: get_general_paths(DASHBOARDS_DIR), 'Dashboards')),
+    ('IncidentFields', (process_incident_fields, lambda: get_general_paths(INCIDENT_FIELDS_DIR), 'IncidentFields')),
+    ('IncidentTypes', (process_incident_types, lambda: get_general_paths(INCIDENT_TYPES_DIR), 'IncidentTypes')),
+    ('IndicatorFields', (process_indicator_fields, lambda: get_general_paths(INDICATOR_FIELDS_DIR),
+                         'IndicatorFields')),
+    ('Layouts', (process_layouts, lambda: get_general_paths(LAYOUTS_DIR), 'Layouts')),
+    ('Reports', (process_reports, lambda: get_general_paths(REPORTS_DIR), 'Reports')),
+    ('Widgets', (process_widgets, lambda: get_general_paths(WIDGETS_DIR), 'Widgets')),
+])
+
+# the order of the sections in the id_set file
+ID_SET_SECTIONS = ['scripts', 'playbooks', 'integrations', 'TestPlaybooks', 'Classifiers', 'Dashboards',
+                   'IncidentFields', 'IncidentTypes', 'IndicatorFields', 'Layouts', 'Reports', 'Widgets']
+
+
+def get_default_processes_count():
+    return cpu_count() * 2
+
+
+def process_id_set_task(task):
+    """
+    Process a single (index, object type, path) task of the id_set work queue.
+
+    Returns:
+        tuple -- the index of the task and the result of the object type processor
+    """
+    index, object_type, path = task
+    process_func = ID_SET_OBJECT_TYPES[object_type][0]
+    return index, process_func(path)
+
+
+def add_result_to_id_set_sections(sections, object_type, result):
+    section = ID_SET_OBJECT_TYPES[object_type][2]
+    if object_type == 'TestPlaybooks':
+        playbook, script = result
+        if playbook:
+            sections[section].append(playbook)
+        if script:
+            sections['scripts'].append(script)
+    else:
+        sections[section].extend(result)
+
+
+def get_chunk_size(tasks_count, processes):
+    # same heuristic as Pool.map uses, a few chunks per worker keeps the workers busy without paying per task overhead
+    chunk_size, extra = divmod(tasks_count, processes * 4)
+    return chunk_size + 1 if extra else max(chunk_size, 1)
+
+
+def parse_shard(shard):
+    """
+    Parse a shard of the id_set creation given as i/N, e.g. 0/4 - the first of 4 shards.
+
+    Returns:
+        tuple -- the (index, count) of the shard
+
+    Raises:
+        ValueError: in case the shard is not of the form i/N with 0 <= i < N.
+    """
+    match = re.match(r'^(\d+)/(\d+)$', str(shard).strip())
+    if not match or not int(match.group(1)) < int(match.group(2)):
+        raise ValueError('Invalid shard {}, expected i/N where 0 <= i < N, e.g. 0/4'.format(shard))
+    return int(match.group(1)), int(match.group(2))
+
+
+def is_in_shard(path, shard):
+    """Whether a path belongs to a shard, by a hash of the path which is the same on every machine and run"""
+    shard_index, shards_count = shard
+    return int(hashlib.sha1(path.encode('utf-8')).hexdigest(), 16) % shards_count == shard_index
+
+
+def create_id_set_from_results(results):
+    """
+    Create the id_set out of the results of the processed paths.
+
+    Arguments:
+        results {iterable} -- (object type, result) pairs, in the order of the tasks of the work queue
+
+    Returns:
+        IDSet -- the sorted id_set
+    """
+    new_ids_dict = IDSet((section, []) for section in ID_SET_SECTIONS)
+    for object_type, result in results:
+        add_result_to_id_set_sections(new_ids_dict, object_type, result)
+
+    # we sort each time the whole set in case someone manually changed something
+    # it shouldn't take too much time
+    for section_data in new_ids_dict.values():
+        sort(section_data)
+
+    return new_ids_dict
+
+
+def save_id_set(id_set, id_set_path, reverse_dependencies=False):
+    id_set.dump(id_set_path)
+    if reverse_dependencies:
+        ReverseDependencyIndex.from_id_set(id_set).dump(get_reverse_dependencies_path(id_set_path))
+
+
+def print_duplicates(id_set):
+    duplicates = find_duplicates(id_set)
+    if any(duplicates):
+        print_error('The following duplicates were found: {}'.format(duplicates))
+
+
+def re_create_id_set(id_set_path="./Tests/id_set.json", objects_to_create=None, incremental=False, processes=None,
+                     reverse_dependencies=False, shard=None):
+    """
+    Create the id_set of the content repository in the working directory.
+
+    When a shard (index, count) is given, only the paths of the shard are processed and a partial id_set is written
+    to id_set_path, to be combined with the partials of the other shards by merge_id_set_shards.
+    """
     if objects_to_create is None:
         objects_to_create = ['Integrations', 'Scripts', 'Playbooks', 'TestPlaybooks', 'Classifiers',
                              'Dashboards', 'IncidentFields', 'IndicatorFields', 'Layouts', 'Reports', 'Widgets']
+    processes = processes or get_default_processes_count()
     start_time = time.time()
-    scripts_list = []
-    playbooks_list = []
-    integration_list = []
-    testplaybooks_list = []
-
-    classifiers_list = []
-    dashboards_list = []
-    incident_fields_list = []
-    incident_type_list = []
-    indicator_fields_list = []
-    layouts_list = []
-    reports_list = []
-    widgets_list = []
-
-    pool = Pool(processes=cpu_count() * 2)
+    manifest = load_id_set_manifest(id_set_path, incremental)
 
     print_color("Starting the creation of the id_set", LOG_COLORS.GREEN)
-    if 'Integrations' in objects_to_create:
-        print_color("Starting iterating over Integrations", LOG_COLORS.GREEN)
-        for arr in pool.map(process_integration, get_integrations_paths()):
-            integration_list.extend(arr)
-
-    if 'Playbooks' in objects_to_create:
-        print_color("Starting iterating over Playbooks", LOG_COLORS.GREEN)
-        for arr in pool.map(process_playbook, get_playbooks_paths()):
-            playbooks_list.extend(arr)
-
-    if 'Scripts' in objects_to_create:
-        print_color("Starting iterating over Scripts", LOG_COLORS.GREEN)
-        for arr in pool.map(process_script, get_general_paths(SCRIPTS_DIR)):
-            scripts_list.extend(arr)
-
-    if 'TestPlaybooks' in objects_to_create:
-        print_color("Starting iterating over TestPlaybooks", LOG_COLORS.GREEN)
-        for pair in pool.map(process_test_playbook_path, get_general_paths(TEST_PLAYBOOKS_DIR)):
-            if pair[0]:
-                testplaybooks_list.append(pair[0])
-            if pair[1]:
-                scripts_list.append(pair[1])
-
-    if 'Classifiers' in objects_to_create:
-        print_color("Starting iterating over Classifiers", LOG_COLORS.GREEN)
-        for arr in pool.map(process_classifier, get_general_paths(CLASSIFIERS_DIR)):
-            classifiers_list.extend(arr)
-
-    if 'Dashboards' in objects_to_create:
-        print_color("Starting iterating over Dashboards", LOG_COLORS.GREEN)
-        for arr in pool.map(process_dashboards, get_general_paths(DASHBOARDS_DIR)):
-            dashboards_list.extend(arr)
-
-    if 'IncidentFields' in objects_to_create:
-        print_color("Starting iterating over Incident Fields", LOG_COLORS.GREEN)
-        for arr in pool.map(process_incident_fields, get_general_paths(INCIDENT_FIELDS_DIR)):
-            incident_fields_list.extend(arr)
-
-    if 'IncidentTypes' in objects_to_create:
-        print_color("Starting iterating over Incident Types", LOG_COLORS.GREEN)
-        for arr in pool.map(process_incident_types, get_general_paths(INCIDENT_TYPES_DIR)):
-            incident_type_list.extend(arr)
-
-    if 'IndicatorFields' in objects_to_create:
-        print_color("Starting iterating over Indicator Fields", LOG_COLORS.GREEN)
-        for arr in pool.map(process_indicator_fields, get_general_paths(INDICATOR_FIELDS_DIR)):
-            indicator_fields_list.extend(arr)
-
-    if 'Layouts' in objects_to_create:
-        print_color("Starting iterating over Layouts", LOG_COLORS.GREEN)
-        for arr in pool.map(process_layouts, get_general_paths(LAYOUTS_DIR)):
-            layouts_list.extend(arr)
-
-    if 'Reports' in objects_to_create:
-        print_color("Starting iterating over Reports", LOG_COLORS.GREEN)
-        for arr in pool.map(process_reports, get_general_paths(REPORTS_DIR)):
-            reports_list.extend(arr)
-
-    if 'Widgets' in objects_to_create:
-        print_color("Starting iterating over Widgets", LOG_COLORS.GREEN)
-        for arr in pool.map(process_widgets, get_general_paths(WIDGETS_DIR)):
-            widgets_list.extend(arr)
-
-    new_ids_dict = OrderedDict()
-    # we sort each time the whole set in case someone manually changed something
-    # it shouldn't take too much time
-    new_ids_dict['scripts'] = sort(scripts_list)
-    new_ids_dict['playbooks'] = sort(playbooks_list)
-    new_ids_dict['integrations'] = sort(integration_list)
-    new_ids_dict['TestPlaybooks'] = sort(testplaybooks_list)
-    new_ids_dict['Classifiers'] = sort(classifiers_list)
-    new_ids_dict['Dashboards'] = sort(dashboards_list)
-    new_ids_dict['IncidentFields'] = sort(incident_fields_list)
-    new_ids_dict['IncidentTypes'] = sort(incident_type_list)
-    new_ids_dict['IndicatorFields'] = sort(indicator_fields_list)
-    new_ids_dict['Layouts'] = sort(layouts_list)
-    new_ids_dict['Reports'] = sort(reports_list)
-    new_ids_dict['Widgets'] = sort(widgets_list)
-
+    # all the paths of all the object types are put in a single work queue, the index of each task is kept so the
+    # results can be put back in the same order a sequential run would produce them
+    tasks = []
+    for object_type, (_, get_paths, _) in ID_SET_OBJECT_TYPES.items():
+        if object_type in objects_to_create:
+            print_color("Collecting the {} paths".format(object_type), LOG_COLORS.GREEN)
+            tasks.extend((index, object_type, path) for index, path in enumerate(get_paths(), start=len(tasks)))
+
+    shard_tasks = [task for task in tasks if is_in_shard(task[2], shard)] if shard else tasks
+    if shard:
+        print('Shard {}/{} has {} of the {} files'.format(shard[0], shard[1], len(shard_tasks), len(tasks)))
+
+    results = [None] * len(tasks)
+    tasks_to_process = []
+    for task in shard_tasks:
+        index, object_type, path = task
+        results[index] = manifest.get_result(object_type, path) if manifest else None
+        if results[index] is None:
+            tasks_to_process.append(task)
+
+    if manifest:
+        print('{} files were not changed since the last run'.format(len(shard_tasks) - len(tasks_to_process)))
+
+    print_color("Processing {} files using {} processes".format(len(tasks_to_process), processes), LOG_COLORS.GREEN)
+    with Pool(processes=processes) as pool:
+        for index, result in pool.imap_unordered(process_id_set_task, tasks_to_process,
+                                                 get_chunk_size(len(tasks_to_process), processes)):
+            results[index] = result
+            if manifest:
+                _, object_type, path = tasks[index]
+                manifest.set_result(object_type, path, result)
+
+    if shard:
+        id_set_shard = IDSetShard(shard, len(tasks), [(index, object_type, results[index])
+                                                      for index, object_type, _ in shard_tasks])
+        if id_set_path:
+            id_set_shard.dump(id_set_path)
+            if manifest:
+                manifest.save()
+        print_color("Finished the creation of the id_set shard. Total time: {} seconds".format(
+            time.time() - start_time), LOG_COLORS.GREEN)
+        return id_set_shard
+
+    new_ids_dict = create_id_set_from_results((object_type, result) for (_, object_type, _), result
+                                              in zip(tasks, results))
     if id_set_path:
-        with open(id_set_path, 'w+') as id_set_file:
-            json.dump(new_ids_dict, id_set_file, indent=4)
+        save_id_set(new_ids_dict, id_set_path, reverse_dependencies)
+        if manifest:
+            manifest.save()
     exec_time = time.time() - start_time
     print_color("Finished the creation of the id_set. Total time: {} seconds".format(exec_time), LOG_COLORS.GREEN)
 
-    duplicates = find_duplicates(new_ids_dict)
-    if any(duplicates):
-        print_error('The following duplicates were found: {}'.format(duplicates))
+    print_duplicates(new_ids_dict)
+
+    return new_ids_dict
+
+
+class IDSetShard:
+    """
+    A partial id_set created by a single shard - the results of the paths of the shard, each with the index of its
+    task in the work queue of a full build, so the partials can be merged to the exact id_set a full build creates.
+    """
+    VERSION = 1
+
+    def __init__(self, shard, tasks_count, results):
+        self.shard = tuple(shard)
+        self.tasks_count = tasks_count
+        self.results = results  # (task index, object type, result) tuples
+
+    @classmethod
+    def load(cls, shard_path):
+        """
+        Raises:
+            ValueError: in case the file is not an id_set shard of the current version.
+        """
+        with open(shard_path, 'r') as shard_file:
+            data = json.load(shard_file, object_pairs_hook=OrderedDict)
+        if not isinstance(data, dict) or data.get('version') != cls.VERSION:
+            raise ValueError('{} is not an id_set shard of version {}'.format(shard_path, cls.VERSION))
+        return cls(data['shard'], data['tasks_count'], [tuple(result) for result in data['results']])
+
+    def dump(self, shard_path):
+        with open(shard_path, 'w') as shard_file:
+            json.dump({'version': self.VERSION, 'shard': self.shard, 'tasks_count': self.tasks_count,
+                       'results': self.results}, shard_file)
+
+
+def merge_id_set_shards(shard_paths, id_set_path="./Tests/id_set.json", reverse_dependencies=False):
+    """
+    Merge the partial id_sets of all the shards of a sharded id_set creation into the id_set a full build creates.
+
+    Raises:
+        ValueError: in case the shards are not all the shards of the same build.
+    """
+    start_time = time.time()
+    shards = [IDSetShard.load(shard_path) for shard_path in shard_paths]
+    if not shards:
+        raise ValueError('No id_set shards to merge')
+
+    shards_count = shards[0].shard[1]
+    tasks_count = shards[0].tasks_count
+    if sorted(shard.shard for shard in shards) != [(index, shards_count) for index in range(shards_count)] or \
+            any(shard.tasks_count != tasks_count for shard in shards):
+        raise ValueError('Expected the {} shards of a single build, got the shards {}'.format(
+            shards_count, ', '.join('{}/{}'.format(*shard.shard) for shard in shards)))
+
+    results = [None] * tasks_count
+    for shard in shards:
+        for index, object_type, result in shard.results:
+            results[index] = (object_type, result)
+    if None in results:
+        raise ValueError('The shards are missing {} of the {} files'.format(results.count(None), tasks_count))
+
+    print_color("Merging {} id_set shards".format(shards_count), LOG_COLORS.GREEN)
+    new_ids_dict = create_id_set_from_results(results)
+    if id_set_path:
+        save_id_set(new_ids_dict, id_set_path, reverse_dependencies)
+    print_color("Finished merging the id_set. Total time: {} seconds".format(time.time() - start_time),
+                LOG_COLORS.GREEN)
+
+    print_duplicates(new_ids_dict)
 
     return new_ids_dict
 
@@ -711,22 +1003,20 @@ def find_duplicates(id_set):
                         'Layouts', 'Reports', 'Widgets']
     for object_type in objects_to_check:
         print_color("Checking diff for {}".format(object_type), LOG_COLORS.GREEN)
-        objects = id_set.get(object_type)
-        ids = set(list(specific_item.keys())[0] for specific_item in objects)
+        objects = as_id_set_section(id_set.get(object_type))
 
         dup_list = []
-        for id_to_check in ids:
+        for id_to_check in objects.get_ids():
             if has_duplicate(objects, id_to_check, object_type):
                 dup_list.append(id_to_check)
         lists_to_return.append(dup_list)
 
     print_color("Checking diff for Incident and Idicator Fields", LOG_COLORS.GREEN)
 
-    fields = id_set['IncidentFields'] + id_set['IndicatorFields']
-    field_ids = set(list(field.keys())[0] for field in fields)
+    fields = IDSetSection(id_set['IncidentFields'] + id_set['IndicatorFields'])
 
     field_list = []
-    for field_to_check in field_ids:
+    for field_to_check in fields.get_ids():
         if has_duplicate(fields, field_to_check, 'Indicator and Incident Fields'):
             field_list.append(field_to_check)
     lists_to_return.append(field_list)
@@ -734,152 +1024,249 @@ def find_duplicates(id_set):
     return lists_to_return
 
 
+def get_version_range(data):
+    """Get the (fromversion, toversion) range of an id_set entry data, as tuples comparable like LooseVersion"""
+    return (tuple(LooseVersion(data.get('fromversion', '0.0.0')).version),
+            tuple(LooseVersion(data.get('toversion', '99.99.99')).version))
+
+
+def is_version_ranges_overlap(range1, range2):
+    from1, to1 = range1
+    from2, to2 = range2
+    # A: 3.0.0 - 3.6.0
+    # B: 3.5.0 - 4.5.0
+    # C: 3.5.2 - 3.5.4
+    # D: 4.5.0 - 99.99.99
+    return any([
+        from1 <= from2 < to1,  # will catch (B, C), (A, B), (A, C)
+        from1 < to2 <= to1,  # will catch (B, C), (A, C)
+        from2 <= from1 < to2,  # will catch (C, B), (B, A), (C, A)
+        from2 < to1 <= to2,  # will catch (C, B), (C, A)
+    ])
+
+
+def has_overlapping_version_ranges(version_ranges):
+    """
+    Check whether any two of the given version ranges overlap, using a sort and sweep over the ranges.
+
+    Arguments:
+        version_ranges {list} -- (fromversion, toversion) tuples as returned by get_version_range
+
+    Returns:
+        bool -- True if at least two of the ranges overlap
+    """
+    valid_ranges = sorted(version_range for version_range in version_ranges if version_range[0] < version_range[1])
+    max_to_version = None
+    for from_version, to_version in valid_ranges:
+        # the ranges are sorted by fromversion, so a range overlaps a previous one iff it starts before the
+        # latest toversion seen so far
+        if max_to_version is not None and from_version < max_to_version:
+            return True
+        max_to_version = to_version if max_to_version is None else max(max_to_version, to_version)
+
+    # ranges which end before they start (or are a single point) are rare, they are checked against all other ranges
+    # to keep the exact same semantics as is_version_ranges_overlap
+    for index, version_range in enumerate(version_ranges):
+        if version_range[0] >= version_range[1]:
+            for other_index, other_range in enumerate(version_ranges):
+                if index != other_index and is_version_ranges_overlap(version_range, other_range):
+                    return True
+
+    return False
+
+
 def has_duplicate(id_set, id_to_check, object_type=None):
-    duplicates = [duplicate for duplicate in id_set if duplicate.get(id_to_check)]
+    duplicates = [duplicate[id_to_check] for duplicate in as_id_set_section(id_set).get_entries(id_to_check)
+                  if duplicate[id_to_check]]
 
     if len(duplicates) < 2:
         return False
 
-    for dup1, dup2 in itertools.combinations(duplicates, 2):
-        dict1 = list(dup1.values())[0]
-        dict2 = list(dup2.values())[0]
-        dict1_from_version = LooseVersion(dict1.get('fromversion', '0.0.0'))
-        dict2_from_version = LooseVersion(dict2.get('fromversion', '0.0.0'))
-        dict1_to_version = LooseVersion(dict1.get('toversion', '99.99.99'))
-        dict2_to_version = LooseVersion(dict2.get('toversion', '99.99.99'))
+    version_ranges = [get_version_range(duplicate) for duplicate in duplicates]
+    if len({duplicate.get('name') for duplicate in duplicates}) < 2:
+        return has_overlapping_version_ranges(version_ranges)
 
-        if dict1['name'] != dict2['name']:
+    # the different names are warned about per pair of entries, up to the first pair of overlapping entries
+    for (dup1, range1), (dup2, range2) in itertools.combinations(zip(duplicates, version_ranges), 2):
+        if dup1.get('name') != dup2.get('name'):
             print_warning('The following {} have the same ID ({}) but different names: '
-                          '"{}", "{}".'.format(object_type, id_to_check, dict1['name'], dict2['name']))
-
-        # A: 3.0.0 - 3.6.0
-        # B: 3.5.0 - 4.5.0
-        # C: 3.5.2 - 3.5.4
-        # D: 4.5.0 - 99.99.99
-        if any([
-                dict1_from_version <= dict2_from_version < dict1_to_version,  # will catch (B, C), (A, B), (A, C)
-                dict1_from_version < dict2_to_version <= dict1_to_version,  # will catch (B, C), (A, C)
-                dict2_from_version <= dict1_from_version < dict2_to_version,  # will catch (C, B), (B, A), (C, A)
-                dict2_from_version < dict1_to_version <= dict2_to_version,  # will catch (C, B), (C, A)
-        ]):
+                          '"{}", "{}".'.format(object_type, id_to_check, dup1.get('name'), dup2.get('name')))
+        if is_version_ranges_overlap(range1, range2):
             return True
 
     return False
 
 
 def sort(data):
-    data.sort(key=lambda r: list(r.keys())[0].lower())  # Sort data by key value
+    data.sort(key=lambda r: get_entry_id(r).lower())  # Sort data by key value
     return data
 
 
-def update_id_set():
-    branches = run_command("git branch")
-    branch_name_reg = re.search(r"\* (.*)", branches)
-    branch_name = branch_name_reg.group(1)
+class ChangedContentReader:
+    """
+    Reads the changed content files for the update of the id_set.
+
+    With a revision, the files are read from the git objects of the revision, otherwise from the working tree. The
+    previous versions of the files are read from the git objects of old_revision. All the git objects are read through
+    a single `git cat-file --batch` process.
+    """
+
+    def __init__(self, old_revision, revision=None):
+        self.old_revision = old_revision
+        self.revision = revision
+        self.cat_file = GitCatFile()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.cat_file.close()
+
+    def read(self, path):
+        if self.revision:
+            content = self.cat_file.get_blob(self.revision, path)
+            return content.decode('utf-8') if content is not None else None
+
+        if not os.path.isfile(path):
+            return None
+        with open(path, mode='r', encoding='utf8') as f:
+            return f.read()
+
+    def list_dir(self, path):
+        if self.revision:
+            names = self.cat_file.get_tree_entries(self.revision, path)
+        else:
+            names = sorted(os.listdir(path)) if os.path.isdir(path) else []
+        return [os.path.join(path, name) for name in names]
+
+    @staticmethod
+    def parse_yaml(path, content):
+        try:
+            data_dictionary = yaml_safe_load(content) if content else None
+        except Exception as e:
+            print_error("{} has a structure issue of file type yml. Error was: {}".format(path, str(e)))
+            return {}
+        return data_dictionary if isinstance(data_dictionary, dict) else {}
+
+    def load_yaml(self, path):
+        return self.parse_yaml(path, self.read(path))
+
+    def load_old_yaml(self, path):
+        content = self.cat_file.get_blob(self.old_revision, path)
+        return self.parse_yaml(path, content.decode('utf-8') if content is not None else None)
+
+    def get_script_package(self, package_path):
+        """
+        Read a script package.
+
+        Returns:
+            tuple -- the yml path, the parsed yml and the code of the script
+        """
+        package_path = package_path.rstrip('/')
+        file_paths = self.list_dir(package_path)
+        yml_paths = [file_path for file_path in file_paths if file_path.endswith('.yml')]
+        if not yml_paths:
+            raise Exception(f'No yml files found in package path: {package_path}. Is this really a package dir?')
+
+        yml_path = yml_paths[0]
+        data_dictionary = self.load_yaml(yml_path)
+        script_type = TYPE_TO_EXTENSION[data_dictionary.get('type')]
+        code_path = Unifier.find_code_file(package_path, [file_path for file_path in file_paths
+                                                          if file_path.endswith(script_type)])
+        return yml_path, data_dictionary, self.read(code_path)
+
+
+def get_changed_object_data(file_path, data_dictionary):
+    """
+    Get the id_set section and the {id: data} entry of a changed content file.
+
+    Returns:
+        tuple -- the section and the entry, (None, None) for files which are not a part of the id_set update
+    """
+    if re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
+            re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
+        return 'integrations', get_integration_data(file_path, data_dictionary=data_dictionary)
+    if re.match(SCRIPT_REGEX, file_path, re.IGNORECASE) or re.match(TEST_SCRIPT_REGEX, file_path, re.IGNORECASE):
+        return 'scripts', get_script_data(file_path, data_dictionary=data_dictionary)
+    if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+        return 'playbooks', get_playbook_data(file_path, data_dictionary=data_dictionary)
+    if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+        return 'TestPlaybooks', get_playbook_data(file_path, data_dictionary=data_dictionary)
+    return None, None
+
+
+def load_id_set_to_update(id_set_path, prev_ver):
+    try:
+        return IDSet.load(id_set_path)
+    except ValueError as ex:
+        if "Expecting property name" in str(ex):
+            # if we got this error it means we have corrupted id_set.json
+            # usually it will happen if we merged from master and we had a conflict in id_set.json
+            # so we checkout the id_set.json to be exact as in master and then run update_id_set
+            run_command("git checkout {} {}".format(prev_ver, id_set_path))
+            return IDSet.load(id_set_path)
+        raise
+
+
+def update_id_set(id_set_path='./Tests/id_set.json', prev_ver='origin/master', revision=None):
+    """
+    Update the id_set with the content files changed on the current branch.
+
+    By default, the changes of the current branch compared to prev_ver and the uncommitted changes are read from the
+    working tree. When a revision is given, the changes of the commit range prev_ver...revision are read directly from
+    the git objects of the revision, and the working tree is not used. Either way, each changed file is parsed once.
+    """
     print("Getting added files")
-    files_string = run_command("git diff --name-status HEAD")
-    second_files_string = run_command("git diff --name-status origin/master...{}".format(branch_name))
-    added_files, modified_files, added_scripts, modified_scripts = \
-        get_changed_files(files_string + '\n' + second_files_string)
+    git_context = get_git_context()
+    if revision:
+        files_string = git_context.get_name_status("{}...{}".format(prev_ver, revision))
+        old_revision = git_context.get_merge_base(prev_ver, revision)
+    else:
+        files_string = git_context.get_name_status('HEAD') + '\n' + \
+            git_context.get_name_status("{}...HEAD".format(prev_ver))
+        # the same base `git diff HEAD` gives for the changes of the versions
+        old_revision = 'HEAD'
+    added_files, modified_files, added_scripts, modified_scripts = get_changed_files(files_string)
 
     if added_files or modified_files or added_scripts or modified_scripts:
         print("Updating id_set.json")
+        ids_dict = load_id_set_to_update(id_set_path, prev_ver)
+
+        with ChangedContentReader(old_revision, revision) as reader:
+            for file_path in sorted(added_files):
+                section, obj_data = get_changed_object_data(file_path, reader.load_yaml(file_path))
+                if section:
+                    add_new_object_to_id_set(get_entry_id(obj_data), obj_data, ids_dict[section])
+                    print("Adding {0} to id_set".format(get_entry_id(obj_data)))
+
+            for file_path in sorted(modified_files):
+                section, obj_data = get_changed_object_data(file_path, reader.load_yaml(file_path))
+                if section:
+                    update_object_in_id_set(get_entry_id(obj_data), obj_data, file_path, ids_dict[section],
+                                            old_file_data=reader.load_old_yaml(file_path))
+                    print("updated {0} in id_set".format(get_entry_id(obj_data)))
+
+            for package_path in sorted(added_scripts):
+                yml_path, data_dictionary, code = reader.get_script_package(package_path)
+                obj_data = get_script_data(yml_path, script_code=code, data_dictionary=data_dictionary)
+                add_new_object_to_id_set(get_entry_id(obj_data), obj_data, ids_dict['scripts'])
+                print("Adding {0} to id_set".format(get_entry_id(obj_data)))
+
+            for package_path in sorted(modified_scripts):
+                yml_path, data_dictionary, code = reader.get_script_package(package_path)
+                obj_data = get_script_data(yml_path, script_code=code, data_dictionary=data_dictionary)
+                update_object_in_id_set(get_entry_id(obj_data), obj_data, yml_path, ids_dict['scripts'],
+                                        old_file_data=reader.load_old_yaml(yml_path))
+                print("updated {0} in id_set".format(get_entry_id(obj_data)))
 
-        with open('./Tests/id_set.json', 'r') as id_set_file:
-            try:
-                ids_dict = json.load(id_set_file, object_pairs_hook=OrderedDict)
-            except ValueError as ex:
-                if "Expecting property name" in str(ex):
-                    # if we got this error it means we have corrupted id_set.json
-                    # usually it will happen if we merged from master and we had a conflict in id_set.json
-                    # so we checkout the id_set.json to be exact as in master and then run update_id_set
-                    run_command("git checkout origin/master Tests/id_set.json")
-                    with open('./Tests/id_set.json', 'r') as id_set_file_from_master:
-                        ids_dict = json.load(id_set_file_from_master, object_pairs_hook=OrderedDict)
-                else:
-                    raise
-
-        test_playbook_set = ids_dict['TestPlaybooks']
-        integration_set = ids_dict['integrations']
-        playbook_set = ids_dict['playbooks']
-        script_set = ids_dict['scripts']
-
-    if added_files:
-        for file_path in added_files:
-            if re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
-                    re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_integration_data(file_path),
-                                         integration_set)
-                print("Adding {0} to id_set".format(get_script_or_integration_id(file_path)))
-            if re.match(SCRIPT_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_script_data(file_path),
-                                         script_set)
-                print("Adding {0} to id_set".format(get_script_or_integration_id(file_path)))
-            if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(collect_ids(file_path), get_playbook_data(file_path),
-                                         playbook_set)
-                print("Adding {0} to id_set".format(collect_ids(file_path)))
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(collect_ids(file_path), get_playbook_data(file_path),
-                                         test_playbook_set)
-                print("Adding {0} to id_set".format(collect_ids(file_path)))
-            if re.match(TEST_SCRIPT_REGEX, file_path, re.IGNORECASE):
-                add_new_object_to_id_set(get_script_or_integration_id(file_path), get_script_data(file_path),
-                                         script_set)
-                print("Adding {0} to id_set".format(collect_ids(file_path)))
-
-    if modified_files:
-        for file_path in modified_files:
-            if re.match(INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
-                    re.match(INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
-                id_ = get_script_or_integration_id(file_path)
-                integration_data = get_integration_data(file_path)
-                update_object_in_id_set(id_, integration_data, file_path, integration_set)
-                print("updated {0} in id_set".format(id_))
-            if re.match(SCRIPT_REGEX, file_path, re.IGNORECASE) or re.match(TEST_SCRIPT_REGEX,
-                                                                            file_path, re.IGNORECASE):
-                id_ = get_script_or_integration_id(file_path)
-                script_data = get_script_data(file_path)
-                update_object_in_id_set(id_, script_data, file_path, script_set)
-                print("updated {0} in id_set".format(id_))
-            if re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                id_ = collect_ids(file_path)
-                playbook_data = get_playbook_data(file_path)
-                update_object_in_id_set(id_, playbook_data, file_path, playbook_set)
-                print("updated {0} in id_set".format(id_))
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                id_ = collect_ids(file_path)
-                playbook_data = get_playbook_data(file_path)
-                update_object_in_id_set(id_, playbook_data, file_path, test_playbook_set)
-                print("updated {0} in id_set".format(id_))
-
-    if added_scripts:
-        for added_script_package in added_scripts:
-            unifier = Unifier(added_script_package)
-            yml_path, code = unifier.get_script_package_data()
-            add_new_object_to_id_set(get_script_or_integration_id(yml_path),
-                                     get_script_data(yml_path, script_code=code), script_set)
-            print("Adding {0} to id_set".format(get_script_or_integration_id(yml_path)))
-
-    if modified_scripts:
-        for modified_script_package in added_scripts:
-            unifier = Unifier(modified_script_package)
-            yml_path, code = unifier.get_script_package_data()
-            update_object_in_id_set(get_script_or_integration_id(yml_path),
-                                    get_script_data(yml_path, script_code=code), yml_path, script_set)
-            print("Adding {0} to id_set".format(get_script_or_integration_id(yml_path)))
-
-    if added_files or modified_files:
-        new_ids_dict = OrderedDict()
         # we sort each time the whole set in case someone manually changed something
         # it shouldn't take too much time
-        new_ids_dict['scripts'] = sort(script_set)
-        new_ids_dict['playbooks'] = sort(playbook_set)
-        new_ids_dict['integrations'] = sort(integration_set)
-        new_ids_dict['TestPlaybooks'] = sort(test_playbook_set)
+        for section in ('scripts', 'playbooks', 'integrations', 'TestPlaybooks'):
+            sort(ids_dict[section])
 
-        with open('./Tests/id_set.json', 'w') as id_set_file:
-            json.dump(new_ids_dict, id_set_file, indent=4)
+        ids_dict.dump(id_set_path)
 
     print("Finished updating id_set.json")
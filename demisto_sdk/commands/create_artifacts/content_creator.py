@@ -5,12 +5,13 @@ import glob
 import json
 import shutil
 import zipfile
-from typing import List
+from typing import List, Optional
 from ruamel.yaml import YAML
 
 from demisto_sdk.commands.unify.unifier import Unifier
+from demisto_sdk.commands.common.content_inventory import ContentInventory, get_content_inventory
 from demisto_sdk.commands.common.tools import get_child_directories, get_child_files, print_warning, \
-    get_yml_paths_in_dir, print_error, find_type, get_common_server_path
+    print_error, find_type, get_common_server_path
 from demisto_sdk.commands.common.git_tools import get_current_working_branch
 from demisto_sdk.commands.common.constants import INTEGRATIONS_DIR, MISC_DIR, PLAYBOOKS_DIR, REPORTS_DIR,\
     DASHBOARDS_DIR, WIDGETS_DIR, SCRIPTS_DIR, INCIDENT_FIELDS_DIR, CLASSIFIERS_DIR, LAYOUTS_DIR, CONNECTIONS_DIR, \
@@ -64,6 +65,15 @@ class ContentCreator:
         self.file_name_max_size = 85
         self.long_file_names = []  # type:List
 
+        # the content directories are listed from an inventory of the repository, scanned once for the whole run
+        self._inventory: Optional[ContentInventory] = None
+
+    @property
+    def inventory(self) -> ContentInventory:
+        if self._inventory is None:
+            self._inventory = get_content_inventory()
+        return self._inventory
+
     def run(self):
         """Runs the content creator and returns the appropriate status code for the operation.
 
@@ -97,10 +107,10 @@ class ContentCreator:
         dest_dir = dest_dir if dest_dir else self.content_bundle
         skip_dest_dir = skip_dest_dir if skip_dest_dir else self.test_bundle
 
-        scanned_packages = glob.glob(os.path.join(package_dir, '*/'))
+        scanned_packages = self.inventory.glob(package_dir, '*', only_dirs=True)
         package_dir_name = os.path.basename(package_dir)
         for package in scanned_packages:
-            ymls, _ = get_yml_paths_in_dir(package, error_msg='')
+            ymls, _ = self.inventory.get_yml_paths_in_dir(package, error_msg='')
             if not ymls or (len(ymls) == 1 and ymls[0].endswith('_unified.yml')):
                 msg = 'Skipping package: {} -'.format(package)
                 if not ymls:
@@ -166,7 +176,7 @@ class ContentCreator:
         :param bundle: destination bundle
         :return: None
         """
-        scan_files, _ = get_yml_paths_in_dir(dir_path, error_msg='')
+        scan_files, _ = self.inventory.get_yml_paths_in_dir(dir_path, error_msg='')
         content_files = 0
         dir_name = os.path.basename(dir_path)
         for path in scan_files:
@@ -199,7 +209,7 @@ class ContentCreator:
         """
         # handle *.json files
         dir_name = os.path.basename(dir_path)
-        scan_files = glob.glob(os.path.join(dir_path, '*.json'))
+        scan_files = self.inventory.glob(dir_path, '*.json')
         for path in scan_files:
             dpath = os.path.basename(path)
             if dir_name == 'IncidentTypes':
@@ -243,10 +253,10 @@ class ContentCreator:
         :return: None
         """
         print('Copying test files to test bundle')
-        scan_files = glob.glob(os.path.join(test_playbooks_dir, '*'))
+        scan_files = self.inventory.glob(test_playbooks_dir, '*')
         for path in scan_files:
             if os.path.isdir(path):
-                non_circle_tests = glob.glob(os.path.join(path, '*'))
+                non_circle_tests = self.inventory.glob(path, '*')
                 for new_path in non_circle_tests:
                     print(f'copying path {new_path}')
                     shutil.copyfile(new_path, os.path.join(self.test_bundle, os.path.basename(new_path)))
@@ -315,7 +325,7 @@ class ContentCreator:
                 if dir_name in DIR_TO_PREFIX:
                     packages_dirs = get_child_directories(content_dir)
                     for package_dir in packages_dirs:
-                        ymls, _ = get_yml_paths_in_dir(package_dir, error_msg='')
+                        ymls, _ = self.inventory.get_yml_paths_in_dir(package_dir, error_msg='')
                         if not ymls or (len(ymls) == 1 and ymls[0].endswith('_unified.yml')):
                             msg = 'Skipping package: {} -'.format(package_dir)
                             if not ymls:
@@ -1,9 +1,17 @@
-from demisto_sdk.commands.common.update_id_set import re_create_id_set
+from demisto_sdk.commands.common.update_id_set import merge_id_set_shards, parse_shard, re_create_id_set
 
 
 class IDSetCreator:
-    def __init__(self, output=''):
+    def __init__(self, output='', incremental=False, processes=None, reverse_dependencies=False, shard=None):
         self.output = output
+        self.incremental = incremental
+        self.processes = processes
+        self.reverse_dependencies = reverse_dependencies
+        self.shard = parse_shard(shard) if shard else None
 
     def create_id_set(self):
-        return re_create_id_set(self.output)
+        return re_create_id_set(self.output, incremental=self.incremental, processes=self.processes,
+                                reverse_dependencies=self.reverse_dependencies, shard=self.shard)
+
+    def merge_id_set(self, shard_paths):
+        return merge_id_set_shards(shard_paths, self.output, reverse_dependencies=self.reverse_dependencies)
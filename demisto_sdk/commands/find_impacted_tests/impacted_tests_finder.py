@@ -0,0 +1,233 @@
+import os
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+from demisto_sdk.commands.common.constants import (CONF_REGEX, DIR_LIST, PACKAGE_SUPPORTING_DIRECTORIES, PACKS_DIR,
+                                                   TEST_PLAYBOOKS_DIR)
+from demisto_sdk.commands.common.git_tools import get_git_context
+from demisto_sdk.commands.common.id_set import IDSet, ReverseDependencyIndex, get_entry_id
+from demisto_sdk.commands.common.tools import LOG_COLORS, print_color, print_warning
+from demisto_sdk.commands.common.update_id_set import get_changed_files, load_reverse_dependencies
+
+# test values used in the yml files to state that an entity has no test playbook
+NO_TESTS_PREFIX = 'no test'
+
+# the top directories of the content files, a changed content file which is not in the id_set may impact any test
+CONTENT_TOP_DIRS = set(DIR_LIST + [TEST_PLAYBOOKS_DIR, PACKS_DIR])
+
+# the exit code of the command when some changed content files are not in the id_set, so the selected tests may not
+# cover the change
+UNMAPPED_PATHS_EXIT_CODE = 2
+
+
+def get_changed_paths(files_string: str) -> Set[str]:
+    """Get the changed paths out of a `git diff --name-status` output.
+
+    The added and modified content files and script packages are parsed by get_changed_files. Deleted and renamed
+    files, and the code and test files of integration packages, are taken as is - their entity is found by the
+    directories containing them.
+    """
+    changed_paths: Set[str] = set()
+    for changed_files in get_changed_files(files_string):
+        changed_paths.update(changed_files)
+
+    for line in files_string.split('\n'):
+        file_data = line.split()
+        if len(file_data) >= 2:
+            # a rename or a copy is listed as: status, old path, new path
+            changed_paths.update(file_data[1:])
+
+    return {os.path.normpath(path) for path in changed_paths}
+
+
+def is_content_path(path: str) -> bool:
+    path = os.path.normpath(path)
+    return path == os.path.normpath(CONF_REGEX) or path.split(os.sep)[0] in CONTENT_TOP_DIRS
+
+
+def get_package_dir(file_path: str):
+    """Get the package directory of a package yml (e.g. Packs/Pack/Integrations/Integration/Integration.yml)"""
+    package_dir = os.path.dirname(file_path)
+    if os.path.basename(os.path.dirname(package_dir)) in PACKAGE_SUPPORTING_DIRECTORIES:
+        return package_dir
+    return None
+
+
+class ImpactedTestsFinder:
+    """Find the test playbooks to run for a set of changed files.
+
+    The id_set is turned once into a path index and a reverse dependency graph, so finding the impacted tests is a
+    breadth first walk over the entities using the changed ones, visiting each entity once.
+
+    Attributes:
+        id_set (IDSet): the id_set the dependencies are taken from.
+        reverse_dependencies (ReverseDependencyIndex): the entities using each script, playbook and integration.
+        nodes_by_path (dict): file path or package directory -> the (section, id) nodes defined in it.
+    """
+
+    def __init__(self, id_set, reverse_dependencies: ReverseDependencyIndex = None):
+        self.id_set = id_set if isinstance(id_set, IDSet) else IDSet(id_set)
+        self.reverse_dependencies = reverse_dependencies or ReverseDependencyIndex.from_id_set(self.id_set)
+        self.nodes_by_path: Dict[str, Dict[Tuple[str, str], None]] = {}
+        self.integration_commands: Dict[str, Set[str]] = {}
+        for section, section_data in self.id_set.items():
+            for entry in section_data:
+                entry_id = get_entry_id(entry)
+                entry_data = entry[entry_id]
+                if not isinstance(entry_data, dict):
+                    continue
+
+                if section == 'integrations':
+                    self.integration_commands.setdefault(entry_id, set()).update(entry_data.get('commands') or [])
+
+                file_path = entry_data.get('file_path')
+                if file_path:
+                    file_path = os.path.normpath(file_path)
+                    node = (section, entry_id)
+                    self.nodes_by_path.setdefault(file_path, {})[node] = None
+                    package_dir = get_package_dir(file_path)
+                    if package_dir:
+                        # a change to any file of a package (code, tests, test data, image, etc.) is mapped to the
+                        # entity of the package
+                        self.nodes_by_path.setdefault(package_dir, {})[node] = None
+
+    @classmethod
+    def from_id_set_path(cls, id_set_path: str) -> 'ImpactedTestsFinder':
+        return cls(IDSet.load(id_set_path), load_reverse_dependencies(id_set_path))
+
+    def get_path_nodes(self, path: str) -> List[Tuple[str, str]]:
+        """Get the (section, id) nodes of the id_set defined in a path.
+
+        A path is matched by itself, or by its closest directory which is the package of an id_set entity.
+        """
+        path = os.path.normpath(path)
+        if path in self.nodes_by_path:
+            return list(self.nodes_by_path[path])
+
+        directory = os.path.dirname(path)
+        while directory not in self.nodes_by_path and os.path.dirname(directory) != directory:
+            directory = os.path.dirname(directory)
+        return list(self.nodes_by_path.get(directory, {}))
+
+    def get_changed_nodes(self, changed_paths) -> List[Tuple[str, str]]:
+        """Map the changed paths to the (section, id) nodes of the id_set defined in them"""
+        changed_nodes: Dict[Tuple[str, str], None] = {}
+        for path in changed_paths:
+            changed_nodes.update(dict.fromkeys(self.get_path_nodes(path)))
+
+        return list(changed_nodes)
+
+    def get_unmapped_paths(self, changed_paths) -> List[str]:
+        """Get the changed content paths which are not mapped to any id_set entity.
+
+        These are the content entities missing in the id_set (e.g. new entities), conf.json and the pack files (e.g.
+        the pack metadata), the tests they impact can not be found by the id_set.
+        """
+        return sorted(os.path.normpath(path) for path in changed_paths
+                      if is_content_path(path) and not self.get_path_nodes(path))
+
+    def get_consumers(self, node: Tuple[str, str]) -> List[Tuple[str, str]]:
+        """Get the (section, id) nodes of the entities using the given node"""
+        section, entry_id = node
+        if section == 'scripts':
+            consumers = self.reverse_dependencies.get_script_consumers(entry_id)
+        elif section in ('playbooks', 'TestPlaybooks'):
+            consumers = self.reverse_dependencies.get_playbook_consumers(entry_id)
+        elif section == 'integrations':
+            consumers = self.reverse_dependencies.get_integration_consumers(
+                entry_id, commands=sorted(self.integration_commands.get(entry_id, [])))
+        else:
+            consumers = []
+
+        return [(consumer_section, consumer_id) for consumer_section, consumer_id, _ in consumers]
+
+    def get_impacted_nodes(self, changed_paths) -> List[Tuple[str, str]]:
+        """Get the changed nodes and all the nodes using them, directly or transitively"""
+        impacted_nodes = dict.fromkeys(self.get_changed_nodes(changed_paths))
+        nodes_to_visit = deque(impacted_nodes)
+        while nodes_to_visit:
+            for consumer in self.get_consumers(nodes_to_visit.popleft()):
+                if consumer not in impacted_nodes:
+                    impacted_nodes[consumer] = None
+                    nodes_to_visit.append(consumer)
+
+        return list(impacted_nodes)
+
+    def find_tests(self, changed_paths, verbose: bool = False) -> List[str]:
+        """Find the test playbooks to run for the changed paths.
+
+        The tests are the impacted test playbooks themselves, and the tests listed by the impacted entities.
+
+        Returns:
+            list. The sorted ids of the test playbooks.
+        """
+        test_playbooks = self.id_set.get_section('TestPlaybooks')
+        tests: Dict[str, None] = {}
+        for section, entry_id in self.get_impacted_nodes(changed_paths):
+            if verbose:
+                print(f'{section}: {entry_id} is impacted by the change')
+            if section == 'TestPlaybooks':
+                tests[entry_id] = None
+                continue
+
+            for entry_data in self.id_set[section].get_by_id(entry_id):
+                entry_tests = entry_data.get('tests') or []
+                for test in [entry_tests] if isinstance(entry_tests, str) else entry_tests:
+                    if test_playbooks.has_id(test):
+                        tests[test] = None
+                    elif not str(test).lower().startswith(NO_TESTS_PREFIX):
+                        print_warning(f'The test playbook {test} of {entry_id} was not found in the id set')
+
+        return sorted(tests)
+
+
+def get_git_changed_files(prev_ver: str) -> str:
+    """Get the `git diff --name-status` of the current branch against prev_ver, including uncommitted changes"""
+    git_context = get_git_context()
+    files_string = git_context.get_name_status('HEAD')
+    second_files_string = git_context.get_name_status(f'{prev_ver}...HEAD')
+    return f'{files_string}\n{second_files_string}'
+
+
+def find_impacted_tests(id_set_path: str = './Tests/id_set.json', prev_ver: str = 'origin/master',
+                        changed_files: str = None, output: str = None,
+                        verbose: bool = False) -> Tuple[List[str], List[str]]:
+    """Find the test playbooks impacted by the changes of the current branch and print them.
+
+    The changed content files which are not in the id_set are printed as a warning - the tests they impact are not
+    found, so the selected tests may not cover the change.
+
+    Args:
+        id_set_path: the path of the id_set.json file.
+        prev_ver: the git revision to compare the current branch against.
+        changed_files: comma separated paths of changed files to use instead of the git diff.
+        output: a file to write the test playbook ids to, one per line.
+        verbose: whether to print the impacted entities.
+
+    Returns:
+        tuple. The sorted ids of the impacted test playbooks, and the sorted changed content paths which are not in
+        the id_set.
+    """
+    if changed_files:
+        changed_paths = {os.path.normpath(path.strip()) for path in changed_files.split(',') if path.strip()}
+    else:
+        changed_paths = get_changed_paths(get_git_changed_files(prev_ver))
+
+    finder = ImpactedTestsFinder.from_id_set_path(id_set_path)
+    tests = finder.find_tests(changed_paths, verbose=verbose)
+    unmapped_paths = finder.get_unmapped_paths(changed_paths)
+    if output:
+        with open(output, 'w') as output_file:
+            output_file.write('\n'.join(tests))
+
+    if tests:
+        print_color(f'Found {len(tests)} impacted test playbooks:', LOG_COLORS.GREEN)
+        print('\n'.join(tests))
+    else:
+        print_color('No test playbooks are impacted by the change.', LOG_COLORS.GREEN)
+
+    if unmapped_paths:
+        print_warning('The following changed content files are not in the id set, the selected tests may not cover '
+                      'them:\n{}'.format('\n'.join(unmapped_paths)))
+
+    return tests, unmapped_paths
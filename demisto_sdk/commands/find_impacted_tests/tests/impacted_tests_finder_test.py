@@ -0,0 +1,129 @@
+import json
+
+from demisto_sdk.commands.find_impacted_tests.impacted_tests_finder import (ImpactedTestsFinder, find_impacted_tests,
+                                                                            get_changed_paths)
+
+ID_SET = {
+    'scripts': [
+        {'script1': {'name': 'Script 1', 'file_path': 'Packs/Pack1/Scripts/Script1/Script1.yml',
+                     'tests': ['No test - no instance']}},
+        {'script2': {'name': 'Script 2', 'file_path': 'Scripts/script-Script2.yml', 'depends_on': ['script1'],
+                     'tests': ['test_playbook2', 'missing_test_playbook']}},
+        {'script3': {'name': 'Script 3', 'file_path': 'Scripts/script-Script3.yml', 'depends_on': ['command1']}},
+    ],
+    'integrations': [
+        {'integration1': {'name': 'Integration 1', 'file_path': 'Integrations/Integration1/Integration1.yml',
+                          'commands': ['command1'], 'tests': ['test_playbook3']}},
+    ],
+    'playbooks': [
+        {'playbook1': {'name': 'Playbook 1', 'file_path': 'Playbooks/playbook-Playbook1.yml',
+                       'implementing_scripts': ['script2'], 'tests': ['test_playbook1']}},
+        {'playbook2': {'name': 'Playbook 2', 'file_path': 'Playbooks/playbook-Playbook2.yml',
+                       'implementing_playbooks': ['playbook1']}},
+    ],
+    'TestPlaybooks': [
+        {'test_playbook1': {'name': 'Test Playbook 1', 'file_path': 'TestPlaybooks/playbook-Test1.yml',
+                            'implementing_playbooks': ['playbook1']}},
+        {'test_playbook2': {'name': 'Test Playbook 2', 'file_path': 'TestPlaybooks/playbook-Test2.yml',
+                            'implementing_scripts': ['script2']}},
+        {'test_playbook3': {'name': 'Test Playbook 3', 'file_path': 'TestPlaybooks/playbook-Test3.yml'}},
+        {'test_playbook4': {'name': 'Test Playbook 4', 'file_path': 'TestPlaybooks/playbook-Test4.yml',
+                            'command_to_integration': {'command1': 'integration1'}}},
+    ],
+}
+
+
+class TestImpactedTestsFinder:
+    def test_find_tests_transitive(self):
+        """
+        Given
+            - A script used by a script, which is used by a playbook, which is used by another playbook
+        When
+            - Changing the code of the first script package
+        Then
+            - The whole chain is impacted
+            - The tests listed by the impacted entities and the impacted test playbooks are selected
+        """
+        finder = ImpactedTestsFinder(ID_SET)
+        changed_paths = ['Packs/Pack1/Scripts/Script1/Script1.py']
+        assert finder.get_impacted_nodes(changed_paths) == [
+            ('scripts', 'script1'), ('scripts', 'script2'), ('playbooks', 'playbook1'),
+            ('TestPlaybooks', 'test_playbook2'), ('playbooks', 'playbook2'), ('TestPlaybooks', 'test_playbook1')]
+        assert finder.find_tests(changed_paths) == ['test_playbook1', 'test_playbook2']
+
+    def test_find_tests_of_integration(self):
+        """
+        Given
+            - An integration with a command used by a script and by a test playbook
+        When
+            - Changing the test data of the integration
+        Then
+            - Its tests and the test playbook running its command are selected
+        """
+        finder = ImpactedTestsFinder(ID_SET)
+        assert finder.find_tests(['Integrations/Integration1/test_data/response.json']) == \
+            ['test_playbook3', 'test_playbook4']
+
+    def test_find_tests_unrelated_change(self):
+        """
+        Given
+            - Changed files which are not a part of any content entity, or a changed test playbook
+        When
+            - Finding the impacted tests
+        Then
+            - Only the changed test playbook is selected
+        """
+        finder = ImpactedTestsFinder(ID_SET)
+        assert finder.find_tests(['README.md', 'Playbooks/playbook-Playbook3.yml']) == []
+        assert finder.find_tests(['./TestPlaybooks/playbook-Test3.yml']) == ['test_playbook3']
+
+    def test_get_unmapped_paths(self):
+        """
+        Given
+            - Changed content files which are not in the id_set - a new playbook, conf.json and a pack metadata - and
+              changed files which are in it or are not content files
+        When
+            - Getting the unmapped paths
+        Then
+            - Only the content files which are not in the id_set are returned
+        """
+        finder = ImpactedTestsFinder(ID_SET)
+        assert finder.get_unmapped_paths([
+            'README.md', 'Playbooks/playbook-Playbook3.yml', 'Tests/conf.json', 'Packs/Pack1/pack_metadata.json',
+            './Scripts/script-Script2.yml', 'Integrations/Integration1/Integration1.py', 'Tests/scripts/script.sh',
+        ]) == ['Packs/Pack1/pack_metadata.json', 'Playbooks/playbook-Playbook3.yml', 'Tests/conf.json']
+
+
+def test_get_changed_paths():
+    files_string = '\n'.join([
+        'M\tScripts/script-Script2.yml',
+        'A\tScripts/Script4/Script4.py',
+        'D\tIntegrations/Integration1/Integration1_test.py',
+        'R100\tPlaybooks/playbook-Playbook1.yml\tPlaybooks/playbook-Renamed.yml',
+    ])
+    assert get_changed_paths(files_string) == {
+        'Scripts/script-Script2.yml', 'Scripts/Script4', 'Scripts/Script4/Script4.py',
+        'Integrations/Integration1/Integration1_test.py', 'Playbooks/playbook-Playbook1.yml',
+        'Playbooks/playbook-Renamed.yml'}
+
+
+def test_find_impacted_tests(tmp_path, capsys):
+    id_set_path = str(tmp_path / 'id_set.json')
+    with open(id_set_path, 'w') as id_set_file:
+        json.dump(ID_SET, id_set_file)
+
+    output = str(tmp_path / 'filter_file.txt')
+    tests, unmapped_paths = find_impacted_tests(
+        id_set_path, changed_files='Scripts/script-Script3.yml, Playbooks/playbook-Playbook2.yml', output=output)
+    assert (tests, unmapped_paths) == ([], [])
+
+    tests, unmapped_paths = find_impacted_tests(id_set_path, changed_files='Playbooks/playbook-Playbook1.yml',
+                                                output=output)
+    assert (tests, unmapped_paths) == (['test_playbook1'], [])
+    with open(output) as output_file:
+        assert output_file.read() == 'test_playbook1'
+
+    capsys.readouterr()
+    tests, unmapped_paths = find_impacted_tests(id_set_path, changed_files='Playbooks/playbook-New.yml')
+    assert (tests, unmapped_paths) == ([], ['Playbooks/playbook-New.yml'])
+    assert 'Playbooks/playbook-New.yml' in capsys.readouterr().out
@@ -1,11 +1,14 @@
 import os
-from demisto_sdk.commands.common.update_id_set import get_depends_on
+from demisto_sdk.commands.common.id_set import ReverseDependencyIndex
+from demisto_sdk.commands.common.update_id_set import get_depends_on, load_reverse_dependencies
 from demisto_sdk.commands.common.tools import get_yaml, print_warning, print_error,\
     get_from_version
 from demisto_sdk.commands.generate_docs.common import save_output, generate_table_section, stringEscapeMD, \
     generate_list_section, build_example_dict, generate_section, generate_numbered_section
 from demisto_sdk.commands.create_id_set.create_id_set import IDSetCreator
 
+DEFAULT_ID_SET_PATH = './Tests/id_set.json'
+
 
 def generate_script_doc(input, examples, output: str = None, permissions: str = None,
                         limitations: str = None, insecure: bool = False, verbose: bool = False):
@@ -40,10 +43,14 @@ def generate_script_doc(input, examples, output: str = None, permissions: str =
         # get script dependencies
         dependencies, _ = get_depends_on(script)
 
-        # get the script usages by the id set
-        id_set_creator = IDSetCreator()
-        id_set = id_set_creator.create_id_set()
-        used_in = get_used_in(id_set, script_id)
+        # get the script usages by the reverse dependency index kept next to the id set, or by a new id set
+        reverse_dependencies = load_reverse_dependencies(DEFAULT_ID_SET_PATH)
+        if reverse_dependencies is None:
+            id_set_creator = IDSetCreator()
+            id_set = id_set_creator.create_id_set()
+            used_in = get_used_in(id_set, script_id)
+        else:
+            used_in = get_used_in(None, script_id, reverse_dependencies)
 
         description = script.get('comment', '')
         deprecated = script.get('deprecated', False)
@@ -176,25 +183,21 @@ def get_outputs(script):
     return outputs, errors
 
 
-def get_used_in(id_set, script_id):
+def get_used_in(id_set, script_id, reverse_dependencies=None):
     """
     Gets the integrations, scripts and playbooks that used the input script, without test playbooks.
-    :param id_set: updated id_set object.
+    :param id_set: updated id_set object, not used when the reverse dependency index is given.
     :param script_id: the script id.
+    :param reverse_dependencies: the reverse dependency index of the id_set, built from the id_set if not given.
     :return: list of integrations, scripts and playbooks that used the input script
     """
-    used_in_list = set()
+    if reverse_dependencies is None:
+        reverse_dependencies = ReverseDependencyIndex.from_id_set(id_set)
 
-    id_set_sections = list(id_set.keys())
-    id_set_sections.remove('TestPlaybooks')
-
-    for key in id_set_sections:
-        items = id_set[key]
-        for item in items:
-            key = list(item.keys())[0]
-            scripts = item[key].get('implementing_scripts', [])
-            if scripts and script_id in scripts:
-                used_in_list.add(item[key].get('name', []))
+    used_in_list = set()
+    for section, _, name in reverse_dependencies.get_consumers('implementing_scripts', script_id):
+        if section != 'TestPlaybooks':
+            used_in_list.add(name)
     used_in_list = list(used_in_list)
     used_in_list.sort()
     return used_in_list
@@ -5,8 +5,10 @@ from typing import Tuple, List
 
 from demisto_sdk.commands.lint.linter import Linter
 from demisto_sdk.commands.common.configuration import Configuration
-from demisto_sdk.commands.common.constants import PACKS_DIR, INTEGRATIONS_DIR, SCRIPTS_DIR, BETA_INTEGRATIONS_DIR
-from demisto_sdk.commands.common.tools import get_dev_requirements, print_color, LOG_COLORS, run_command, \
+from demisto_sdk.commands.common.constants import PACKS_DIR, PACKAGE_SUPPORTING_DIRECTORIES
+from demisto_sdk.commands.common.content_inventory import get_content_inventory
+from demisto_sdk.commands.common.git_tools import get_git_context
+from demisto_sdk.commands.common.tools import get_dev_requirements, print_color, LOG_COLORS, \
     set_log_verbose, print_error, \
     get_common_server_dir, get_common_server_dir_pwsh
 
@@ -86,25 +88,13 @@ class LintManager:
             List. A list of integration, script and beta_integration names.
         """
         print("Getting all directory names")
-        all_directories = []
+        inventory = get_content_inventory()
         # get all integrations, scripts and beta_integrations from packs
-        for root, _, _ in os.walk(PACKS_DIR):
-            if 'Packs/' in root:
-                if ('Integrations/' in root or 'Scripts/' in root or 'Beta_Integrations/' in root) \
-                        and len(root.split('/')) == 4:
-                    all_directories.append(root)
+        all_directories = [path for path in inventory.glob(PACKS_DIR, '*', '*', '*', only_dirs=True)
+                           if os.path.basename(os.path.dirname(path)) in PACKAGE_SUPPORTING_DIRECTORIES]
 
-        for root, _, _ in os.walk(INTEGRATIONS_DIR):
-            if 'Integrations/' in root and len(root.split('/')) == 2:
-                all_directories.append(root)
-
-        for root, _, _ in os.walk(SCRIPTS_DIR):
-            if 'Scripts/' in root and len(root.split('/')) == 2:
-                all_directories.append(root)
-
-        for root, _, _ in os.walk(BETA_INTEGRATIONS_DIR):
-            if 'Beta_Integrations/' in root and len(root.split('/')) == 2:
-                all_directories.append(root)
+        for directory in PACKAGE_SUPPORTING_DIRECTORIES:
+            all_directories.extend(inventory.glob(directory, '*', only_dirs=True))
 
         return all_directories
 
@@ -195,7 +185,7 @@ class LintManager:
         print("Filtering out directories that did not change")
         pkgs_to_run = []
 
-        current_branch = run_command(f"git rev-parse --abbrev-ref HEAD")
+        current_branch = get_git_context().get_current_branch()
         print(f'current_branch = {current_branch}')
 
         if os.environ.get('CIRCLE_COMPARE_URL'):
@@ -217,16 +207,21 @@ class LintManager:
             bool. True if there is a difference and False otherwise.
         """
 
+        git_context = get_git_context()
         # This will check if there are any changes between current master version and the last commit in master
         if os.environ.get('CIRCLE_COMPARE_URL') and current_branch == "master":
-            changes_from_last_commit_vs_master = run_command("git diff --name-only HEAD..HEAD^")
+            changes_from_last_commit_vs_master = '\n'.join(git_context.get_name_only('HEAD..HEAD^'))
         else:
             # This will return a list of all files that changed up until the last commit (not including any changes
             # which were made but not yet committed).
-            changes_from_last_commit_vs_master = run_command(f"git diff origin/master...{current_branch} --name-only")
+            changes_from_last_commit_vs_master = '\n'.join(
+                git_context.get_name_only(f'origin/master...{current_branch}'))
 
         # This will check if any changes were made to the files in the package (pkg_dir) but are yet to be committed.
-        changes_since_last_commit = run_command(f"git diff --name-only -- {pkg_dir}")
+        # The uncommitted changes are listed once, relative to the current directory as pkg_dir is.
+        pkg_path = os.path.relpath(pkg_dir).replace(os.sep, '/')
+        changes_since_last_commit = [path for path in git_context.get_name_only(relative=True)
+                                     if path == pkg_path or path.startswith(pkg_path + '/')]
 
         # if the package is in the list of changed files or if any files within the package were changed
         # but not yet committed, return True
@@ -3,19 +3,29 @@ import os
 import math
 import json
 import string
+import sys
 import PyPDF2
+from collections import Counter
+from contextlib import redirect_stdout
+from multiprocessing import Pool
 
 from bs4 import BeautifulSoup
 from demisto_sdk.commands.common.constants import re, REQUIRED_YML_FILE_TYPES, PACKS_DIR, PACKS_WHITELIST_FILE_NAME, \
     INTEGRATION_README_REGEX, EXTERNAL_PR_REGEX
-from demisto_sdk.commands.common.tools import run_command, print_error, print_color, LOG_COLORS, checked_type, \
+from demisto_sdk.commands.common.tools import print_error, print_color, LOG_COLORS, checked_type, \
     is_file_path_in_pack, get_pack_name, print_warning
 
 # secrets settings
 # Entropy score is determined by shanon's entropy algorithm, most English words will score between 1.5 and 3.5
 from demisto_sdk.commands.common.configuration import Configuration
+from demisto_sdk.commands.common.git_tools import get_git_context
+from demisto_sdk.commands.secrets.substring_matcher import SubstringMatcher
 
 ENTROPY_THRESHOLD = 4.0
+# the entropy of a string is at most log2 of the number of its distinct characters, so a string with less distinct
+# characters (or a shorter string) can not reach the threshold
+MIN_HIGH_ENTROPY_DISTINCT_CHARS = math.ceil(2 ** ENTROPY_THRESHOLD)
+PRINTABLE_CHARS = frozenset(string.printable)
 ACCEPTED_FILE_STATUSES = ['m', 'a']
 SKIPPED_FILES = {'secrets_white_list', 'id_set.json', 'conf.json', 'Pipfile', 'secrets-ignore', 'ami_builds.json',
                  'secrets_test.py', 'secrets.py', 'constants.py', 'core.py', 'pack_metadata.json'}
@@ -51,22 +61,80 @@ IPV4_REGEX = r'\b(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0
 DATES_REGEX = r'((\d{4}[/.-]\d{2}[/.-]\d{2})[T\s](\d{2}:?\d{2}:?\d{2}:?(\.\d{5,10})?([+-]\d{2}:?\d{2})?Z?)?)'
 # false positives
 UUID_REGEX = r'([\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{8,12})'
+# docker images version are detected as ips. so we ignore and whitelist them
+DOCKER_IMAGE_VERSION_REGEX = r'dockerimage:\s*\w*demisto/\w+:(\d+.\d+.\d+.\d+)'
 # disable-secrets-detection-end
 
+COMPILED_DATES_REGEX = re.compile(DATES_REGEX)
+COMPILED_UUID_REGEX = re.compile(UUID_REGEX)
+COMPILED_DOCKER_IMAGE_VERSION_REGEX = re.compile(DOCKER_IMAGE_VERSION_REGEX)
+COMPILED_URLS_REGEX = re.compile(URLS_REGEX)
+COMPILED_EMAIL_REGEX = re.compile(EMAIL_REGEX)
+# an ipv6 address starts with up to 4 hex digits followed by a colon - checking it first skips the ipv6 alternatives at
+# most positions of the text, without changing the matches
+IPV6_PREFIX_LOOKAHEAD = r'(?=[0-9A-Fa-f]{0,4}:)'
+COMPILED_IPV6_REGEX = re.compile(IPV6_PREFIX_LOOKAHEAD + IPV6_REGEX)
+COMPILED_IPV4_REGEX = re.compile(IPV4_REGEX)
+# all the regexes of regex_for_secrets in one pattern, to find the lines with matches by a single scan of a file. The
+# groups are made non capturing as only the position of a match is needed, the whitespaces the dates and docker regexes
+# allow exclude the newline so a match never continues to the next line, and the first character of a match is checked
+# before trying the alternatives.
+IOC_LINES_REGEX = re.compile(r'(?=[\w.+:-])(?:' + '|'.join(re.sub(r'(?<!\\)\((?!\?)', '(?:', regex) for regex in (
+    DATES_REGEX.replace(r'[T\s]', r'(?:T|[^\S\n])'),
+    UUID_REGEX,
+    DOCKER_IMAGE_VERSION_REGEX.replace(r'\s*', r'[^\S\n]*'),
+    URLS_REGEX,
+    EMAIL_REGEX,
+    IPV6_PREFIX_LOOKAHEAD + IPV6_REGEX,
+    IPV4_REGEX,
+)) + ')')
+
+# the secrets validator of a secrets worker process, set once when the worker starts
+_worker_secrets_validator = None
+
+
+def init_secrets_worker(validator):
+    global _worker_secrets_validator
+    _worker_secrets_validator = validator
+
+
+def search_secrets_in_worker(task):
+    """Search a file for secrets by the worker validator, buffering everything it prints.
+
+    Returns:
+        tuple. The name of the file and its secrets, and the output of the search.
+    """
+    file_path, ignore_entropy = task
+    output = io.StringIO()
+    with redirect_stdout(output):
+        file_secrets = _worker_secrets_validator.search_file_secrets(file_path, ignore_entropy)
+    return file_secrets, output.getvalue()
+
 
 class SecretsValidator(object):
 
-    def __init__(self, configuration=Configuration(), is_circle=False, ignore_entropy=False, white_list_path=''):
+    def __init__(self, configuration=Configuration(), is_circle=False, ignore_entropy=False, white_list_path='',
+                 jobs=1, diff_only=False):
         self.configuration = configuration
         self.is_circle = is_circle
         self.white_list_path = white_list_path
         self.ignore_entropy = ignore_entropy
+        self.jobs = jobs
+        self.diff_only = diff_only
+        # file path -> the numbers of its lines added by the diff, a file which is not in it is searched whole
+        self.files_added_lines = {}
+        # (is pack, pack name) -> the white lists of the pack, loaded once per pack
+        self._white_listed_items = {}
+        # directory -> the contents of its integration or script yml, read once per directory
+        self._related_yml_contents = {}
 
     def get_secrets(self, branch_name, is_circle):
         secrets_found = {}
         # make sure not in middle of merge
-        if not run_command('git rev-parse -q --verify MERGE_HEAD'):
+        if not get_git_context().is_in_merge():
             secrets_file_paths = self.get_all_diff_text_files(branch_name, is_circle)
+            if self.diff_only:
+                self.files_added_lines = self.get_files_added_lines(secrets_file_paths, branch_name, is_circle)
             secrets_found = self.search_potential_secrets(secrets_file_paths, self.ignore_entropy)
             if secrets_found:
                 secrets_found_string = 'Secrets were found in the following files:'
@@ -94,9 +162,29 @@ class SecretsValidator(object):
         :param is_circle: boolean to check if being ran from circle
         :return: list: list of text files
         """
-        changed_files_string = run_command("git diff --name-status origin/master...{}".format(branch_name)) \
-            if is_circle else run_command("git diff --name-status --no-merges HEAD")
-        return list(self.get_diff_text_files(changed_files_string))
+        git_context = get_git_context()
+        changed_files_string = git_context.get_name_status("origin/master...{}".format(branch_name)) \
+            if is_circle else git_context.get_name_status('HEAD', no_merges=True)
+        # sorted, so the files are searched and reported in the same order in every run
+        return sorted(self.get_diff_text_files(changed_files_string))
+
+    @staticmethod
+    def get_files_added_lines(file_paths, branch_name, is_circle):
+        """
+        Get the lines added to the files by the diff the files were taken from, new files are searched whole
+        :param file_paths: the paths of the changed files
+        :param branch_name: current branch being worked on
+        :param is_circle: boolean to check if being ran from circle
+        :return: dict: file path -> the numbers of its added lines
+        """
+        git_context = get_git_context()
+        revision = 'origin/master...{}'.format(branch_name) if is_circle else 'HEAD'
+        files_added_lines = {}
+        for file_path in file_paths:
+            added_lines = git_context.get_path_added_lines(file_path, revision)
+            if added_lines is not None:
+                files_added_lines[file_path] = added_lines
+        return files_added_lines
 
     def get_diff_text_files(self, files_string):
         """Filter out only added/modified text files from git diff
@@ -137,73 +225,121 @@ class SecretsValidator(object):
         :return: dictionary(filename: (list)secrets) of strings sorted by file name for secrets found in files
         """
         secrets_found = {}
-        for file_path in secrets_file_paths:
-            # Get if file path in pack and pack name
-            is_pack = is_file_path_in_pack(file_path)
-            pack_name = get_pack_name(file_path)
-            # Get generic/ioc/files white list sets based on if pack or not
-            secrets_white_list, ioc_white_list, files_white_list = self.get_white_listed_items(is_pack, pack_name)
-            # Skip white listed files
-
-            if file_path in files_white_list:
-                print("Skipping secrets detection for file: {} as it is white listed".format(file_path))
+        for file_name, file_secrets in self.iter_files_secrets(secrets_file_paths, ignore_entropy):
+            if file_secrets:
+                secrets_found[file_name] = file_secrets
+
+        return secrets_found
+
+    def iter_files_secrets(self, secrets_file_paths: list, ignore_entropy: bool = False):
+        """Search the files one after the other or by a pool of processes, yielding the secrets found in each file in
+        the order of the files. The output of each file is buffered and printed in the same order as well.
+        """
+        if self.jobs <= 1 or len(secrets_file_paths) <= 1:
+            for file_path in secrets_file_paths:
+                yield self.search_file_secrets(file_path, ignore_entropy)
+            return
+
+        # flush the output printed so far, so it is not mixed with the output of the workers
+        sys.stdout.flush()
+        with Pool(processes=min(self.jobs, len(secrets_file_paths)), initializer=init_secrets_worker,
+                  initargs=(self,)) as pool:
+            for file_secrets, output in pool.imap(search_secrets_in_worker,
+                                                  [(file_path, ignore_entropy) for file_path in secrets_file_paths]):
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                yield file_secrets
+
+    def search_file_secrets(self, file_path: str, ignore_entropy: bool = False):
+        """Search a file for potential secrets
+        :param file_path: path of the file
+        :param ignore_entropy: If True then will ignore running entropy algorithm for finding potential secrets
+
+        :return: tuple: the name of the file and its secrets, sorted
+        """
+        file_name = os.path.basename(file_path)
+        # Get if file path in pack and pack name
+        is_pack = is_file_path_in_pack(file_path)
+        pack_name = get_pack_name(file_path)
+        # Get generic/ioc/files white list sets based on if pack or not
+        secrets_white_list, ioc_white_list, files_white_list = self.get_white_listed_items(is_pack, pack_name)
+        # Skip white listed files
+
+        if file_path in files_white_list:
+            print("Skipping secrets detection for file: {} as it is white listed".format(file_path))
+            return file_name, []
+        # Init vars for the file
+        # the strings to calculate the entropy of, once the whole file was scanned
+        entropy_candidates = []
+        secrets_found_with_regex = []
+        _, file_extension = os.path.splitext(file_path)
+        skip_secrets = {'skip_once': False, 'skip_multi': False}
+        # get file contents
+        file_contents = self.get_file_contents(file_path, file_extension)
+        # the numbers of the lines to search, None to search the whole file. The text extracted from pdf and html
+        # files has no lines of the file.
+        added_lines = self.files_added_lines.get(file_path)
+        if self.is_extracted_text_file(file_path, file_extension):
+            added_lines = None
+        # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
+        if is_pack:
+            lines_count = file_contents.count('\n')
+            file_contents = self.remove_white_list_regex(file_contents, secrets_white_list)
+            if file_contents.count('\n') != lines_count:
+                # the lines do not match the lines of the file anymore
+                added_lines = None
+
+        yml_file_contents = self.get_related_yml_contents(file_path)
+        # Add all context output paths keywords to whitelist temporary
+        if file_extension == YML_FILE_EXTENSION or yml_file_contents:
+            temp_white_list = self.create_temp_white_list(yml_file_contents if yml_file_contents else file_contents)
+            secrets_white_list = secrets_white_list.union(temp_white_list)
+        # the whitelists are matched by automatons, case insensitively
+        white_list_matcher = SubstringMatcher(secrets_white_list)
+        ioc_white_list_matcher = SubstringMatcher(ioc_white_list)
+        # the lines which may contain an IOC or a false positive, the regexes run only on them
+        ioc_line_numbers = self.get_ioc_line_numbers(file_contents)
+        # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
+        for line_number, line in enumerate(file_contents.split('\n')):
+            # if detected disable-secrets comments, skip the line/s
+            skip_secrets = self.is_secrets_disabled(line, skip_secrets)
+            if skip_secrets['skip_once'] or skip_secrets['skip_multi']:
+                skip_secrets['skip_once'] = False
                 continue
-            # Init vars for current loop
-            file_name = os.path.basename(file_path)
-            high_entropy_strings = []
-            secrets_found_with_regex = []
-            _, file_extension = os.path.splitext(file_path)
-            skip_secrets = {'skip_once': False, 'skip_multi': False}
-            # get file contents
-            file_contents = self.get_file_contents(file_path, file_extension)
-            # in packs regard all items as regex as well, reset pack's whitelist in order to avoid repetition later
-            if is_pack:
-                file_contents = self.remove_white_list_regex(file_contents, secrets_white_list)
-
-            yml_file_contents = self.get_related_yml_contents(file_path)
-            # Add all context output paths keywords to whitelist temporary
-            if file_extension == YML_FILE_EXTENSION or yml_file_contents:
-                temp_white_list = self.create_temp_white_list(yml_file_contents if yml_file_contents else file_contents)
-                secrets_white_list = secrets_white_list.union(temp_white_list)
-            # Search by lines after strings with high entropy / IoCs regex as possibly suspicious
-            for line in file_contents.split('\n'):
-                # if detected disable-secrets comments, skip the line/s
-                skip_secrets = self.is_secrets_disabled(line, skip_secrets)
-                if skip_secrets['skip_once'] or skip_secrets['skip_multi']:
-                    skip_secrets['skip_once'] = False
-                    continue
-                # REGEX scanning for IOCs and false positive groups
+            # the lines which were not added are searched for false positives only, so the added lines are
+            # searched with the same white list as when searching the whole file
+            is_searched_line = added_lines is None or line_number + 1 in added_lines
+            # REGEX scanning for IOCs and false positive groups
+            if line_number in ioc_line_numbers:
                 regex_secrets, false_positives = self.regex_for_secrets(line)
-                for regex_secret in regex_secrets:
-                    if not any(ioc.lower() in regex_secret.lower() for ioc in ioc_white_list):
-                        secrets_found_with_regex.append(regex_secret)
-                # added false positives into white list array before testing the strings in line
-
-                secrets_white_list = secrets_white_list.union(false_positives)
+            else:
+                regex_secrets, false_positives = [], []
+            for regex_secret in regex_secrets if is_searched_line else []:
+                if not ioc_white_list_matcher.search(regex_secret):
+                    secrets_found_with_regex.append(regex_secret)
+            # added false positives into white list array before testing the strings in line
+
+            white_list_matcher.add(false_positives)
+            if not is_searched_line:
+                continue
 
-                if not ignore_entropy:
-                    # due to nature of eml files, skip string by string secret detection - only regex
-                    if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or \
-                            any(demisto_type in file_name for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS):
+            if not ignore_entropy:
+                # due to nature of eml files, skip string by string secret detection - only regex
+                if file_extension in SKIP_FILE_TYPE_ENTROPY_CHECKS or \
+                        any(demisto_type in file_name for demisto_type in SKIP_DEMISTO_TYPE_ENTROPY_CHECKS):
+                    continue
+                line = self.remove_false_positives(line)
+                # calculate entropy for each string in the file
+                for string_ in line.split():
+                    if len(string_) < MIN_HIGH_ENTROPY_DISTINCT_CHARS:
                         continue
-                    line = self.remove_false_positives(line)
-                    # calculate entropy for each string in the file
-                    for string_ in line.split():
-                        # compare the lower case of the string against both generic whitelist & temp white list
-                        if not any(
-                                white_list_string.lower() in string_.lower()
-                                for white_list_string in secrets_white_list):
-
-                            entropy = self.calculate_shannon_entropy(string_)
-                            if entropy >= ENTROPY_THRESHOLD:
-                                high_entropy_strings.append(string_)
-
-            if high_entropy_strings or secrets_found_with_regex:
-                # uniquify identical matches between lists
-                file_secrets = list(set(high_entropy_strings + secrets_found_with_regex))
-                secrets_found[file_name] = file_secrets
+                    # compare the lower case of the string against both generic whitelist & temp white list
+                    if not white_list_matcher.search(string_):
+                        entropy_candidates.append(string_)
 
-        return secrets_found
+        high_entropy_strings = self.get_high_entropy_strings(entropy_candidates)
+        # uniquify identical matches between lists
+        return file_name, sorted(set(high_entropy_strings + secrets_found_with_regex))
 
     @staticmethod
     def remove_white_list_regex(file_contents, secrets_white_list):
@@ -227,7 +363,10 @@ class SecretsValidator(object):
         yml_file_contents = ''
         # Validate if it is integration documentation file or supported file extension
         if checked_type(file_path, REQUIRED_YML_FILE_TYPES):
-            yml_file_contents = self.retrieve_related_yml(os.path.dirname(file_path))
+            integration_path = os.path.dirname(file_path)
+            if integration_path not in self._related_yml_contents:
+                self._related_yml_contents[integration_path] = self.retrieve_related_yml(integration_path)
+            yml_file_contents = self._related_yml_contents[integration_path]
         return yml_file_contents
 
     @staticmethod
@@ -239,6 +378,29 @@ class SecretsValidator(object):
                 matching_yml_file_contents = matching_yml_file.read()
         return matching_yml_file_contents
 
+    @staticmethod
+    def get_ioc_line_numbers(file_contents):
+        """Get the numbers of the lines in which one of the regexes of regex_for_secrets matches, by a single scan of
+        the file - each line is scanned up to its first match
+        :param file_contents: the contents of the file
+        :return: set: the 0 based numbers of the lines
+        """
+        line_numbers = set()
+        line_number = 0
+        line_start = 0
+        match = IOC_LINES_REGEX.search(file_contents)
+        while match:
+            line_number += file_contents.count('\n', line_start, match.start())
+            line_numbers.add(line_number)
+            line_start = file_contents.find('\n', match.end())
+            if line_start == -1:
+                break
+            line_number += 1
+            line_start += 1
+            match = IOC_LINES_REGEX.search(file_contents, line_start)
+
+        return line_numbers
+
     @staticmethod
     def regex_for_secrets(line):
         """Scans for IOCs with potentially low entropy score
@@ -249,36 +411,36 @@ class SecretsValidator(object):
         false_positives = []
 
         # Dates REGEX for false positive preventing since they have high entropy
-        dates = re.findall(DATES_REGEX, line)
+        dates = COMPILED_DATES_REGEX.findall(line)
         if dates:
             false_positives += [date[0].lower() for date in dates]
         # UUID REGEX
-        uuids = re.findall(UUID_REGEX, line)
+        uuids = COMPILED_UUID_REGEX.findall(line)
         if uuids:
             false_positives += uuids
         # docker images version are detected as ips. so we ignore and whitelist them
         # example: dockerimage: demisto/duoadmin:1.0.0.147
-        re_res = re.search(r'dockerimage:\s*\w*demisto/\w+:(\d+.\d+.\d+.\d+)', line)
+        re_res = COMPILED_DOCKER_IMAGE_VERSION_REGEX.search(line)
         if re_res:
             docker_version = re_res.group(1)
             false_positives.append(docker_version)
             line = line.replace(docker_version, '')
         # URL REGEX
-        urls = re.findall(URLS_REGEX, line)
+        urls = COMPILED_URLS_REGEX.findall(line)
         if urls:
             potential_secrets += urls
         # EMAIL REGEX
-        emails = re.findall(EMAIL_REGEX, line)
+        emails = COMPILED_EMAIL_REGEX.findall(line)
         if emails:
             potential_secrets += emails
         # IPV6 REGEX
-        ipv6_list = re.findall(IPV6_REGEX, line)
+        ipv6_list = COMPILED_IPV6_REGEX.findall(line)
         if ipv6_list:
             for ipv6 in ipv6_list:
                 if ipv6 != '::' and len(ipv6) > 4:
                     potential_secrets.append(ipv6)
         # IPV4 REGEX
-        ipv4_list = re.findall(IPV4_REGEX, line)
+        ipv4_list = COMPILED_IPV4_REGEX.findall(line)
         if ipv4_list:
             potential_secrets += ipv4_list
 
@@ -294,16 +456,45 @@ class SecretsValidator(object):
         if not data:
             return 0
         entropy = 0
-        # each unicode code representation of all characters which are considered printable
-        for char in (ord(c) for c in string.printable):
-            # probability of event X
-            p_x = float(data.count(chr(char))) / len(data)
-            if p_x > 0:
+        # count all the characters in one pass, only the characters which are considered printable are scored
+        for char, count in Counter(data).items():
+            if char in PRINTABLE_CHARS:
+                # probability of event X
+                p_x = count / len(data)
                 # the information in every possible news, in bits
-                entropy += - p_x * math.log(p_x, 2)
+                entropy += - p_x * math.log2(p_x)
         return entropy
 
+    @classmethod
+    def get_high_entropy_strings(cls, strings, threshold=ENTROPY_THRESHOLD):
+        """Get the strings whose entropy reaches the threshold, scoring each distinct string once
+        :param strings: the strings to score
+        :param threshold: the minimal entropy score
+        :return: list: the strings with high entropy, in their order in strings
+        """
+        min_distinct_chars = 2 ** threshold
+        is_high_entropy = {}
+        high_entropy_strings = []
+        for string_ in strings:
+            if string_ not in is_high_entropy:
+                # skip the strings which can not reach the threshold before calculating their entropy
+                is_high_entropy[string_] = len(string_) >= min_distinct_chars and \
+                    len(set(string_)) >= min_distinct_chars and cls.calculate_shannon_entropy(string_) >= threshold
+            if is_high_entropy[string_]:
+                high_entropy_strings.append(string_)
+
+        return high_entropy_strings
+
     def get_white_listed_items(self, is_pack, pack_name):
+        """Get the generic, ioc and files white lists of a pack, or the global ones if not in a pack. The white
+        lists are loaded once per pack, and should not be modified.
+        """
+        key = (is_pack, pack_name if is_pack else None)
+        if key not in self._white_listed_items:
+            self._white_listed_items[key] = self.load_white_listed_items(is_pack, pack_name)
+        return self._white_listed_items[key]
+
+    def load_white_listed_items(self, is_pack, pack_name):
         whitelist_path = os.path.join(PACKS_DIR, pack_name, PACKS_WHITELIST_FILE_NAME) if is_pack \
             else self.white_list_path
         final_white_list, ioc_white_list, files_while_list = \
@@ -361,12 +552,9 @@ class SecretsValidator(object):
     def get_file_contents(self, file_path, file_extension):
         try:
             # if pdf or README.md file, parse text
-            integration_readme = re.match(pattern=INTEGRATION_README_REGEX,
-                                          string=file_path,
-                                          flags=re.IGNORECASE)
             if file_extension == '.pdf':
                 file_contents = self.extract_text_from_pdf(file_path)
-            elif file_extension == '.md' and integration_readme:
+            elif self.is_extracted_text_file(file_path, file_extension):
                 file_contents = self.extract_text_from_md_html(file_path)
             else:
                 # Open each file, read its contents in UTF-8 encoding to avoid unicode characters
@@ -378,6 +566,14 @@ class SecretsValidator(object):
             print("Failed opening file: {}. Exception: {}".format(file_path, ex))
             raise
 
+    @staticmethod
+    def is_extracted_text_file(file_path, file_extension):
+        """Whether the text of the file is extracted from it rather than read - pdf and integration README files"""
+        integration_readme = re.match(pattern=INTEGRATION_README_REGEX,
+                                      string=file_path,
+                                      flags=re.IGNORECASE)
+        return file_extension == '.pdf' or (file_extension == '.md' and bool(integration_readme))
+
     @staticmethod
     def extract_text_from_pdf(file_path):
         page_num = 0
@@ -436,10 +632,7 @@ class SecretsValidator(object):
 
     @staticmethod
     def get_branch_name():
-        branches = run_command('git branch')
-        branch_name_reg = re.search(r'\* (.*)', branches)
-        branch_name = branch_name_reg.group(1)
-        return branch_name
+        return get_git_context().get_current_branch()
 
     def find_secrets(self):
         print_color('Starting secrets detection', LOG_COLORS.GREEN)
@@ -0,0 +1,117 @@
+"""A matcher of many strings at once, finding whether a text contains any of them (an Aho-Corasick automaton).
+
+The secrets detection checks each string of a file against the whitelists, which may hold thousands of strings.
+Checking the strings one after the other costs the text length times the whitelist size, the automaton walks the text
+once whatever the number of strings is.
+"""
+from collections import deque
+from typing import Dict, Iterable, List
+
+
+class SubstringMatcher:
+    """Finds whether any of a set of strings is a substring of a text, ignoring case.
+
+    The strings are matched as `string.lower() in text.lower()` does. Strings can be added after the matcher was built:
+    the recently added strings are checked one by one, and once there are enough of them the automaton is built again,
+    so a growing set of strings is rebuilt a number of times logarithmic in its size.
+
+    Attributes:
+        patterns (set): the lower cased strings of the matcher.
+    """
+    # the number of strings which may be added before building the automaton again, or a fraction of its strings
+    MIN_PENDING_PATTERNS = 64
+    PENDING_PATTERNS_RATIO = 0.25
+
+    def __init__(self, patterns: Iterable[str] = ()):
+        self.patterns: set = set()
+        # the automaton: the trie transitions, the failure transitions and whether a string ends at each state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._is_output: List[bool] = [False]
+        self._built_patterns_count = 0
+        # the strings added since the automaton was built
+        self._pending_patterns: List[str] = []
+        self._has_empty_pattern = False
+        self.add(patterns)
+        if self._pending_patterns:
+            self.build()
+
+    def add(self, patterns: Iterable[str]):
+        for pattern in patterns:
+            pattern = pattern.lower()
+            if pattern in self.patterns:
+                continue
+            self.patterns.add(pattern)
+            if not pattern:
+                # an empty string is a substring of any text
+                self._has_empty_pattern = True
+            else:
+                self._pending_patterns.append(pattern)
+
+        if len(self._pending_patterns) > max(self.MIN_PENDING_PATTERNS,
+                                             self.PENDING_PATTERNS_RATIO * self._built_patterns_count):
+            self.build()
+
+    def build(self):
+        """Build the automaton of all the strings"""
+        goto: List[Dict[str, int]] = [{}]
+        is_output = [False]
+        for pattern in self.patterns:
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    is_output.append(False)
+                state = next_state
+            is_output[state] = True
+
+        # the failure transition of a state leads to the state of its longest proper suffix in the trie
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                fail_state = fail[state]
+                while fail_state and char not in goto[fail_state]:
+                    fail_state = fail[fail_state]
+                fail[next_state] = goto[fail_state].get(char, 0)
+                # a string ends at a state if it ends at its longest suffix
+                is_output[next_state] = is_output[next_state] or is_output[fail[next_state]]
+                queue.append(next_state)
+
+        self._goto = goto
+        self._fail = fail
+        self._is_output = is_output
+        self._built_patterns_count = len(self.patterns)
+        self._pending_patterns = []
+
+    def search(self, text: str) -> bool:
+        """Check whether any of the strings is a substring of the text"""
+        if self._has_empty_pattern:
+            return True
+
+        text = text.lower()
+        if any(pattern in text for pattern in self._pending_patterns):
+            return True
+
+        goto = self._goto
+        if len(goto) == 1:
+            # no strings besides the pending ones
+            return False
+
+        fail = self._fail
+        is_output = self._is_output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if is_output[state]:
+                return True
+
+        return False
@@ -1,5 +1,8 @@
+import math
 import os
-from demisto_sdk.commands.secrets.secrets import SecretsValidator
+import string
+import pytest
+from demisto_sdk.commands.secrets.secrets import SecretsValidator, ENTROPY_THRESHOLD
 import io
 import shutil
 import json
@@ -91,6 +94,61 @@ print(some_dict.some_foo)
         secrets_found = validator.search_potential_secrets([self.TEST_FILE_WITH_SECRETS])
         assert secrets_found['file_with_secrets_in_it.yml'] == ['OIifdsnsjkgnj3254nkdfsjKNJD0345']
 
+    def test_parallel_search_matches_sequential(self, tmp_path, capsys):
+        """
+        Given
+            - Files with and without secrets, and a file white listed in the white list
+        When
+            - Searching them sequentially and with a pool of processes
+        Then
+            - The same secrets and the same output are returned, and the white list is loaded once
+        """
+        white_list_path = str(tmp_path / TestSecrets.WHITE_LIST_FILE_NAME)
+        file_paths = []
+        secret_line = 'API_KEY = OIifdsnsjkgnj3254nkdfsjKNJD0345'
+        for index, contents in enumerate([secret_line, 'a = 100', 'my_email = "fooo@someorg.com"', secret_line]):
+            file_path = str(tmp_path / f'file{index}.py')
+            with open(file_path, 'w') as file_:
+                file_.write(contents)
+            file_paths.append(file_path)
+        create_whitelist_secrets_file(white_list_path, files=[file_paths[3]])
+
+        results = []
+        for jobs in (1, 3):
+            validator = SecretsValidator(is_circle=True, white_list_path=white_list_path, jobs=jobs)
+            results.append((validator.search_potential_secrets(file_paths), capsys.readouterr().out))
+            assert list(validator._white_listed_items) == ([(False, None)] if jobs == 1 else [])
+
+        assert results[0] == results[1]
+        assert results[0][0] == {'file0.py': ['OIifdsnsjkgnj3254nkdfsjKNJD0345'], 'file2.py': ['fooo@someorg.com']}
+        assert f'Skipping secrets detection for file: {file_paths[3]}' in results[0][1]
+
+    def test_search_added_lines_only(self, tmp_path):
+        """
+        Given
+            - A file with secrets in lines added by the diff and in lines which were not, one of the added lines
+              inside a disable-secrets-detection block
+        When
+            - Searching the added lines of the file only, and searching the whole file
+        Then
+            - Only the secrets of the added lines outside the block are found, and all of them are found otherwise
+        """
+        white_list_path = str(tmp_path / TestSecrets.WHITE_LIST_FILE_NAME)
+        create_whitelist_secrets_file(white_list_path)
+        file_path = str(tmp_path / 'file.py')
+        with open(file_path, 'w') as file_:
+            file_.write('OLD_EMAIL = "old@someorg.com"\n'
+                        'NEW_EMAIL = "new@someorg.com"\n'
+                        '# disable-secrets-detection-start\n'
+                        'DISABLED_EMAIL = "disabled@someorg.com"\n'
+                        '# disable-secrets-detection-end\n')
+
+        validator = SecretsValidator(is_circle=True, white_list_path=white_list_path, diff_only=True)
+        validator.files_added_lines = {file_path: {2, 4}}
+        assert validator.search_file_secrets(file_path, False) == ('file.py', ['new@someorg.com'])
+        validator.files_added_lines = {}
+        assert validator.search_file_secrets(file_path, False) == ('file.py', ['new@someorg.com', 'old@someorg.com'])
+
     def test_ignore_entropy(self):
         """
         - no items in the whitelist
@@ -153,11 +211,56 @@ some_dict = {
         assert '123e4567-e89b-12d3-a456-426655440000' in false_positives
         assert '199.199.178.199' in secrets
 
+    def test_get_ioc_line_numbers(self):
+        """
+        Given
+            - File contents with IOCs and false positives on some of the lines, a date whose time is on the next line
+        When
+            - Finding the lines to run the regexes on by a single scan of the contents
+        Then
+            - The lines are exactly the ones on which the regexes find something
+        """
+        file_contents = self.validator.get_file_contents(self.TEST_YML_FILE, '.yml') + \
+            '\ndockerimage: demisto/duoadmin:1.0.0.147\nsince 2020-01-01\n12:00:00 utc\nmail sade@sade.sade\n' \
+            'host fe80::1ff:fe23:4567:890a or ::\n10.0.0.1\n'
+        ioc_line_numbers = self.validator.get_ioc_line_numbers(file_contents)
+        for line_number, line in enumerate(file_contents.split('\n')):
+            secrets, false_positives = self.validator.regex_for_secrets(line)
+            assert bool(secrets or false_positives) is (line_number in ioc_line_numbers), line
+        assert len(ioc_line_numbers) >= 5
+
     def test_calculate_shannon_entropy(self):
         test_string = 'SADE'
         entropy = self.validator.calculate_shannon_entropy(test_string)
         assert entropy == 2.0
 
+    @pytest.mark.parametrize('data', ['', 'SADE', 'aaaa', 'OCSn7JGqKehoyIyMCm7gPFjKXpawXvh2M32', '0123456789abcdef',
+                                      'ünïcödé 0123456789abcdefg', ['a', 'b', 'c', 'a']])
+    def test_calculate_shannon_entropy_single_pass(self, data):
+        """
+        Given
+            - Strings and a list of characters
+        When
+            - Calculating their entropy by counting their characters in one pass
+        Then
+            - The entropy is the one of counting each printable character separately
+        """
+        expected_entropy = 0
+        for char in string.printable:
+            p_x = float(data.count(char)) / len(data) if data else 0
+            if p_x > 0:
+                expected_entropy += - p_x * math.log(p_x, 2)
+        assert self.validator.calculate_shannon_entropy(data) == pytest.approx(expected_entropy, abs=1e-12)
+
+    def test_get_high_entropy_strings(self):
+        strings = ['SADE', 'OCSn7JGqKehoyIyMCm7gPFjKXpawXvh2M32', 'aaaaaaaaaaaaaaaaaaaaaaaaaaaa', '0123456789abcdef',
+                   '0123456789abcde', 'OCSn7JGqKehoyIyMCm7gPFjKXpawXvh2M32']
+        expected_strings = [string_ for string_ in strings
+                            if self.validator.calculate_shannon_entropy(string_) >= ENTROPY_THRESHOLD]
+        assert self.validator.get_high_entropy_strings(strings) == expected_strings
+        assert expected_strings == ['OCSn7JGqKehoyIyMCm7gPFjKXpawXvh2M32', '0123456789abcdef',
+                                    'OCSn7JGqKehoyIyMCm7gPFjKXpawXvh2M32']
+
     def test_get_packs_white_list(self):
         final_white_list, ioc_white_list, files_while_list = \
             self.validator.get_packs_white_list(self.TEST_WHITELIST_FILE_PACKS)
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from demisto_sdk.commands.secrets.substring_matcher import SubstringMatcher
+
+
+class TestSubstringMatcher:
+    @pytest.mark.parametrize('patterns, text, expected', [
+        (['sade@sade.sade', 'boop'], 'mail.SADE@sade.sade', True),
+        (['he', 'she', 'his', 'hers'], 'ushers', True),
+        (['abcd', 'bcx'], 'abcx', True),
+        (['abcd', 'bcx'], 'abcy', False),
+        ([], 'anything', False),
+        ([''], 'anything', True),
+        (['İstanbul'], 'İSTANBUL', True),
+    ])
+    def test_search(self, patterns, text, expected):
+        assert SubstringMatcher(patterns).search(text) is expected
+
+    def test_same_as_any_substring(self):
+        """
+        Given
+            - A growing set of random strings, added after the matcher was built
+        When
+            - Searching random texts
+        Then
+            - The result is the same as checking whether any of the strings is a substring of the text, and the
+              automaton is built again only once enough strings were added
+        """
+        random.seed(0)
+
+        def random_string(max_length):
+            return ''.join(random.choice('abcAB.') for _ in range(random.randint(1, max_length)))
+
+        patterns = [random_string(5) for _ in range(20)]
+        matcher = SubstringMatcher(patterns)
+        for _ in range(20):
+            for _ in range(50):
+                text = random_string(15)
+                assert matcher.search(text) is any(pattern.lower() in text.lower() for pattern in patterns), text
+            added_patterns = [random_string(8) for _ in range(10)]
+            patterns += added_patterns
+            matcher.add(added_patterns)
+            assert len(matcher._pending_patterns) <= SubstringMatcher.MIN_PENDING_PATTERNS
@@ -201,20 +201,32 @@ class Unifier:
         :rtype: str
         """
 
+        if self.package_path.endswith('/'):
+            self.package_path = self.package_path[:-1]  # remove the last / as we use os.path.join
+
+        return self.find_code_file(self.package_path, glob.glob(os.path.join(self.package_path, '*' + script_type)))
+
+    @staticmethod
+    def find_code_file(package_path, code_file_paths):
+        """Return the code file of a package out of the paths of its files of the package script type
+        :param package_path: the package directory path, without a trailing /
+        :type package_path: str
+        :param code_file_paths: the paths of the files of the package with the extension of the script type
+        :type code_file_paths: list
+        :return: path to the code file
+        :rtype: str
+        """
         ignore_regex = (r'CommonServerPython\.py|CommonServerUserPython\.py|demistomock\.py|_test\.py'
                         r'|conftest\.py|__init__\.py|ApiModule\.py|vulture_whitelist\.py'
                         r'|CommonServerPowerShell\.ps1|CommonServerUserPowerShell\.ps1|demistomock\.ps1|\.Tests\.ps1')
-        if self.package_path.endswith('/'):
-            self.package_path = self.package_path[:-1]  # remove the last / as we use os.path.join
-        if self.package_path.endswith('Scripts/CommonServerPython'):
-            return os.path.join(self.package_path, 'CommonServerPython.py')
-        if self.package_path.endswith('Scripts/CommonServerPowerShell'):
-            return os.path.join(self.package_path, 'CommonServerPowerShell.ps1')
-        if self.package_path.endswith('ApiModule'):
-            return os.path.join(self.package_path, os.path.basename(os.path.normpath(self.package_path)) + '.py')
-
-        script_path = list(filter(lambda x: not re.search(ignore_regex, x),
-                                  glob.glob(os.path.join(self.package_path, '*' + script_type))))[0]
+        if package_path.endswith('Scripts/CommonServerPython'):
+            return os.path.join(package_path, 'CommonServerPython.py')
+        if package_path.endswith('Scripts/CommonServerPowerShell'):
+            return os.path.join(package_path, 'CommonServerPowerShell.ps1')
+        if package_path.endswith('ApiModule'):
+            return os.path.join(package_path, os.path.basename(os.path.normpath(package_path)) + '.py')
+
+        script_path = list(filter(lambda x: not re.search(ignore_regex, x), code_file_paths))[0]
 
         return script_path
 
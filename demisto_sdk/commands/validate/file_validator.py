@@ -11,10 +11,18 @@ for that task.
 """
 from __future__ import print_function
 
+import hashlib
+import io
+import json
 import os
 import re
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout
+from multiprocessing import Pool
 
 from demisto_sdk.commands.common.hook_validations.dashboard import DashboardValidator
+from demisto_sdk.commands.common.hook_validations.docker import get_docker_tag_resolver, get_docker_tags_ttl
 from demisto_sdk.commands.common.hook_validations.incident_type import IncidentTypeValidator
 from demisto_sdk.commands.common.hook_validations.pack_unique_files import PackUniqueFilesValidator
 from demisto_sdk.commands.common.configuration import Configuration
@@ -25,6 +33,7 @@ from demisto_sdk.commands.common.constants import CODE_FILES_REGEX, OLD_YML_FORM
     PACKS_DIR, PACKS_DIRECTORIES, Errors, PLAYBOOKS_REGEXES_LIST, JSON_INDICATOR_AND_INCIDENT_FIELDS, PLAYBOOK_REGEX, \
     JSON_ALL_LAYOUT_REGEXES, REPUTATION_REGEX, CHECKED_TYPES_REGEXES, JSON_ALL_DASHBOARDS_REGEXES, \
     JSON_ALL_INCIDENT_TYPES_REGEXES, TESTS_DIRECTORIES
+from demisto_sdk.commands.common.hook_validations.base_validator import BaseValidator
 from demisto_sdk.commands.common.hook_validations.conf_json import ConfJsonValidator
 from demisto_sdk.commands.common.hook_validations.description import DescriptionValidator
 from demisto_sdk.commands.common.hook_validations.id import IDSetValidator
@@ -37,13 +46,42 @@ from demisto_sdk.commands.common.hook_validations.structure import StructureVali
 from demisto_sdk.commands.common.hook_validations.playbook import PlaybookValidator
 from demisto_sdk.commands.common.hook_validations.layout import LayoutValidator
 from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
+from demisto_sdk.commands.common.content_inventory import get_content_inventory
+from demisto_sdk.commands.common.git_tools import get_git_context, get_remote_files_reader
 
-from demisto_sdk.commands.common.tools import checked_type, run_command, print_error, print_warning, print_color, \
-    LOG_COLORS, get_yaml, filter_packagify_changes, get_pack_name, is_file_path_in_pack, \
-    get_yml_paths_in_dir, find_type
+from demisto_sdk.commands.common.tools import checked_type, print_error, print_warning, print_color, \
+    LOG_COLORS, get_yaml, filter_packagify_changes, get_pack_name, is_file_path_in_pack, find_type, get_sdk_version
 from demisto_sdk.commands.unify.unifier import Unifier
+from demisto_sdk.commands.validate.validation_cache import ValidationCache, get_files_hash, get_schemas_hash, \
+    get_shared_file_hash, get_validated_file_paths, get_validation_cache_path
+from demisto_sdk.commands.validate.validation_profiler import ValidationProfiler, get_profiled_file_type
 from demisto_sdk.commands.common.hook_validations.release_notes import ReleaseNotesValidator
 
+# the validator of a validation worker process, set once when the worker starts
+_worker_validator = None
+
+
+def init_validation_worker(validator):
+    global _worker_validator
+    _worker_validator = validator
+    if validator.profiler is not None:
+        # the records of the main process until the fork are not the worker's
+        validator.profiler.pop_records()
+
+
+def run_validation_in_worker(task):
+    """Run a per file validation of the worker validator, buffering everything it prints.
+
+    Returns:
+        tuple. Whether the file is valid, the output of its validation and its profile records (None if not profiling).
+    """
+    validation, args = task
+    output = io.StringIO()
+    with redirect_stdout(output):
+        is_valid = _worker_validator.run_file_validation(validation, args)
+    profiler = _worker_validator.profiler
+    return is_valid, output.getvalue(), profiler.pop_records() if profiler is not None else None
+
 
 class FilesValidator:
     """FilesValidator is a class that's designed to validate all the changed files on your branch, and all files in case
@@ -59,11 +97,16 @@ class FilesValidator:
         validate_id_set (bool): Whether to validate id_set or not.
         file_path (string): If validating a specific file, golds it's path.
         configuration (Configuration): Configurations for IDSetValidator.
+        jobs (int): The number of processes validating the files in parallel.
+        validation_cache (ValidationCache): The files which passed their validation, None if not using the cache.
+        profiler (ValidationProfiler): The time of each check, None if not profiling.
+        profile_output (str): The path to write the profile to as JSON, None to only print it.
     """
 
     def __init__(self, is_backward_check=True, prev_ver='origin/master', use_git=False, is_circle=False,
                  print_ignored_files=False, validate_conf_json=True, validate_id_set=False, file_path=None,
-                 configuration=Configuration()):
+                 configuration=Configuration(), jobs=1, use_cache=False,
+                 profile=False, profile_output=None):
         self.branch_name = ''
         self.use_git = use_git
         if self.use_git:
@@ -84,15 +127,40 @@ class FilesValidator:
         self.validate_conf_json = validate_conf_json
         self.validate_id_set = validate_id_set
         self.file_path = file_path
+        self.jobs = jobs
+        self.validation_cache = ValidationCache.load(get_validation_cache_path()) if use_cache else None
+        self.profiler = ValidationProfiler() if profile or profile_output else None
+        self.profile_output = profile_output
+        # profiled to time the loading of conf.json and the id set
+        with self.profiling():
+            if self.validate_conf_json:
+                self.conf_json_validator = ConfJsonValidator()
+            if self.validate_id_set:
+                self.id_set_validator = IDSetValidator(is_circle=self.is_circle, configuration=self.configuration)
 
-        if self.validate_conf_json:
-            self.conf_json_validator = ConfJsonValidator()
-        if self.validate_id_set:
-            self.id_set_validator = IDSetValidator(is_circle=self.is_circle, configuration=self.configuration)
+    @contextmanager
+    def profiling(self):
+        """Profile the checks run in the context when profiling, the validator classes are restored once it exits"""
+        if self.profiler is None:
+            yield
+            return
+
+        with self.profiler.profiling():
+            yield
 
     def run(self):
         print_color('Starting validating files structure', LOG_COLORS.GREEN)
-        if self.is_valid_structure():
+        with self.profiling():
+            is_valid = self.is_valid_structure()
+        if self.validation_cache is not None:
+            self.validation_cache.save()
+            print(self.validation_cache.get_summary())
+        if self.profiler is not None:
+            print(self.profiler.get_report())
+            if self.profile_output:
+                self.profiler.save(self.profile_output)
+
+        if is_valid:
             print_color('The files are valid', LOG_COLORS.GREEN)
             return 0
         else:
@@ -101,9 +169,7 @@ class FilesValidator:
 
     @staticmethod
     def get_current_working_branch():
-        branches = run_command('git branch')
-        branch_name_reg = re.search(r'\* (.*)', branches)
-        return branch_name_reg.group(1)
+        return get_git_context().get_current_branch()
 
     @staticmethod
     def get_modified_files(files_string, tag='master', print_ignored_files=False):
@@ -188,10 +254,10 @@ class FilesValidator:
         # Two dots is the default in git diff, it will compare with the last known commit as the base
         # Three dots will compare with the last known shared commit as the base
         compare_type = '.' if 'master' in tag else ''
-        all_changed_files_string = run_command(
-            'git diff --name-status {tag}..{compare_type}refs/heads/{branch}'.format(tag=tag,
-                                                                                     branch=self.branch_name,
-                                                                                     compare_type=compare_type))
+        git_context = get_git_context()
+        all_changed_files_string = git_context.get_name_status(
+            '{tag}..{compare_type}refs/heads/{branch}'.format(tag=tag, branch=self.branch_name,
+                                                              compare_type=compare_type))
 
         modified_files, added_files, _, old_format_files = self.get_modified_files(
             all_changed_files_string,
@@ -199,11 +265,11 @@ class FilesValidator:
             print_ignored_files=self.print_ignored_files)
 
         if not self.is_circle:
-            files_string = run_command('git diff --name-status --no-merges HEAD')
+            files_string = git_context.get_name_status('HEAD', no_merges=True)
             nc_modified_files, nc_added_files, nc_deleted_files, nc_old_format_files = self.get_modified_files(
                 files_string, print_ignored_files=self.print_ignored_files)
 
-            all_changed_files_string = run_command('git diff --name-status {}'.format(tag))
+            all_changed_files_string = git_context.get_name_status(tag)
             modified_files_from_tag, added_files_from_tag, _, _ = \
                 self.get_modified_files(all_changed_files_string,
                                         print_ignored_files=self.print_ignored_files)
@@ -246,10 +312,9 @@ class FilesValidator:
 
     def is_valid_release_notes(self, file_path):
         release_notes_validator = ReleaseNotesValidator(file_path)
-        if not release_notes_validator.is_file_valid():
-            self._is_valid = False
+        return release_notes_validator.is_file_valid()
 
-    def validate_modified_files(self, modified_files):  # noqa: C901
+    def validate_modified_files(self, modified_files):
         """Validate the modified files from your branch.
 
         In case we encounter an invalid file we set the self._is_valid param to False.
@@ -257,134 +322,204 @@ class FilesValidator:
         Args:
             modified_files (set): A set of the modified files in the current branch.
         """
+        # read the old versions of the files in one batch, before the validations (and their workers) need them
+        get_remote_files_reader().read_files(self.get_old_file_paths(modified_files))
+        if not self.run_file_validations('validate_modified_file', [(file_path,) for file_path in modified_files]):
+            self._is_valid = False
+
+    def prefetch_docker_image_tags(self, file_paths):
+        """Resolve the latest tags of the docker images of the validated integrations and scripts concurrently, before
+        their validations (and their workers) need them."""
+        if not self.validate_id_set:
+            get_docker_tag_resolver().get_latest_tags(self.get_docker_image_names(file_paths))
+
+    @staticmethod
+    def is_docker_image_validated(file_path):
+        """Whether the validation of the file checks its docker image against the registry - an integration or a
+        script yml"""
+        if not file_path.endswith('.yml') or not os.path.isfile(file_path):
+            return False
+        yml_data = get_yaml(file_path)
+        return 'script' in yml_data
+
+    @staticmethod
+    def get_docker_image_names(file_paths):
+        """Get the names of the demisto docker images used by the integration and script ymls of the given files"""
+        image_names = []
+        for file_path in file_paths:
+            if isinstance(file_path, tuple):
+                _, file_path = file_path
+            if not file_path.endswith('.yml') or not os.path.isfile(file_path):
+                continue
+
+            yml_data = get_yaml(file_path)
+            if 'category' in yml_data and isinstance(yml_data.get('script'), dict):
+                docker_image = yml_data['script'].get('dockerimage')
+            elif 'script' in yml_data:
+                docker_image = yml_data.get('dockerimage')
+            else:
+                continue
+
+            if docker_image and docker_image.startswith('demisto/') and ':' in docker_image:
+                image_names.append(docker_image.split(':')[0])
+
+        return image_names
+
+    @staticmethod
+    def get_old_file_paths(modified_files):
+        """Get the paths of the old versions of the modified files which are compared against their old version"""
+        old_file_paths = []
         for file_path in modified_files:
-            old_file_path = None
+            old_file_path = file_path
             if isinstance(file_path, tuple):
                 old_file_path, file_path = file_path
 
-            print('Validating {}'.format(file_path))
-            if not checked_type(file_path):
-                print_warning('- Skipping validation of non-content entity file.')
-                continue
+            if checked_type(file_path) and 'README' not in file_path and \
+                    not re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+                old_file_paths.append(old_file_path)
 
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
-                continue
+        return old_file_paths
 
-            elif 'README' in file_path:
-                readme_validator = ReadMeValidator(file_path)
-                if not readme_validator.is_valid_file():
-                    self._is_valid = False
-                continue
+    def validate_modified_file(self, file_path):  # noqa: C901
+        """Validate a single modified file.
 
-            structure_validator = StructureValidator(file_path, old_file_path=old_file_path)
-            if not structure_validator.is_valid_file():
-                self._is_valid = False
+        Args:
+            file_path (str or tuple): The path of the file, or the (old path, new path) of a renamed file.
 
-            if self.validate_id_set:
-                if not self.id_set_validator.is_file_valid_in_set(file_path):
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_INTEGRATION_REGEXES):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if self.is_backward_check and not integration_validator.is_backward_compatible():
-                    self._is_valid = False
-
-                if not integration_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_BETA_INTEGRATIONS_REGEXES):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid_beta_description():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_beta_integration():
-                    self._is_valid = False
-
-            elif checked_type(file_path, [SCRIPT_REGEX]):
-                script_validator = ScriptValidator(structure_validator)
-                if self.is_backward_check and not script_validator.is_backward_compatible():
-                    self._is_valid = False
-                if not script_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif checked_type(file_path, PLAYBOOKS_REGEXES_LIST):
-                playbook_validator = PlaybookValidator(structure_validator)
-                if not playbook_validator.is_valid_playbook(is_new_playbook=False):
-                    self._is_valid = False
-
-            elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
-                unifier = Unifier(os.path.dirname(file_path))
-                yml_path, _ = unifier.get_script_package_data()
-                # Set file path to the yml file
-                structure_validator.file_path = yml_path
-                script_validator = ScriptValidator(structure_validator)
-                if self.is_backward_check and not script_validator.is_backward_compatible():
-                    self._is_valid = False
-
-                if not script_validator.is_valid_file():
-                    self._is_valid = False
-
-            elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-            # incident fields and indicator fields are using the same scheme.
-            elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
-                incident_field_validator = IncidentFieldValidator(structure_validator)
-                if not incident_field_validator.is_valid_file(validate_rn=True):
-                    self._is_valid = False
-                if self.is_backward_check and not incident_field_validator.is_backward_compatible():
-                    self._is_valid = False
-
-            elif checked_type(file_path, [REPUTATION_REGEX]):
-                reputation_validator = ReputationValidator(structure_validator)
-                if not reputation_validator.is_valid_file(validate_rn=True):
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
-                layout_validator = LayoutValidator(structure_validator)
-                if not layout_validator.is_valid_layout(validate_rn=True):
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_DASHBOARDS_REGEXES):
-                dashboard_validator = DashboardValidator(structure_validator)
-                if not dashboard_validator.is_valid_dashboard(validate_rn=True):
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_INCIDENT_TYPES_REGEXES):
-                incident_type_validator = IncidentTypeValidator(structure_validator)
-                if not incident_type_validator.is_valid_incident_type(validate_rn=True):
-                    self._is_valid = False
-                if self.is_backward_check and not incident_type_validator.is_backward_compatible():
-                    self._is_valid = False
-
-            elif 'CHANGELOG' in file_path:
-                self.is_valid_release_notes(file_path)
-
-            elif checked_type(file_path, CHECKED_TYPES_REGEXES):
-                pass
+        Returns:
+            bool. Whether the file is valid or not.
+        """
+        is_valid = True
+        old_file_path = None
+        if isinstance(file_path, tuple):
+            old_file_path, file_path = file_path
 
-            else:
-                print_error("The file type of {} is not supported in validate command".format(file_path))
-                print_error("'validate' command supports: Integrations, Scripts, Playbooks, "
-                            "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
-                self._is_valid = False
+        print('Validating {}'.format(file_path))
+        if not checked_type(file_path):
+            print_warning('- Skipping validation of non-content entity file.')
+            return is_valid
+
+        if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE):
+            return is_valid
+
+        elif 'README' in file_path:
+            readme_validator = ReadMeValidator(file_path)
+            if not readme_validator.is_valid_file():
+                is_valid = False
+            return is_valid
+
+        structure_validator = StructureValidator(file_path, old_file_path=old_file_path)
+        if not structure_validator.is_valid_file():
+            is_valid = False
+
+        if self.validate_id_set:
+            if not self.id_set_validator.is_file_valid_in_set(file_path):
+                is_valid = False
+
+        elif checked_type(file_path, YML_INTEGRATION_REGEXES):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                is_valid = False
+
+            description_validator = DescriptionValidator(file_path)
+            if not description_validator.is_valid():
+                is_valid = False
+
+            integration_validator = IntegrationValidator(structure_validator)
+            if self.is_backward_check and not integration_validator.is_backward_compatible():
+                is_valid = False
+
+            if not integration_validator.is_valid_file():
+                is_valid = False
+
+        elif checked_type(file_path, YML_BETA_INTEGRATIONS_REGEXES):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                is_valid = False
+
+            description_validator = DescriptionValidator(file_path)
+            if not description_validator.is_valid_beta_description():
+                is_valid = False
+
+            integration_validator = IntegrationValidator(structure_validator)
+            if not integration_validator.is_valid_beta_integration():
+                is_valid = False
+
+        elif checked_type(file_path, [SCRIPT_REGEX]):
+            script_validator = ScriptValidator(structure_validator)
+            if self.is_backward_check and not script_validator.is_backward_compatible():
+                is_valid = False
+            if not script_validator.is_valid_file():
+                is_valid = False
+
+        elif checked_type(file_path, PLAYBOOKS_REGEXES_LIST):
+            playbook_validator = PlaybookValidator(structure_validator)
+            if not playbook_validator.is_valid_playbook(is_new_playbook=False):
+                is_valid = False
+
+        elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES):
+            unifier = Unifier(os.path.dirname(file_path))
+            yml_path, _ = unifier.get_script_package_data()
+            # Set file path to the yml file
+            structure_validator.file_path = yml_path
+            script_validator = ScriptValidator(structure_validator)
+            if self.is_backward_check and not script_validator.is_backward_compatible():
+                is_valid = False
+
+            if not script_validator.is_valid_file():
+                is_valid = False
+
+        elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                is_valid = False
+
+        # incident fields and indicator fields are using the same scheme.
+        elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS):
+            incident_field_validator = IncidentFieldValidator(structure_validator)
+            if not incident_field_validator.is_valid_file(validate_rn=True):
+                is_valid = False
+            if self.is_backward_check and not incident_field_validator.is_backward_compatible():
+                is_valid = False
+
+        elif checked_type(file_path, [REPUTATION_REGEX]):
+            reputation_validator = ReputationValidator(structure_validator)
+            if not reputation_validator.is_valid_file(validate_rn=True):
+                is_valid = False
+
+        elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES):
+            layout_validator = LayoutValidator(structure_validator)
+            if not layout_validator.is_valid_layout(validate_rn=True):
+                is_valid = False
+
+        elif checked_type(file_path, JSON_ALL_DASHBOARDS_REGEXES):
+            dashboard_validator = DashboardValidator(structure_validator)
+            if not dashboard_validator.is_valid_dashboard(validate_rn=True):
+                is_valid = False
+
+        elif checked_type(file_path, JSON_ALL_INCIDENT_TYPES_REGEXES):
+            incident_type_validator = IncidentTypeValidator(structure_validator)
+            if not incident_type_validator.is_valid_incident_type(validate_rn=True):
+                is_valid = False
+            if self.is_backward_check and not incident_type_validator.is_backward_compatible():
+                is_valid = False
+
+        elif 'CHANGELOG' in file_path:
+            if not self.is_valid_release_notes(file_path):
+                is_valid = False
+
+        elif checked_type(file_path, CHECKED_TYPES_REGEXES):
+            pass
+
+        else:
+            print_error("The file type of {} is not supported in validate command".format(file_path))
+            print_error("'validate' command supports: Integrations, Scripts, Playbooks, "
+                        "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
+            is_valid = False
 
-    def validate_added_files(self, added_files, file_type: str = None):  # noqa: C901
+        return is_valid
+
+    def validate_added_files(self, added_files, file_type: str = None):
         """Validate the added files from your branch.
 
         In case we encounter an invalid file we set the self._is_valid param to False.
@@ -393,112 +528,129 @@ class FilesValidator:
             added_files (set): A set of the modified files in the current branch.
             file_type (str): Used only with -p flag (the type of the file).
         """
-        for file_path in added_files:
-            print('Validating {}'.format(file_path))
+        if not self.run_file_validations('validate_added_file',
+                                         [(file_path, file_type) for file_path in added_files]):
+            self._is_valid = False
 
-            if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE) and not file_type:
-                continue
+    def validate_added_file(self, file_path, file_type: str = None):  # noqa: C901
+        """Validate a single added file.
 
-            elif 'README' in file_path:
-                readme_validator = ReadMeValidator(file_path)
-                if not readme_validator.is_valid_file():
-                    self._is_valid = False
-                continue
+        Args:
+            file_path (str): The path of the file.
+            file_type (str): Used only with -p flag (the type of the file).
 
-            structure_validator = StructureValidator(file_path, is_new_file=True, predefined_scheme=file_type)
-            if not structure_validator.is_valid_file():
-                self._is_valid = False
+        Returns:
+            bool. Whether the file is valid or not.
+        """
+        is_valid = True
+        print('Validating {}'.format(file_path))
 
-            if self.validate_id_set:
-                if not self.id_set_validator.is_file_valid_in_set(file_path):
-                    self._is_valid = False
-
-                if self.id_set_validator.is_file_has_used_id(file_path):
-                    self._is_valid = False
-
-            elif re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE) or file_type == 'playbook':
-                playbook_validator = PlaybookValidator(structure_validator)
-                if not playbook_validator.is_valid_playbook():
-                    self._is_valid = False
-
-            elif checked_type(file_path, YML_INTEGRATION_REGEXES) or file_type == 'integration':
-                image_validator = ImageValidator(file_path)
-                # if file_type(non git path) the image is not in a separate path
-                image_validator.file_path = file_path if file_type else image_validator.file_path
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_file(validate_rn=not file_type):
-                    self._is_valid = False
-
-            elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES) or file_type == 'script':
-                unifier = Unifier(os.path.dirname(file_path))
-                yml_path, _ = unifier.get_script_package_data()
-                # Set file path to the yml file
-                structure_validator.file_path = yml_path
-                script_validator = ScriptValidator(structure_validator)
-
-                if not script_validator.is_valid_file(validate_rn=not file_type):
-                    self._is_valid = False
-
-            elif re.match(BETA_INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
-                    re.match(BETA_INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
-                description_validator = DescriptionValidator(file_path)
-                if not description_validator.is_valid_beta_description():
-                    self._is_valid = False
-
-                integration_validator = IntegrationValidator(structure_validator)
-                if not integration_validator.is_valid_beta_integration():
-                    self._is_valid = False
-
-            elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
-                image_validator = ImageValidator(file_path)
-                if not image_validator.is_valid():
-                    self._is_valid = False
-
-            # incident fields and indicator fields are using the same scheme.
-            elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS) or \
-                    file_type in ('incidentfield', 'indicatorfield'):
-                incident_field_validator = IncidentFieldValidator(structure_validator)
-                if not incident_field_validator.is_valid_file(validate_rn=not file_type):
-                    self._is_valid = False
-
-            elif checked_type(file_path, [REPUTATION_REGEX]) or file_type == 'reputation':
-                reputation_validator = ReputationValidator(structure_validator)
-                if not reputation_validator.is_valid_file(validate_rn=not file_type):
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES) or file_type == 'layout':
-                layout_validator = LayoutValidator(structure_validator)
-                if not layout_validator.is_valid_layout(validate_rn=not file_type):
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_DASHBOARDS_REGEXES) or file_type == 'dashboard':
-                dashboard_validator = DashboardValidator(structure_validator)
-                if not dashboard_validator.is_valid_dashboard(validate_rn=not file_type):
-                    self._is_valid = False
-
-            elif checked_type(file_path, JSON_ALL_INCIDENT_TYPES_REGEXES):
-                incident_type_validator = IncidentTypeValidator(structure_validator)
-                if not incident_type_validator.is_valid_incident_type(validate_rn=not file_type):
-                    self._is_valid = False
-
-            elif 'CHANGELOG' in file_path:
-                self.is_valid_release_notes(file_path)
-
-            elif checked_type(file_path, CHECKED_TYPES_REGEXES):
-                pass
+        if re.match(TEST_PLAYBOOK_REGEX, file_path, re.IGNORECASE) and not file_type:
+            return is_valid
 
-            else:
-                print_error("The file type of {} is not supported in validate command".format(file_path))
-                print_error("validate command supports: Integrations, Scripts, Playbooks, "
-                            "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
-                self._is_valid = False
+        elif 'README' in file_path:
+            readme_validator = ReadMeValidator(file_path)
+            if not readme_validator.is_valid_file():
+                is_valid = False
+            return is_valid
+
+        structure_validator = StructureValidator(file_path, is_new_file=True, predefined_scheme=file_type)
+        if not structure_validator.is_valid_file():
+            is_valid = False
+
+        if self.validate_id_set:
+            if not self.id_set_validator.is_file_valid_in_set(file_path):
+                is_valid = False
+
+            if self.id_set_validator.is_file_has_used_id(file_path):
+                is_valid = False
+
+        elif re.match(PLAYBOOK_REGEX, file_path, re.IGNORECASE) or file_type == 'playbook':
+            playbook_validator = PlaybookValidator(structure_validator)
+            if not playbook_validator.is_valid_playbook():
+                is_valid = False
+
+        elif checked_type(file_path, YML_INTEGRATION_REGEXES) or file_type == 'integration':
+            image_validator = ImageValidator(file_path)
+            # if file_type(non git path) the image is not in a separate path
+            image_validator.file_path = file_path if file_type else image_validator.file_path
+            if not image_validator.is_valid():
+                is_valid = False
+
+            description_validator = DescriptionValidator(file_path)
+            if not description_validator.is_valid():
+                is_valid = False
+
+            integration_validator = IntegrationValidator(structure_validator)
+            if not integration_validator.is_valid_file(validate_rn=not file_type):
+                is_valid = False
+
+        elif checked_type(file_path, PACKAGE_SCRIPTS_REGEXES) or file_type == 'script':
+            unifier = Unifier(os.path.dirname(file_path))
+            yml_path, _ = unifier.get_script_package_data()
+            # Set file path to the yml file
+            structure_validator.file_path = yml_path
+            script_validator = ScriptValidator(structure_validator)
+
+            if not script_validator.is_valid_file(validate_rn=not file_type):
+                is_valid = False
+
+        elif re.match(BETA_INTEGRATION_REGEX, file_path, re.IGNORECASE) or \
+                re.match(BETA_INTEGRATION_YML_REGEX, file_path, re.IGNORECASE):
+            description_validator = DescriptionValidator(file_path)
+            if not description_validator.is_valid_beta_description():
+                is_valid = False
+
+            integration_validator = IntegrationValidator(structure_validator)
+            if not integration_validator.is_valid_beta_integration():
+                is_valid = False
+
+        elif re.match(IMAGE_REGEX, file_path, re.IGNORECASE):
+            image_validator = ImageValidator(file_path)
+            if not image_validator.is_valid():
+                is_valid = False
+
+        # incident fields and indicator fields are using the same scheme.
+        elif checked_type(file_path, JSON_INDICATOR_AND_INCIDENT_FIELDS) or \
+                file_type in ('incidentfield', 'indicatorfield'):
+            incident_field_validator = IncidentFieldValidator(structure_validator)
+            if not incident_field_validator.is_valid_file(validate_rn=not file_type):
+                is_valid = False
+
+        elif checked_type(file_path, [REPUTATION_REGEX]) or file_type == 'reputation':
+            reputation_validator = ReputationValidator(structure_validator)
+            if not reputation_validator.is_valid_file(validate_rn=not file_type):
+                is_valid = False
+
+        elif checked_type(file_path, JSON_ALL_LAYOUT_REGEXES) or file_type == 'layout':
+            layout_validator = LayoutValidator(structure_validator)
+            if not layout_validator.is_valid_layout(validate_rn=not file_type):
+                is_valid = False
+
+        elif checked_type(file_path, JSON_ALL_DASHBOARDS_REGEXES) or file_type == 'dashboard':
+            dashboard_validator = DashboardValidator(structure_validator)
+            if not dashboard_validator.is_valid_dashboard(validate_rn=not file_type):
+                is_valid = False
+
+        elif checked_type(file_path, JSON_ALL_INCIDENT_TYPES_REGEXES):
+            incident_type_validator = IncidentTypeValidator(structure_validator)
+            if not incident_type_validator.is_valid_incident_type(validate_rn=not file_type):
+                is_valid = False
+
+        elif 'CHANGELOG' in file_path:
+            if not self.is_valid_release_notes(file_path):
+                is_valid = False
+
+        elif checked_type(file_path, CHECKED_TYPES_REGEXES):
+            pass
+
+        else:
+            print_error("The file type of {} is not supported in validate command".format(file_path))
+            print_error("validate command supports: Integrations, Scripts, Playbooks, "
+                        "Incident fields, Indicator fields, Images, Release notes, Layouts and Descriptions")
+            is_valid = False
+
+        return is_valid
 
     def validate_no_old_format(self, old_format_files):
         """ Validate there are no files in the old format(unified yml file for the code and configuration).
@@ -546,58 +698,183 @@ class FilesValidator:
 
     def validate_all_files(self):
         """Validate all files in the repo are in the right format."""
+        # the directories are listed from an inventory of the repository, which scans it once
+        inventory = get_content_inventory()
         # go over packs
-        for root, dirs, _ in os.walk(PACKS_DIR):
+        package_file_paths = []
+        for root, dirs, _ in inventory.walk(PACKS_DIR):
             for dir_in_dirs in dirs:
                 for directory in PACKS_DIRECTORIES:
-                    for inner_root, inner_dirs, files in os.walk(os.path.join(root, dir_in_dirs, directory)):
+                    for inner_root, inner_dirs, files in inventory.walk(os.path.join(root, dir_in_dirs, directory)):
                         for inner_dir in inner_dirs:
                             if inner_dir.startswith('.'):
                                 continue
 
                             project_dir = os.path.join(inner_root, inner_dir)
-                            _, file_path = get_yml_paths_in_dir(os.path.normpath(project_dir),
-                                                                Errors.no_yml_file(project_dir))
+                            _, file_path = inventory.get_yml_paths_in_dir(os.path.normpath(project_dir),
+                                                                          Errors.no_yml_file(project_dir))
                             if file_path:
                                 # check if the file_path is part of test_data yml
                                 if any(test_file in file_path.lower() for test_file in TESTS_DIRECTORIES):
                                     continue
-                                print("Validating {}".format(file_path))
-                                structure_validator = StructureValidator(file_path)
-                                if not structure_validator.is_valid_scheme():
-                                    self._is_valid = False
+                                package_file_paths.append((file_path, file_path))
+
+        if not self.run_file_validations('validate_scheme', package_file_paths):
+            self._is_valid = False
 
         # go over regular content entities
         for directory in DIR_LIST_FOR_REGULAR_ENTETIES:
             print_color('Validating {} directory:'.format(directory), LOG_COLORS.GREEN)
-            for root, dirs, files in os.walk(directory):
+            file_paths = []
+            for root, dirs, files in inventory.walk(directory):
                 for file_name in files:
                     file_path = os.path.join(root, file_name)
                     # skipping hidden files
                     if not file_name.endswith('.yml'):
                         continue
-                    print('Validating ' + file_name)
-                    structure_validator = StructureValidator(file_path)
-                    if not structure_validator.is_valid_scheme():
-                        self._is_valid = False
+                    file_paths.append((file_path, file_name))
+
+            if not self.run_file_validations('validate_scheme', file_paths):
+                self._is_valid = False
 
         # go over regular PACKAGE_SUPPORTING_DIRECTORIES entities
+        package_file_paths = []
         for directory in PACKAGE_SUPPORTING_DIRECTORIES:
-            for root, dirs, files in os.walk(directory):
+            for root, dirs, files in inventory.walk(directory):
                 for inner_dir in dirs:
                     if inner_dir.startswith('.'):
                         continue
 
                     project_dir = os.path.join(root, inner_dir)
-                    _, file_path = get_yml_paths_in_dir(project_dir, Errors.no_yml_file(project_dir))
+                    _, file_path = inventory.get_yml_paths_in_dir(project_dir, Errors.no_yml_file(project_dir))
                     if file_path:
                         # check if the file_path is part of test_data yml
                         if any(test_file in file_path.lower() for test_file in TESTS_DIRECTORIES):
                             continue
-                        print('Validating ' + file_path)
-                        structure_validator = StructureValidator(file_path)
-                        if not structure_validator.is_valid_scheme():
-                            self._is_valid = False
+                        package_file_paths.append((file_path, file_path))
+
+        if not self.run_file_validations('validate_scheme', package_file_paths):
+            self._is_valid = False
+
+    @staticmethod
+    def validate_scheme(file_path, display_name):
+        """Validate the scheme of a single file.
+
+        Args:
+            file_path (str): The path of the file.
+            display_name (str): The name of the file to print.
+
+        Returns:
+            bool. Whether the file is valid or not.
+        """
+        print('Validating {}'.format(display_name))
+        structure_validator = StructureValidator(file_path)
+        return structure_validator.is_valid_scheme()
+
+    def get_validation_cache_key(self, validation, args):
+        """Get the key of a per file validation, a hash of everything the validation of the file depends on.
+
+        Args:
+            validation (str): The name of the validation method.
+            args (tuple): The arguments of the validation, the first one is the validated file path.
+
+        Returns:
+            str. The key of the validation, None in case its result can not be kept.
+        """
+        file_path = args[0]
+        if isinstance(file_path, tuple):
+            _, file_path = file_path
+
+        key_parts = [get_sdk_version(), get_schemas_hash(), self.branch_name, self.prev_ver, self.is_backward_check,
+                     self.validate_id_set, get_files_hash(get_validated_file_paths(file_path)),
+                     get_shared_file_hash(ConfJsonValidator.CONF_PATH)]
+        if self.validate_id_set:
+            key_parts.append(get_shared_file_hash(IDSetValidator.ID_SET_PATH))
+        if self.is_docker_image_validated(file_path):
+            # the latest docker image tag may change at any time, the pass is kept for the time a resolved tag is kept
+            docker_tags_ttl = get_docker_tags_ttl()
+            if docker_tags_ttl <= 0:
+                return None
+            key_parts.append(int(time.time() // docker_tags_ttl))
+        if validation == 'validate_modified_file' or (validation == 'validate_added_file' and not args[1]):
+            # the release notes of the file are not required on a release branch, by the diff of the circleci config
+            key_parts.append(BaseValidator.is_release_branch())
+        if 'CHANGELOG' in file_path:
+            # the release notes are validated by their diff against origin/master
+            key_parts.append(get_git_context().get_path_diff(file_path, 'origin/master', unified=100))
+        if validation == 'validate_modified_file' and self.is_backward_check:
+            # the old version of the file, which the backward compatibility checks compare against
+            old_file_path = next(iter(self.get_old_file_paths([args[0]])), None)
+            if old_file_path:
+                key_parts.append(json.dumps(get_remote_files_reader().get_file(old_file_path),
+                                            sort_keys=True, default=str))
+
+        return hashlib.sha1(json.dumps(key_parts).encode('utf-8')).hexdigest()
+
+    def run_file_validations(self, validation, validation_args):
+        """Run a per file validation method of the validator on each of the given arguments.
+
+        With a single job the files are validated one after the other. With more jobs the files are validated by a
+        pool of processes, the output of each file is buffered and printed once all the files before it are done, so
+        the output is printed in the same order as in a sequential run.
+
+        When using the validation cache, files which already passed the validation with the same key are skipped, the
+        files without a key are always validated.
+
+        Args:
+            validation (str): The name of the validation method, which returns whether the file is valid.
+            validation_args (list): The arguments tuple of each validated file.
+
+        Returns:
+            bool. Whether all the files are valid or not.
+        """
+        validation_args = list(validation_args)
+        cache_keys = {}
+        if self.validation_cache is not None:
+            cache_keys = {args: self.get_validation_cache_key(validation, args) for args in validation_args}
+            validation_args = [args for args in validation_args if cache_keys[args] is None or
+                               not self.validation_cache.is_passed(ValidationCache.get_task_id(validation, args),
+                                                                   cache_keys[args])]
+
+        if validation in ('validate_modified_file', 'validate_added_file'):
+            self.prefetch_docker_image_tags([args[0] for args in validation_args])
+
+        is_valid = True
+        for file_is_valid, args in zip(self.iter_file_validations(validation, validation_args), validation_args):
+            if not file_is_valid:
+                is_valid = False
+            if self.validation_cache is not None and cache_keys[args] is not None:
+                self.validation_cache.set_result(ValidationCache.get_task_id(validation, args), cache_keys[args],
+                                                 file_is_valid)
+
+        return is_valid
+
+    def iter_file_validations(self, validation, validation_args):
+        """Validate the files one after the other or by a pool of processes, yielding whether each file is valid"""
+        if self.jobs <= 1 or len(validation_args) <= 1:
+            for args in validation_args:
+                yield self.run_file_validation(validation, args)
+            return
+
+        # flush the output printed so far, so it is not mixed with the output of the workers
+        sys.stdout.flush()
+        with Pool(processes=min(self.jobs, len(validation_args)), initializer=init_validation_worker,
+                  initargs=(self,)) as pool:
+            for file_is_valid, output, profile_records in pool.imap(run_validation_in_worker,
+                                                                    [(validation, args) for args in validation_args]):
+                sys.stdout.write(output)
+                sys.stdout.flush()
+                if profile_records:
+                    self.profiler.merge_records(profile_records)
+                yield file_is_valid
+
+    def run_file_validation(self, validation, args):
+        """Run a per file validation method, profiled under the file type of the file when profiling"""
+        if self.profiler is None:
+            return getattr(self, validation)(*args)
+
+        with self.profiler.measure(f'FilesValidator.{validation}', get_profiled_file_type(args[0])):
+            return getattr(self, validation)(*args)
 
     def is_valid_structure(self):
         """Check if the structure is valid for the case we are in, master - all files, branch - changed files.
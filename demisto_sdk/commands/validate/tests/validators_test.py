@@ -1,3 +1,4 @@
+import json
 import os
 from shutil import copyfile
 from typing import Any, Type
@@ -30,6 +31,7 @@ from demisto_sdk.tests.constants_test import VALID_LAYOUT_PATH, INVALID_LAYOUT_P
     INVALID_INTEGRATION_ID_PATH, INVALID_PLAYBOOK_PATH_FROM_ROOT, VALID_NO_HIDDEN_PARAMS, INVALID_NO_HIDDEN_PARAMS
 
 from demisto_sdk.commands.common.hook_validations.widget import WidgetValidator
+from demisto_sdk.commands.validate.file_validator import FilesValidator
 
 
 class TestValidators:
@@ -245,3 +247,153 @@ class TestValidators:
         structure = StructureValidator(source)
         validator = IntegrationValidator(structure)
         assert validator.is_all_params_not_hidden() is answer
+
+
+def test_parallel_validation_output_matches_sequential(capsys):
+    """
+    Given
+        - Valid and invalid added files
+    When
+        - Validating them sequentially and with a pool of processes
+    Then
+        - The validation result and the printed output are identical, in the order of the given files
+    """
+    files = [VALID_LAYOUT_PATH, INVALID_LAYOUT_PATH, INVALID_PLAYBOOK_PATH, VALID_LAYOUT_PATH]
+    results = []
+    for jobs in (1, 3):
+        validator = FilesValidator(validate_conf_json=False, jobs=jobs)
+        validator.validate_added_files(files)
+        results.append((validator._is_valid, capsys.readouterr().out))
+
+    assert results[0] == results[1]
+    assert results[0][0] is False
+    validated_files = [line.split(' ', 1)[1] for line in results[0][1].splitlines() if line.startswith('Validating ')]
+    assert validated_files == files
+
+
+def test_validation_cache(tmp_path, monkeypatch, capsys):
+    """
+    Given
+        - A valid and an invalid file, validated with the validation cache
+    When
+        - Validating them again, before and after changing the valid file
+    Then
+        - Only the invalid file is validated again, until the valid file is changed
+    """
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path / 'cache'))
+    valid_path = str(tmp_path / 'layout-valid.json')
+    invalid_path = str(tmp_path / 'layout-invalid.json')
+    copyfile(VALID_LAYOUT_PATH, valid_path)
+    copyfile(INVALID_LAYOUT_PATH, invalid_path)
+
+    def validate():
+        validator = FilesValidator(validate_conf_json=False, use_cache=True)
+        validator.validate_added_files([valid_path, invalid_path], file_type='layout')
+        validator.validation_cache.save()
+        output = capsys.readouterr().out
+        validated_files = [line.split(' ', 1)[1] for line in output.splitlines() if line.startswith('Validating ')]
+        return validator._is_valid, validated_files, validator.validation_cache.hits
+
+    assert validate() == (False, [valid_path, invalid_path], 0)
+    assert validate() == (False, [invalid_path], 1)
+    with open(valid_path, 'a') as valid_file:
+        valid_file.write('\n')
+    assert validate() == (False, [valid_path, invalid_path], 0)
+
+
+def test_validation_cache_key_external_state(tmp_path, monkeypatch):
+    """
+    Given
+        - A layout and a script, validated with the validation cache
+    When
+        - Getting their cache keys after conf.json changed, over time, and while the docker tags are not kept
+    Then
+        - The keys change with conf.json, the key of the script changes once the docker tags expire, and the script
+          has no key when the docker tags are not kept
+    """
+    from demisto_sdk.commands.common.hook_validations.conf_json import ConfJsonValidator
+    from demisto_sdk.commands.validate import file_validator, validation_cache
+
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path / 'cache'))
+    conf_path = tmp_path / 'conf.json'
+    conf_path.write_text('{"tests": []}')
+    monkeypatch.setattr(ConfJsonValidator, 'CONF_PATH', str(conf_path))
+    validator = FilesValidator(validate_conf_json=False, use_cache=True, is_backward_check=False)
+
+    def get_keys():
+        validation_cache.get_shared_file_hash.cache_clear()
+        return [validator.get_validation_cache_key('validate_added_file', (file_path, file_type))
+                for file_path, file_type in ((VALID_LAYOUT_PATH, 'layout'), (VALID_SCRIPT_PATH, 'script'))]
+
+    layout_key, script_key = get_keys()
+    conf_path.write_text('{"tests": [{"playbookID": "test"}]}')
+    changed_layout_key, changed_script_key = get_keys()
+    assert changed_layout_key != layout_key and changed_script_key != script_key
+
+    monkeypatch.setenv('DEMISTO_SDK_DOCKER_TAGS_TTL', '3600')
+    now = file_validator.time.time()
+    monkeypatch.setattr(file_validator.time, 'time', lambda: now + 3600)
+    assert get_keys()[0] == changed_layout_key and get_keys()[1] != changed_script_key
+
+    monkeypatch.setenv('DEMISTO_SDK_DOCKER_TAGS_TTL', '0')
+    assert get_keys() == [changed_layout_key, None]
+
+
+def test_validation_cache_key_release_branch(tmp_path, monkeypatch):
+    """
+    Given
+        - A modified layout and an added layout without a file type, validated with the validation cache
+    When
+        - Getting their cache keys on a release branch and on a branch which is not
+    Then
+        - The keys change, since the release notes are not required on a release branch
+        - The key of an added layout of a given file type, whose release notes are not validated, does not change
+    """
+    monkeypatch.setenv('DEMISTO_SDK_CACHE_DIR', str(tmp_path / 'cache'))
+    validator = FilesValidator(validate_conf_json=False, use_cache=True, is_backward_check=False)
+
+    def get_keys(is_release_branch):
+        monkeypatch.setattr(BaseValidator, 'is_release_branch', staticmethod(lambda: is_release_branch))
+        return [validator.get_validation_cache_key(validation, args) for validation, args in
+                (('validate_modified_file', (VALID_LAYOUT_PATH,)), ('validate_added_file', (VALID_LAYOUT_PATH, None)),
+                 ('validate_added_file', (VALID_LAYOUT_PATH, 'layout')))]
+
+    modified_key, added_key, typed_key = get_keys(is_release_branch=False)
+    release_modified_key, release_added_key, release_typed_key = get_keys(is_release_branch=True)
+    assert release_modified_key != modified_key and release_added_key != added_key
+    assert release_typed_key == typed_key
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_validation_profile(tmp_path, jobs):
+    """
+    Given
+        - Layout files, validated with profiling
+    When
+        - Validating them sequentially and with a pool of processes
+    Then
+        - The checks are recorded per file type, also when run by the workers, and the check methods are patched
+          only while profiling
+    """
+    is_valid_scheme = StructureValidator.is_valid_scheme
+    profile_path = str(tmp_path / 'profile.json')
+    validator = FilesValidator(validate_conf_json=False, jobs=jobs, profile_output=profile_path)
+    assert StructureValidator.is_valid_scheme is is_valid_scheme
+    with validator.profiling():
+        assert StructureValidator.is_valid_scheme is not is_valid_scheme
+        validator.validate_added_files([VALID_LAYOUT_PATH, INVALID_LAYOUT_PATH], file_type='layout')
+    assert StructureValidator.is_valid_scheme is is_valid_scheme
+
+    records = validator.profiler.records
+    assert records[('FilesValidator.validate_added_file', 'layout')][0] == 2
+    assert records[('StructureValidator.is_valid_scheme', 'layout')][0] == 2
+    calls, total_time, self_time = records[('FilesValidator.validate_added_file', 'layout')]
+    assert 0 < self_time < total_time
+
+    validator.profiler.save(profile_path)
+    with open(profile_path) as profile_file:
+        profile = json.load(profile_file)
+    assert {'check': 'LayoutValidator.is_valid_layout', 'file_type': 'layout', 'calls': 2} in \
+        [{key: check[key] for key in ('check', 'file_type', 'calls')} for check in profile['checks']]
+    report = validator.profiler.get_report(size=3).splitlines()
+    assert len(report) == 5
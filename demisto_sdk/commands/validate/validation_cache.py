@@ -0,0 +1,128 @@
+"""A cache of the files which passed their validation, skipping them while nothing their validation reads changed.
+
+A file is skipped when the key of its validation is the key it last passed with. The key hashes everything the
+validation of the file depends on: the content of the file and of the files validated with it (its package and its
+release notes), the old version of the file the backward compatibility checks compare against, the demisto-sdk version,
+the schema files, conf.json, the id set and the validation options. The docker image check of the integrations and
+scripts depends on the latest tags in the registry, so their passes are kept for the time the resolved tags are kept.
+Only passes are kept, a failing file is validated again in every run.
+"""
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List
+
+from demisto_sdk.commands.common.constants import PACKAGE_SUPPORTING_DIRECTORIES
+from demisto_sdk.commands.common.hook_validations import structure
+from demisto_sdk.commands.common.hook_validations.structure import StructureValidator
+from demisto_sdk.commands.common.tools import get_cache_dir, get_child_files, get_release_notes_file_path
+
+
+@lru_cache(maxsize=None)
+def get_schemas_hash() -> str:
+    """Get the hash of all the schema files the structure of the content files is validated by"""
+    schemas_dir = os.path.normpath(os.path.join(os.path.dirname(structure.__file__), '..',
+                                                StructureValidator.SCHEMAS_PATH))
+    return get_files_hash(os.path.join(schemas_dir, file_name) for file_name in sorted(os.listdir(schemas_dir)))
+
+
+@lru_cache(maxsize=None)
+def get_shared_file_hash(file_path: str) -> str:
+    """Get the hash of a file read by the validation of every file, like conf.json, once per run"""
+    return get_files_hash([file_path])
+
+
+def get_files_hash(file_paths: Iterable[str]) -> str:
+    """Get a hash of the paths and the content of files, a missing file is hashed by its path only"""
+    sha1 = hashlib.sha1()
+    for file_path in file_paths:
+        sha1.update(file_path.encode('utf-8') + b'\0')
+        if os.path.isfile(file_path):
+            with open(file_path, 'rb') as file_:
+                sha1.update(hashlib.sha1(file_.read()).digest())
+        else:
+            sha1.update(b'\0')
+
+    return sha1.hexdigest()
+
+
+def get_validated_file_paths(file_path: str) -> List[str]:
+    """Get the paths of the files the validation of a file reads - the file, its release notes and its package files"""
+    file_paths = {file_path, get_release_notes_file_path(file_path)}
+    package_dir = os.path.dirname(file_path)
+    if os.path.basename(os.path.dirname(package_dir)) in PACKAGE_SUPPORTING_DIRECTORIES:
+        file_paths.update(get_child_files(package_dir))
+
+    return sorted(file_paths)
+
+
+def get_validation_cache_path() -> str:
+    """Get the path of the validation cache of the current repository, under the on disk cache directory"""
+    repo_hash = hashlib.sha1(os.path.abspath(os.curdir).encode('utf-8')).hexdigest()
+    return os.path.join(get_cache_dir('validation'), f'{repo_hash}.json')
+
+
+class ValidationCache:
+    """The keys each file passed its validations with.
+
+    Attributes:
+        cache_path (str): the path of the cache file.
+        passed (dict): validation task id -> the key of the last passing validation.
+        hits (int): the number of validations skipped in this run.
+        misses (int): the number of validations run in this run.
+    """
+    VERSION = 1
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        self.passed: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, cache_path: str) -> 'ValidationCache':
+        cache = cls(cache_path)
+        try:
+            with open(cache_path, 'r') as cache_file:
+                data = json.load(cache_file)
+            if data.get('version') == cls.VERSION:
+                cache.passed = data['passed']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+        return cache
+
+    @staticmethod
+    def get_task_id(validation: str, args: tuple) -> str:
+        return json.dumps([validation, args])
+
+    def is_passed(self, task_id: str, key: str) -> bool:
+        """Check whether the validation already passed with the same key, counting the hits and the misses"""
+        if self.passed.get(task_id) == key:
+            self.hits += 1
+            return True
+
+        self.misses += 1
+        return False
+
+    def set_result(self, task_id: str, key: str, is_valid: bool):
+        if is_valid:
+            self.passed[task_id] = key
+        else:
+            self.passed.pop(task_id, None)
+
+    def save(self):
+        # write to a temporary file and rename it, so concurrent runs never read a partially written file
+        temp_path = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            with open(temp_path, 'w') as cache_file:
+                json.dump({'version': self.VERSION, 'passed': self.passed}, cache_file)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            # the cache is an optimization only
+            pass
+
+    def get_summary(self) -> str:
+        return f'Validation cache: {self.hits} of {self.hits + self.misses} files were skipped as they passed their ' \
+               f'validation since they were last changed'
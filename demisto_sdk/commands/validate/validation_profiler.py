@@ -0,0 +1,194 @@
+"""A profiler of the validate command, timing each check per file type.
+
+While profiling, the check methods of the validator classes (their __init__ and the methods named is_*, are_*,
+validate_* and load_*) are wrapped by timers, so the validation runs as usual when not profiling. Every check call is
+recorded under the file type of the file being validated, with its total time and its self time - the total time
+minus the time of the checks it called.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from types import FunctionType
+from typing import Dict, List, Optional, Tuple
+
+from demisto_sdk.commands.common.content_inventory import FILE_TYPE_CLASSIFIER
+from demisto_sdk.commands.common.hook_validations.base_validator import BaseValidator
+from demisto_sdk.commands.common.hook_validations.conf_json import ConfJsonValidator
+from demisto_sdk.commands.common.hook_validations.description import DescriptionValidator
+from demisto_sdk.commands.common.hook_validations.docker import DockerImageValidator
+from demisto_sdk.commands.common.hook_validations.id import IDSetValidator
+from demisto_sdk.commands.common.hook_validations.image import ImageValidator
+from demisto_sdk.commands.common.hook_validations.pack_unique_files import PackUniqueFilesValidator
+from demisto_sdk.commands.common.hook_validations.readme import ReadMeValidator
+from demisto_sdk.commands.common.hook_validations.release_notes import ReleaseNotesValidator
+from demisto_sdk.commands.common.hook_validations.structure import StructureValidator
+from demisto_sdk.commands.common.tools import find_type
+
+CHECK_METHOD_PREFIXES = ('is_', 'are_', 'validate_', 'load_')
+
+DEFAULT_REPORT_SIZE = 20
+
+# the file type of the checks which do not validate a specific file, like the conf.json validation
+NO_FILE_TYPE = '-'
+
+
+def get_profiled_classes() -> list:
+    """Get the validator classes whose checks are profiled, BaseValidator and all its subclasses included"""
+    classes = [StructureValidator, IDSetValidator, ConfJsonValidator, ReadMeValidator, ImageValidator,
+               DescriptionValidator, DockerImageValidator, ReleaseNotesValidator, PackUniqueFilesValidator]
+    base_classes = [BaseValidator]
+    while base_classes:
+        base_class = base_classes.pop()
+        classes.append(base_class)
+        base_classes.extend(base_class.__subclasses__())
+
+    return classes
+
+
+def get_profiled_file_type(file_path) -> str:
+    """Get the file type a validated file is profiled under - its scheme, or the kind of the file if it has none"""
+    if isinstance(file_path, tuple):
+        _, file_path = file_path
+
+    # classified by the path, and by the content for the files outside the content directories
+    file_type = FILE_TYPE_CLASSIFIER.classify(file_path)
+    if not file_type and file_path.endswith(('.yml', '.json')) and os.path.isfile(file_path):
+        file_type = find_type(file_path)
+    if file_type:
+        return file_type
+    if 'README' in file_path:
+        return 'readme'
+    if 'CHANGELOG' in file_path:
+        return 'releasenotes'
+    return os.path.splitext(file_path)[1].lstrip('.') or NO_FILE_TYPE
+
+
+class ValidationProfiler:
+    """The time and the number of calls of each check, per file type.
+
+    Attributes:
+        records (dict): (check, file type) -> [number of calls, total time, self time], the times are in seconds.
+        start_time (float): the time profiling was enabled at, 0 if it was not.
+        total_time (float): the time spent while profiling was enabled.
+    """
+
+    def __init__(self):
+        self.records: Dict[Tuple[str, str], List[float]] = {}
+        self.start_time = 0.0
+        self.total_time = 0.0
+        self._patched_methods: List[Tuple[type, str, FunctionType]] = []
+        self._lock = threading.Lock()
+        # the stacks of the running checks and of the validated file types, per thread
+        self._local = threading.local()
+
+    def _get_stacks(self) -> Tuple[list, list]:
+        if not hasattr(self._local, 'checks'):
+            self._local.checks = []
+            self._local.file_types = []
+        return self._local.checks, self._local.file_types
+
+    def enable(self, classes: Optional[list] = None):
+        """Start profiling, wrapping the check methods of the given classes (by default all the validator classes)"""
+        for cls in get_profiled_classes() if classes is None else classes:
+            for name, method in list(vars(cls).items()):
+                if isinstance(method, FunctionType) and (name == '__init__' or name.startswith(CHECK_METHOD_PREFIXES)):
+                    self._patched_methods.append((cls, name, method))
+                    setattr(cls, name, self._wrap(f'{cls.__name__}.{name}', method))
+        self.start_time = time.perf_counter()
+
+    def disable(self):
+        """Stop profiling, restoring the check methods"""
+        for cls, name, method in reversed(self._patched_methods):
+            setattr(cls, name, method)
+        self._patched_methods = []
+        if self.start_time:
+            self.total_time += time.perf_counter() - self.start_time
+            self.start_time = 0.0
+
+    @contextmanager
+    def profiling(self, classes: Optional[list] = None):
+        """Profile the checks run in the context, restoring the check methods once it exits"""
+        self.enable(classes)
+        try:
+            yield self
+        finally:
+            self.disable()
+
+    def _wrap(self, check: str, method: FunctionType):
+        @wraps(method)
+        def timed_method(*args, **kwargs):
+            with self.measure(check):
+                return method(*args, **kwargs)
+
+        return timed_method
+
+    @contextmanager
+    def measure(self, check: str, file_type: Optional[str] = None):
+        """Record the time of a check.
+
+        Args:
+            check: the name of the check.
+            file_type: the file type of the file validated by the check and by the checks it calls, by default the
+                file type of the enclosing check.
+        """
+        checks, file_types = self._get_stacks()
+        if file_type is not None:
+            file_types.append(file_type)
+        # the time of the checks called by this check, subtracted from its self time
+        checks.append(0.0)
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            self_time = elapsed - checks.pop()
+            if checks:
+                checks[-1] += elapsed
+            key = (check, file_types[-1] if file_types else NO_FILE_TYPE)
+            if file_type is not None:
+                file_types.pop()
+            with self._lock:
+                record = self.records.setdefault(key, [0, 0.0, 0.0])
+                record[0] += 1
+                record[1] += elapsed
+                record[2] += self_time
+
+    def pop_records(self) -> list:
+        """Get the records since the last call and clear them, to pass the records of a worker to the main process"""
+        with self._lock:
+            records = [[check, file_type] + record for (check, file_type), record in self.records.items()]
+            self.records = {}
+        return records
+
+    def merge_records(self, records: list):
+        with self._lock:
+            for check, file_type, calls, total_time, self_time in records:
+                record = self.records.setdefault((check, file_type), [0, 0.0, 0.0])
+                record[0] += calls
+                record[1] += total_time
+                record[2] += self_time
+
+    def to_dict(self) -> dict:
+        checks = [{'check': check, 'file_type': file_type, 'calls': calls, 'total_time': round(total_time, 6),
+                   'self_time': round(self_time, 6)}
+                  for (check, file_type), (calls, total_time, self_time) in self.records.items()]
+        checks.sort(key=lambda check_record: check_record['self_time'], reverse=True)
+        return {'total_time': round(self.total_time, 6), 'checks': checks}
+
+    def get_report(self, size: int = DEFAULT_REPORT_SIZE) -> str:
+        """Get a report of the checks which took the most time by themselves"""
+        checks = self.to_dict()['checks']
+        lines = [f'Validation profile - the {min(size, len(checks))} slowest of {len(checks)} checks, '
+                 f'validation took {self.total_time:.2f}s:',
+                 f'{"Self (s)":>10}{"Total (s)":>11}{"Calls":>8}  {"File type":<20}Check']
+        for check_record in checks[:size]:
+            lines.append(f'{check_record["self_time"]:>10.3f}{check_record["total_time"]:>11.3f}'
+                         f'{check_record["calls"]:>8}  {check_record["file_type"]:<20}{check_record["check"]}')
+        return '\n'.join(lines)
+
+    def save(self, output_path: str):
+        with open(output_path, 'w') as output_file:
+            json.dump(self.to_dict(), output_file, indent=4)